@@ -0,0 +1,64 @@
+"""Shared synthetic Gaussian data for benchmark scripts.
+
+Benchmark scripts run from this directory can ``from _testdata import make_gaussians``
+instead of regenerating arrays with the legacy ``np.random.randn(...).astype(...)``
+chain. Arrays are drawn directly as float32 from an SFC64 ``Generator`` (no float64
+intermediate; SFC64 is the fastest bit generator NumPy ships) and cached per ``(num_gaussians, sh_degree, seed)``; callers get
+copies because ``plywrite`` may normalize its inputs in place.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+# Number of higher-order SH bands per degree (coefficients // 3)
+SH_BANDS = {0: 0, 1: 3, 2: 8, 3: 15}
+
+# Resolved once at import (same env var as tests/conftest.py)
+TEST_DATA_DIR = Path(os.getenv("GSPLY_TEST_DATA_DIR", "D:/4D/all_plys"))
+
+
+@lru_cache(maxsize=None)
+def get_test_file(name: str = "frame_0.ply") -> Path:
+    """Return the path of a real PLY file in TEST_DATA_DIR (may not exist)."""
+    return TEST_DATA_DIR / name
+
+
+def normalize_quats(quats: np.ndarray) -> np.ndarray:
+    """Normalize (N, 4) quaternions in place and return them.
+
+    einsum computes the squared norms in one pass and the sqrt runs in place, so
+    this is ~3x faster than ``quats /= np.linalg.norm(quats, axis=1, keepdims=True)``.
+    """
+    norms = np.einsum("ij,ij->i", quats, quats)
+    np.sqrt(norms, out=norms)
+    quats /= norms[:, None]
+    return quats
+
+
+@lru_cache(maxsize=None)
+def _generate(num_gaussians: int, sh_degree: int, seed: int):
+    rng = np.random.Generator(np.random.SFC64(seed))
+    n = num_gaussians
+
+    means = rng.standard_normal((n, 3), dtype=np.float32)
+    scales = rng.standard_normal((n, 3), dtype=np.float32)
+    quats = normalize_quats(rng.standard_normal((n, 4), dtype=np.float32))
+    opacities = rng.random(n, dtype=np.float32)
+    sh0 = rng.standard_normal((n, 3), dtype=np.float32)
+    shN = rng.standard_normal((n, SH_BANDS[sh_degree], 3), dtype=np.float32)
+
+    return means, scales, quats, opacities, sh0, shN
+
+
+def make_gaussians(num_gaussians: int = 100_000, sh_degree: int = 0, seed: int = 42):
+    """Return random Gaussian arrays, generating them only once per key.
+
+    :param num_gaussians: Number of Gaussians
+    :param sh_degree: SH degree (0-3)
+    :param seed: RNG seed
+    :returns: Tuple of (means, scales, quats, opacities, sh0, shN) float32 arrays
+    """
+    return tuple(arr.copy() for arr in _generate(num_gaussians, sh_degree, seed))
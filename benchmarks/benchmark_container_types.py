@@ -1,9 +1,10 @@
 """Benchmark comparison of different container types for GSData.
 
 Compares:
-1. Current implementation (regular dataclass)
+1. Regular dataclass (GSData layout before slots=True)
 2. Frozen dataclass
-3. NamedTuple
+3. gsply.GSData itself (slotted dataclass, no per-instance __dict__)
+4. NamedTuple
 
 Tests both creation time and attribute access performance.
 """
@@ -14,13 +15,16 @@ from typing import NamedTuple
 
 import numpy as np
 
+from gsply import GSData
+from gsply.gsdata import DataFormat, _create_format_dict
+
 # =============================================================================
 # Container Definitions
 # =============================================================================
 
 @dataclass
 class GSDataRegular:
-    """Regular dataclass (current implementation)."""
+    """Regular dataclass (GSData before slots=True)."""
     means: np.ndarray
     scales: np.ndarray
     quats: np.ndarray
@@ -42,6 +46,22 @@ class GSDataFrozen:
     base: np.ndarray
 
 
+# Format passed explicitly so creation timings skip GSData's value-based detection
+_PLY_FORMAT = _create_format_dict(
+    scales=DataFormat.SCALES_PLY,
+    opacities=DataFormat.OPACITIES_PLY,
+    sh0=DataFormat.SH0_SH,
+    sh_order=DataFormat.SH_ORDER_3,
+    means=DataFormat.MEANS_RAW,
+    quats=DataFormat.QUATS_RAW,
+)
+
+
+def make_gsdata(means, scales, quats, opacities, sh0, shN, base):  # noqa: N803
+    """Build the real gsply.GSData with the same positional signature as the others."""
+    return GSData(means, scales, quats, opacities, sh0, shN, _format=_PLY_FORMAT, _base=base)
+
+
 class GSDataNamedTuple(NamedTuple):
     """NamedTuple implementation."""
     means: np.ndarray
@@ -132,8 +152,11 @@ def measure_memory_size(container_class, data):
     means, scales, quats, opacities, sh0, shN, base = data  # noqa: N806
     obj = container_class(means, scales, quats, opacities, sh0, shN, base)
 
-    # Size of container object itself (not the arrays)
+    # Size of container object itself (not the arrays), including its __dict__
+    # when the class has one
     container_size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        container_size += sys.getsizeof(obj.__dict__)
 
     # Size of arrays
     array_sizes = sum([
@@ -166,8 +189,9 @@ def main():
     print()
 
     containers = [
-        ("Regular Dataclass (current)", GSDataRegular),
+        ("Regular Dataclass", GSDataRegular),
         ("Frozen Dataclass", GSDataFrozen),
+        ("gsply.GSData (slots)", make_gsdata),
         ("NamedTuple", GSDataNamedTuple),
     ]
 
@@ -260,8 +284,9 @@ def main():
     print()
 
     print("Trade-offs:")
-    print("  - Regular Dataclass: Mutable, good balance, current implementation")
+    print("  - Regular Dataclass: Mutable, per-instance __dict__")
     print("  - Frozen Dataclass: Immutable (safer), similar performance")
+    print("  - gsply.GSData: Mutable (in-place normalize/masks), slotted; creation adds __post_init__")
     print("  - NamedTuple: Immutable, supports indexing, lightest weight")
     print()
 
@@ -0,0 +1,63 @@
+"""Measure import time and first-call JIT latency of the Numba kernels.
+
+Each measurement runs in a fresh interpreter, once with an empty Numba cache
+directory (cold: full LLVM compile) and once with the populated cache (warm: the
+cost every later process pays to load cached machine code). This is the number
+an ahead-of-time compiled kernel build would have to beat.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+# Runs in the child interpreter; prints one JSON line of timings (ms)
+CHILD = r"""
+import json, time
+t0 = time.perf_counter()
+import numpy as np
+import gsply
+from gsply.utils import logit, sigmoid
+t1 = time.perf_counter()
+x = np.full(1024, 0.25, dtype=np.float32)
+sigmoid(x)
+t2 = time.perf_counter()
+logit(x)
+t3 = time.perf_counter()
+sigmoid(x)
+t4 = time.perf_counter()
+print(json.dumps({
+    "import": (t1 - t0) * 1e3,
+    "sigmoid first call": (t2 - t1) * 1e3,
+    "logit first call": (t3 - t2) * 1e3,
+    "sigmoid second call": (t4 - t3) * 1e3,
+}))
+"""
+
+
+def run_child(cache_dir):
+    """Run CHILD with NUMBA_CACHE_DIR=cache_dir and return its timings."""
+    env = {**os.environ, "NUMBA_CACHE_DIR": cache_dir}
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD], env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    """Print cold- and warm-cache startup timings."""
+    with tempfile.TemporaryDirectory(prefix="gsply_numba_cache_") as cache_dir:
+        cold = run_child(cache_dir)
+        warm = run_child(cache_dir)
+
+    print("=" * 60)
+    print("Numba kernel startup (fresh interpreter)")
+    print("=" * 60)
+    print(f"  {'phase':<22} {'cold cache ms':>15} {'warm cache ms':>15}")
+    for phase in cold:
+        print(f"  {phase:<22} {cold[phase]:>15.1f} {warm[phase]:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
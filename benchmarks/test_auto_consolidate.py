@@ -4,26 +4,17 @@ import tempfile
 import time
 from pathlib import Path
 
-import numpy as np
-
 import gsply
+from _testdata import make_gaussians
 from gsply.gsdata import GSData
 
 print("=" * 80)
 print("AUTO-CONSOLIDATION TEST")
 print("=" * 80)
 
-# Generate test data
-np.random.seed(42)
+# Generate test data (shared, cached generator)
 num_gaussians = 100_000
-
-means = np.random.randn(num_gaussians, 3).astype(np.float32)
-scales = np.random.randn(num_gaussians, 3).astype(np.float32)
-quats = np.random.randn(num_gaussians, 4).astype(np.float32)
-quats = quats / np.linalg.norm(quats, axis=1, keepdims=True)
-opacities = np.random.rand(num_gaussians).astype(np.float32)
-sh0 = np.random.randn(num_gaussians, 3).astype(np.float32)
-shN = np.empty((num_gaussians, 0, 3), dtype=np.float32)
+means, scales, quats, opacities, sh0, shN = make_gaussians(num_gaussians, sh_degree=0)
 
 # Test 1: GSData without _base (should auto-consolidate)
 print("\n[Test 1] GSData without _base (should auto-consolidate)")
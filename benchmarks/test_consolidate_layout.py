@@ -6,26 +6,14 @@ from pathlib import Path
 import numpy as np
 
 import gsply
+from _testdata import make_gaussians
 from gsply.gsdata import GSData
 
-# Generate synthetic data
-np.random.seed(42)
+# Generate synthetic data (shared, cached generator)
 num_gaussians = 1000
 sh_degree = 3
 
-means = np.random.randn(num_gaussians, 3).astype(np.float32)
-scales = np.random.randn(num_gaussians, 3).astype(np.float32)
-quats = np.random.randn(num_gaussians, 4).astype(np.float32)
-quats = quats / np.linalg.norm(quats, axis=1, keepdims=True)
-opacities = np.random.rand(num_gaussians).astype(np.float32)
-sh0 = np.random.randn(num_gaussians, 3).astype(np.float32)
-
-if sh_degree > 0:
-    sh_coeffs = [0, 9, 24, 45]
-    num_coeffs = sh_coeffs[sh_degree]
-    shN = np.random.randn(num_gaussians, num_coeffs // 3, 3).astype(np.float32)
-else:
-    shN = np.empty((num_gaussians, 0, 3), dtype=np.float32)
+means, scales, quats, opacities, sh0, shN = make_gaussians(num_gaussians, sh_degree)
 
 # Create GSData without _base
 data_no_base = GSData(
@@ -1,20 +1,29 @@
-"""Test zero-copy detection with updated logic."""
+"""Test zero-copy detection with updated logic.
+
+The writer no longer walks ``arr.base`` chains per call; zero-copy eligibility is a
+single ``data._base is not None`` check on GSData (see write_uncompressed).
+"""
+
+import timeit
 
 import gsply
-from gsply.writer import _can_use_zero_copy_write
+from _testdata import get_test_file
 
 # Read real file
-data = gsply.plyread("D:/4D/all_plys/frame_0.ply")
+data = gsply.plyread(get_test_file())
 
 print("Testing zero-copy detection...")
-means, scales, quats, opacities, sh0, shN = data.unpack()
 
-can_zero_copy, base = _can_use_zero_copy_write(means, scales, quats, opacities, sh0, shN)
+can_zero_copy = data._base is not None
 
 print(f"Can use zero-copy: {can_zero_copy}")
-if base is not None:
-    print(f"Base shape: {base.shape}")
-    print(f"Base dtype: {base.dtype}")
-    print(f"Base is data._base: {base is data._base}")
+if can_zero_copy:
+    print(f"Base shape: {data._base.shape}")
+    print(f"Base dtype: {data._base.dtype}")
 else:
     print("No base array found")
+
+# Detection cost per plywrite call
+n_calls = 1_000_000
+elapsed = timeit.timeit(lambda: data._base is not None, number=n_calls)
+print(f"Detection cost: {elapsed / n_calls * 1e9:.1f} ns/call")
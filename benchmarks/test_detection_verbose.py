@@ -2,9 +2,10 @@
 
 import numpy as np
 import gsply
+from _testdata import get_test_file
 
 # Read real file
-data = gsply.plyread("D:/4D/all_plys/frame_0.ply")
+data = gsply.plyread(get_test_file())
 
 print("Testing zero-copy detection (verbose)...")
 means, scales, quats, opacities, sh0, shN = data.unpack()
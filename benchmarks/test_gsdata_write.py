@@ -5,13 +5,14 @@ import time
 from pathlib import Path
 
 import gsply
+from _testdata import get_test_file
 
 # Read real file (creates GSData with _base)
 print("=" * 80)
 print("TEST: GSData Write API with Zero-Copy")
 print("=" * 80)
 
-data = gsply.plyread("D:/4D/all_plys/frame_0.ply")
+data = gsply.plyread(get_test_file())
 print(f"\n[1] Loaded {len(data):,} Gaussians")
 print(f"    Has _base: {data._base is not None}")
 if data._base is not None:
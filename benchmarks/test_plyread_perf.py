@@ -0,0 +1,80 @@
+"""pytest-benchmark suite for plyread and GSData field access.
+
+Replaces the hand-rolled timer loops of the read-performance scripts with
+pytest-benchmark's calibrated timer and warmup. Test files are generated once per
+session for each (n_gaussians, sh_degree, compressed) configuration.
+
+Run (not collected by the default ``tests/`` testpath):
+    pytest benchmarks/test_plyread_perf.py --benchmark-json=results.json
+"""
+
+from operator import attrgetter
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from _testdata import normalize_quats  # noqa: E402
+from gsply import plyread, plywrite  # noqa: E402
+
+SH_BANDS = {0: 0, 1: 3, 2: 8, 3: 15}
+
+CONFIGS = [
+    (10_000, 0, False),
+    (100_000, 3, False),
+    (100_000, 3, True),
+    (1_000_000, 3, False),
+]
+
+
+@pytest.fixture(
+    scope="session",
+    params=CONFIGS,
+    ids=[f"{n // 1000}k-sh{sh}-{'compressed' if c else 'uncompressed'}" for n, sh, c in CONFIGS],
+)
+def ply_file(request, tmp_path_factory):
+    """Write one synthetic PLY per configuration for the whole session."""
+    n_gaussians, sh_degree, compressed = request.param
+    rng = np.random.default_rng(42)
+
+    quats = rng.standard_normal((n_gaussians, 4), dtype=np.float32)
+    normalize_quats(quats)
+
+    suffix = ".compressed.ply" if compressed else ".ply"
+    path = tmp_path_factory.mktemp("plyread_perf") / f"bench{suffix}"
+    plywrite(
+        path,
+        rng.standard_normal((n_gaussians, 3), dtype=np.float32),
+        rng.random((n_gaussians, 3), dtype=np.float32) * 0.1,
+        quats,
+        rng.random(n_gaussians, dtype=np.float32),
+        rng.random((n_gaussians, 3), dtype=np.float32),
+        rng.random((n_gaussians, SH_BANDS[sh_degree], 3), dtype=np.float32),
+        compressed=compressed,
+    )
+    return path
+
+
+@pytest.mark.benchmark(group="read")
+def test_read(benchmark, ply_file):
+    """Full plyread (header parse + payload read + view construction)."""
+    data = benchmark(plyread, ply_file)
+    assert len(data) > 0
+
+
+@pytest.mark.benchmark(group="unpack")
+def test_unpack(benchmark, ply_file):
+    """GSData.unpack() on an already-loaded file."""
+    data = plyread(ply_file)
+    fields = benchmark(data.unpack)
+    assert len(fields) == 6
+
+
+@pytest.mark.benchmark(group="attribute-access")
+def test_attribute_access(benchmark, ply_file):
+    """Fetching all six fields from a loaded GSData."""
+    data = plyread(ply_file)
+    get_fields = attrgetter("means", "scales", "quats", "opacities", "sh0", "shN")
+    fields = benchmark(get_fields, data)
+    assert np.shares_memory(fields[0], data.means)
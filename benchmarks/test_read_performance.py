@@ -1,52 +1,88 @@
 """Test real-world read performance with the new dataclass implementation."""
 
+import functools
+import os
 import tempfile
 import time
+from operator import attrgetter
 from pathlib import Path
+from timeit import Timer
 
 import numpy as np
 
+from _testdata import normalize_quats
 from gsply import plyread, plywrite
 
+# Fetch all six fields in one C-level call (isolates interpreter dispatch overhead)
+get_fields = attrgetter("means", "scales", "quats", "opacities", "sh0", "shN")
 
+
+@functools.lru_cache(maxsize=None)
 def create_test_file(n_gaussians=100000, sh_degree=3):
-    """Create a test PLY file."""
-    # Create test data
-    np.random.seed(42)
-    means = np.random.randn(n_gaussians, 3).astype(np.float32)
-    scales = np.random.rand(n_gaussians, 3).astype(np.float32) * 0.1
-    quats = np.random.randn(n_gaussians, 4).astype(np.float32)
-    quats = quats / np.linalg.norm(quats, axis=1, keepdims=True)
-    opacities = np.random.rand(n_gaussians).astype(np.float32)
-    sh0 = np.random.rand(n_gaussians, 3).astype(np.float32)
+    """Create a test PLY file, reusing it across runs.
+
+    The file is cached under the system temp directory keyed on
+    (n_gaussians, sh_degree) and only regenerated when missing or empty.
+    """
+    temp_path = Path(tempfile.gettempdir()) / f"gsply_bench_{n_gaussians}_{sh_degree}.ply"
+    if temp_path.exists() and temp_path.stat().st_size > 0:
+        return temp_path
+
+    # Create test data (float32 straight from PCG64, no float64 intermediate)
+    rng = np.random.default_rng(42)
+    means = rng.standard_normal((n_gaussians, 3), dtype=np.float32)
+    scales = rng.random((n_gaussians, 3), dtype=np.float32) * 0.1
+    quats = rng.standard_normal((n_gaussians, 4), dtype=np.float32)
+    normalize_quats(quats)
+    opacities = rng.random(n_gaussians, dtype=np.float32)
+    sh0 = rng.random((n_gaussians, 3), dtype=np.float32)
 
     if sh_degree > 0:
         n_sh_coeffs = {1: 9, 2: 24, 3: 45}[sh_degree]
         # Note: plywrite expects shN in shape (N, K, 3) or (N, K*3)
-        shN = np.random.rand(n_gaussians, n_sh_coeffs, 3).astype(np.float32)  # noqa: N806
+        shN = rng.random((n_gaussians, n_sh_coeffs // 3, 3), dtype=np.float32)  # noqa: N806
     else:
         shN = None  # noqa: N806
 
-    # Create temporary file
-    temp_file = tempfile.NamedTemporaryFile(suffix='.ply', delete=False)
-    temp_path = Path(temp_file.name)
-    temp_file.close()
-
     # Write the file (shN can be None or shape (N, K, 3))
     plywrite(temp_path, means, scales, quats, opacities, sh0, shN, compressed=False)
 
     return temp_path
 
 
-def benchmark_read_performance(file_path, n_iterations=100):
-    """Benchmark read performance."""
-    times = []
+def drop_caches(file_path):
+    """Evict a file from the OS page cache so the next read hits the disk.
+
+    Uses posix_fadvise(POSIX_FADV_DONTNEED) where available (Linux). On other
+    platforms this is a no-op and cold-cache numbers equal warm-cache numbers.
+
+    :returns: True if the cache was dropped
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+def benchmark_read_performance(file_path, n_iterations=100, drop_cache=False):
+    """Benchmark read performance.
+
+    :param drop_cache: Evict the file from the page cache before every read
+        (cold-cache I/O + decode) instead of re-reading from memory
+    Returns an int64 array of per-iteration read times in nanoseconds.
+    """
+    times = np.empty(n_iterations, dtype=np.int64)
 
     for i in range(n_iterations):
-        start = time.perf_counter()
+        if drop_cache:
+            drop_caches(file_path)
+        start = time.perf_counter_ns()
         data = plyread(file_path)
-        end = time.perf_counter()
-        times.append(end - start)
+        times[i] = time.perf_counter_ns() - start
 
         # Verify data loaded correctly
         if i == 0:
@@ -56,43 +92,51 @@ def benchmark_read_performance(file_path, n_iterations=100):
     return times
 
 
-def test_unpack_performance(file_path, n_iterations=1000):
-    """Test unpack() performance."""
-    # Read once
-    data = plyread(file_path)
+def _time_statement(stmt, namespace, repeat=5):
+    """Time a tiny statement with timeit's compiled loop.
 
-    # Benchmark unpacking
-    start = time.perf_counter()
-    for _ in range(n_iterations):
-        means, scales, quats, opacities, sh0, shN = data.unpack()  # noqa: N806
-    end = time.perf_counter()
+    autorange() picks a loop count that runs for at least 0.2 s; the best of
+    ``repeat`` further trials filters scheduler jitter.
 
-    total_time = end - start
-    avg_time = total_time / n_iterations
+    :returns: (avg_ns, best_ns) per execution of ``stmt``
+    """
+    timer = Timer(stmt, globals=namespace)
+    number, total = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return total / number * 1e9, best / number * 1e9
 
-    return total_time, avg_time
 
+def test_unpack_performance(file_path):
+    """Test unpack() performance.
 
-def test_attribute_access_performance(file_path, n_iterations=10000):
-    """Test attribute access performance."""
+    Returns (avg_ns, best_ns) per unpack() call.
+    """
     # Read once
     data = plyread(file_path)
 
-    # Benchmark attribute access
-    start = time.perf_counter()
-    for _ in range(n_iterations):
-        _ = data.means
-        _ = data.scales
-        _ = data.quats
-        _ = data.opacities
-        _ = data.sh0
-        _ = data.shN
-    end = time.perf_counter()
+    return _time_statement("data.unpack()", {"data": data})
+
+
+def test_attribute_access_performance(file_path):
+    """Test attribute access performance.
+
+    Returns (avg_ns, best_ns) for six plain attribute loads and for a single
+    attrgetter call fetching the same six fields. The difference is interpreter
+    dispatch overhead, not attribute cost; enabling __slots__ on GSData would
+    reduce the remaining LOAD_ATTR cost further.
+    """
+    # Read once
+    data = plyread(file_path)
+    namespace = {"data": data, "get_fields": get_fields}
 
-    total_time = end - start
-    avg_time = total_time / n_iterations
+    # One bytecode LOAD_ATTR per field
+    plain = _time_statement(
+        "data.means; data.scales; data.quats; data.opacities; data.sh0; data.shN", namespace
+    )
+    # One C call per iteration
+    getter = _time_statement("get_fields(data)", namespace)
 
-    return total_time, avg_time
+    return plain, getter
 
 
 def test_mutability(file_path):
@@ -126,32 +170,35 @@ def main():
     print("-" * 80)
     print("TEST 1: Read Performance (100K Gaussians, SH3)")
     print("-" * 80)
-    times_100k = benchmark_read_performance(file_100k, n_iterations=20)
-    avg_time = np.mean(times_100k)
-    std_time = np.std(times_100k)
-
-    print(f"  Average read time: {avg_time*1000:.2f} ms")
-    print(f"  Std deviation: {std_time*1000:.2f} ms")
-    print(f"  Min/Max: {min(times_100k)*1000:.2f} / {max(times_100k)*1000:.2f} ms")
-    print(f"  Throughput: {100000 / avg_time / 1e6:.1f}M Gaussians/sec")
+    for label, drop_cache in (("warm cache", False), ("cold cache", True)):
+        if drop_cache and not hasattr(os, "posix_fadvise"):
+            print("  (cold cache skipped: posix_fadvise unavailable on this platform)")
+            continue
+        print(f"  [{label}]")
+        times_100k = benchmark_read_performance(file_100k, 20, drop_cache) * 1e-6  # ms
+        avg_time = times_100k.mean()
+
+        print(f"  Average read time: {avg_time:.2f} ms")
+        print(f"  Std deviation: {times_100k.std():.2f} ms")
+        print(f"  Min/Max: {times_100k.min():.2f} / {times_100k.max():.2f} ms")
+        print(f"  Throughput: {100000 / avg_time / 1e3:.1f}M Gaussians/sec")
     print()
 
     # Test 2: Unpack performance
     print("-" * 80)
     print("TEST 2: Unpack Performance")
     print("-" * 80)
-    total_time, avg_time = test_unpack_performance(file_100k, n_iterations=10000)
-    print(f"  Total time (10K unpacks): {total_time*1000:.2f} ms")
-    print(f"  Average per unpack: {avg_time*1e9:.1f} ns")
+    avg_ns, best_ns = test_unpack_performance(file_100k)
+    print(f"  Per unpack: best {best_ns:.1f} ns (average {avg_ns:.1f} ns)")
     print()
 
     # Test 3: Attribute access performance
     print("-" * 80)
     print("TEST 3: Attribute Access Performance")
     print("-" * 80)
-    total_time, avg_time = test_attribute_access_performance(file_100k, n_iterations=100000)
-    print(f"  Total time (100K accesses): {total_time*1000:.2f} ms")
-    print(f"  Average per access: {avg_time*1e9:.1f} ns")
+    (avg_ns, best_ns), (getter_avg_ns, getter_best_ns) = test_attribute_access_performance(file_100k)
+    print(f"  Six attribute loads: best {best_ns:.1f} ns (average {avg_ns:.1f} ns)")
+    print(f"  attrgetter:          best {getter_best_ns:.1f} ns (average {getter_avg_ns:.1f} ns)")
     print()
 
     # Test 4: Mutability
@@ -165,16 +212,14 @@ def main():
     print("-" * 80)
     print("TEST 5: Small File Performance (10K Gaussians, SH0)")
     print("-" * 80)
-    times_10k = benchmark_read_performance(file_10k, n_iterations=100)
-    avg_time = np.mean(times_10k)
+    times_10k = benchmark_read_performance(file_10k, n_iterations=100) * 1e-6  # ms
+    avg_time = times_10k.mean()
 
-    print(f"  Average read time: {avg_time*1000:.2f} ms")
-    print(f"  Throughput: {10000 / avg_time / 1e6:.1f}M Gaussians/sec")
+    print(f"  Average read time: {avg_time:.2f} ms")
+    print(f"  Throughput: {10000 / avg_time / 1e3:.1f}M Gaussians/sec")
     print()
 
-    # Cleanup
-    file_100k.unlink()
-    file_10k.unlink()
+    # Test files are kept in the temp directory for reuse by later runs
 
     print("=" * 80)
     print("SUMMARY")
@@ -1,6 +1,9 @@
 """Simple test of read performance with refactored dataclass."""
 
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 
 import numpy as np
@@ -57,8 +60,11 @@ def test_with_existing_file():
     # Test that unpack() works
     means, scales, quats, opacities, sh0, shN = data.unpack()  # noqa: N806
     print("  Unpacked 6 fields successfully")
-    assert means is data.means
-    assert shN is data.shN
+    # Zero-copy invariant: no bytes copied (not Python object identity)
+    assert np.shares_memory(means, data.means)
+    assert np.shares_memory(shN, data.shN)
+    if data._base is not None:
+        assert np.shares_memory(means, data._base)
     print("  [OK] Unpack interface works correctly")
     print()
 
@@ -79,8 +85,18 @@ def test_with_existing_file():
 
     total_time = end - start
     avg_time = total_time / n_iterations
-    print(f"  {n_iterations} accesses in {total_time*1000:.2f} ms")
-    print(f"  Average per access: {avg_time*1e9:.1f} ns")
+
+    # Same six fields via one C-level attrgetter call (interpreter dispatch floor)
+    get_fields = attrgetter("means", "scales", "quats", "opacities", "sh0", "shN")
+    start = time.perf_counter()
+    for _ in range(n_iterations):
+        get_fields(data)
+    end = time.perf_counter()
+
+    total_getter = end - start
+    avg_getter = total_getter / n_iterations
+    print(f"  {n_iterations} accesses in {total_time*1000:.2f} ms (attrgetter: {total_getter*1000:.2f} ms)")
+    print(f"  Average per access: {avg_time*1e9:.1f} ns (attrgetter: {avg_getter*1e9:.1f} ns)")
     print()
 
     # Test 4: Mutability
@@ -110,6 +126,34 @@ def test_with_existing_file():
     print("  [OK] _base and masks are excluded from unpacking")
     print()
 
+    # Test 6: Multi-frame throughput (4D sequences load many frames)
+    print("TEST 6: Multi-frame Throughput (ThreadPoolExecutor)")
+    print("-" * 40)
+
+    frame_paths = [test_file] * 16
+    n_frames = len(frame_paths)
+    gaussians_per_frame = data.means.shape[0]
+
+    start = time.perf_counter()
+    for path in frame_paths:
+        plyread(path)
+    sequential_time = time.perf_counter() - start
+
+    max_workers = min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        start = time.perf_counter()
+        futures = [executor.submit(plyread, path) for path in frame_paths]
+        results = [future.result() for future in futures]
+        threaded_time = time.perf_counter() - start
+
+    assert len(results) == n_frames
+    total_gaussians = n_frames * gaussians_per_frame
+    speedup = sequential_time / threaded_time
+    print(f"  Sequential: {sequential_time*1000:.2f} ms ({total_gaussians / sequential_time / 1e6:.1f}M Gaussians/sec)")
+    print(f"  Threaded ({max_workers} workers): {threaded_time*1000:.2f} ms ({total_gaussians / threaded_time / 1e6:.1f}M Gaussians/sec)")
+    print(f"  Speedup: {speedup:.2f}x (scaling efficiency {speedup / max_workers:.0%})")
+    print()
+
     print("=" * 40)
     print("SUMMARY")
     print("=" * 40)
@@ -1,12 +1,15 @@
 """Test whether background threading helps consolidation performance."""
 
+import os
 import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tempfile
 
 import numpy as np
+from numba import njit
 
+from _testdata import make_gaussians
 from gsply import plywrite
 from gsply.gsdata import GSData
 
@@ -14,17 +17,20 @@ print("=" * 80)
 print("THREADING CONSOLIDATION TEST")
 print("=" * 80)
 
-# Generate test data
-np.random.seed(42)
+# Generate test data (float32 straight from SFC64, no float64 intermediate)
 num_gaussians = 400_000
+means, scales, quats, opacities, sh0, shN = make_gaussians(num_gaussians, sh_degree=0)
+
+# plywrite only accepts paths, so write into a RAM-backed directory (tmpfs) when
+# available: timings then cover consolidation + serialization, not disk I/O.
+_ram_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+OUTPUT_DIR = Path(tempfile.mkdtemp(prefix="gsply_threading_", dir=_ram_dir))
+print(f"Writing to: {OUTPUT_DIR}")
+
+
+def output_path():
+    return Path(tempfile.mktemp(suffix=".ply", dir=OUTPUT_DIR))
 
-means = np.random.randn(num_gaussians, 3).astype(np.float32)
-scales = np.random.randn(num_gaussians, 3).astype(np.float32)
-quats = np.random.randn(num_gaussians, 4).astype(np.float32)
-quats = quats / np.linalg.norm(quats, axis=1, keepdims=True)
-opacities = np.random.rand(num_gaussians).astype(np.float32)
-sh0 = np.random.randn(num_gaussians, 3).astype(np.float32)
-shN = np.empty((num_gaussians, 0, 3), dtype=np.float32)
 
 # Test 1: Current approach (lazy consolidation in plywrite)
 print("\n[Test 1] Current Approach: Lazy Consolidation")
@@ -34,7 +40,7 @@ times_current = []
 for i in range(10):
     data = GSData(means=means, scales=scales, quats=quats, opacities=opacities, sh0=sh0, shN=shN, _base=None)
 
-    temp_file = Path(tempfile.mktemp(suffix=".ply"))
+    temp_file = output_path()
     start = time.perf_counter()
     plywrite(str(temp_file), data)
     elapsed = (time.perf_counter() - start) * 1000
@@ -55,7 +61,7 @@ for i in range(10):
     data = data.consolidate()  # Consolidate immediately
     create_time = (time.perf_counter() - start_create) * 1000
 
-    temp_file = Path(tempfile.mktemp(suffix=".ply"))
+    temp_file = output_path()
     start_write = time.perf_counter()
     plywrite(str(temp_file), data)
     write_time = (time.perf_counter() - start_write) * 1000
@@ -76,12 +82,38 @@ print("  Pattern: Create -> Start background consolidation -> Simulate work -> W
 
 executor = ThreadPoolExecutor(max_workers=2)
 
+@njit(nogil=True, cache=True)
+def _spin(n):
+    """Integer LCG loop (not reducible to a closed form) run without the GIL."""
+    s = 0
+    for _ in range(n):
+        s = (s * 1103515245 + 12345) & 0xFFFFFFFF
+    return s
+
+
+def _calibrate_spin(target_ms=10.0):
+    """Return _spin iterations per millisecond, measured over ~target_ms."""
+    _spin(1)  # JIT compile (or load from cache)
+    n = 100_000
+    while True:
+        start = time.perf_counter()
+        _spin(n)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms >= target_ms:
+            return n / elapsed_ms
+        n *= 2
+
+
+SPIN_ITERS_PER_MS = _calibrate_spin()
+
+
 def simulate_work(duration_ms):
-    """Simulate CPU work for given duration."""
-    start = time.perf_counter()
-    # Busy loop to simulate work
-    while (time.perf_counter() - start) * 1000 < duration_ms:
-        _ = np.random.rand(100)  # Some light work
+    """Simulate CPU work for given duration.
+
+    Spins in nogil machine code so the background consolidate() thread can run
+    truly in parallel (a Python busy loop would hold the GIL).
+    """
+    _spin(int(duration_ms * SPIN_ITERS_PER_MS))
 
 work_durations = [0, 5, 10, 20, 30, 40]
 
@@ -103,7 +135,7 @@ for work_ms in work_durations:
         data_consolidated = future.result()
 
         # Write
-        temp_file = Path(tempfile.mktemp(suffix=".ply"))
+        temp_file = output_path()
         plywrite(str(temp_file), data_consolidated)
 
         total = (time.perf_counter() - start_total) * 1000
@@ -118,7 +150,71 @@ for work_ms in work_durations:
 
     print(f"  Work {work_ms}ms: Threading {mean_threading:.2f}ms vs Sequential {sequential_time:.2f}ms (saves {savings:.2f}ms)")
 
+# Test 4: Burst submission on the same (reused) executor
+print("\n[Test 4] Burst Submission (reused executor)")
+print("  Pattern: Submit 5 consolidations at once -> Simulate work once -> Join all -> Write all")
+
+n_batch = 5
+for work_ms in work_durations:
+    datas = [
+        GSData(means=means, scales=scales, quats=quats, opacities=opacities, sh0=sh0, shN=shN, _base=None)
+        for _ in range(n_batch)
+    ]
+
+    start_total = time.perf_counter()
+    futures = [executor.submit(d.consolidate) for d in datas]
+    submit_ms = (time.perf_counter() - start_total) * 1000
+
+    simulate_work(work_ms)
+
+    start_join = time.perf_counter()
+    consolidated = [f.result() for f in futures]
+    join_ms = (time.perf_counter() - start_join) * 1000
+
+    for d in consolidated:
+        temp_file = output_path()
+        plywrite(str(temp_file), d)
+        temp_file.unlink()
+
+    per_item = (time.perf_counter() - start_total) * 1000 / n_batch
+    print(
+        f"  Work {work_ms}ms: {per_item:.2f}ms per item "
+        f"(submit {submit_ms:.3f}ms, join wait {join_ms:.2f}ms for {n_batch} items)"
+    )
+
+# Test 5: Same batch through executor.map (submits every item up front, yields in order)
+print("\n[Test 5] Batch map (reused executor)")
+print("  Pattern: executor.map over 5 GSData -> Simulate work once -> Collect all -> Write all")
+
+for work_ms in work_durations:
+    datas = [
+        GSData(means=means, scales=scales, quats=quats, opacities=opacities, sh0=sh0, shN=shN, _base=None)
+        for _ in range(n_batch)
+    ]
+
+    start_total = time.perf_counter()
+    results = executor.map(GSData.consolidate, datas)
+    submit_ms = (time.perf_counter() - start_total) * 1000
+
+    simulate_work(work_ms)
+
+    start_join = time.perf_counter()
+    consolidated = list(results)
+    join_ms = (time.perf_counter() - start_join) * 1000
+
+    for d in consolidated:
+        temp_file = output_path()
+        plywrite(str(temp_file), d)
+        temp_file.unlink()
+
+    per_item = (time.perf_counter() - start_total) * 1000 / n_batch
+    print(
+        f"  Work {work_ms}ms: {per_item:.2f}ms per item "
+        f"(map {submit_ms:.3f}ms, collect wait {join_ms:.2f}ms for {n_batch} items)"
+    )
+
 executor.shutdown()
+OUTPUT_DIR.rmdir()
 
 # Summary
 print("\n" + "=" * 80)
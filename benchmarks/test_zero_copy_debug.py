@@ -1,98 +1,92 @@
-"""Debug zero-copy detection."""
+"""Debug zero-copy detection.
 
-import gsply
-import numpy as np
-
-# Read real file
-data = gsply.plyread("D:/4D/all_plys/frame_0.ply")
-
-print("=" * 80)
-print("DEBUGGING ZERO-COPY DETECTION")
-print("=" * 80)
+Collects one row per field for each stage (GSData fields, unpack(), writer
+normalization) and emits each stage as a single JSON dump. Fails if plyread
+fields or unpacked arrays are not views on data._base. The "base" stage also
+reports whether _base aliases a memory mapping of the file (root_is_memmap) or a
+heap buffer the payload was read into.
+"""
 
-print("\n[Data Structure]")
-print(f"  data._base shape: {data._base.shape if data._base is not None else None}")
-print(f"  data._base dtype: {data._base.dtype if data._base is not None else None}")
-print(f"  data._base id: {id(data._base) if data._base is not None else None}")
+import json
+import mmap
+import sys
 
-print("\n[Field: means]")
-print(f"  means shape: {data.means.shape}")
-print(f"  means dtype: {data.means.dtype}")
-print(f"  means.base is not None: {data.means.base is not None}")
-print(f"  means.base id: {id(data.means.base) if data.means.base is not None else None}")
-print(f"  means.base is data._base: {data.means.base is data._base if data.means.base is not None else False}")
-print(f"  means.flags.c_contiguous: {data.means.flags.c_contiguous}")
-
-print("\n[Field: scales]")
-print(f"  scales.base is data._base: {data.scales.base is data._base if data.scales.base is not None else False}")
-
-print("\n[Field: quats]")
-print(f"  quats.base is data._base: {data.quats.base is data._base if data.quats.base is not None else False}")
-
-print("\n[Field: opacities]")
-print(f"  opacities shape: {data.opacities.shape}")
-print(f"  opacities.base is not None: {data.opacities.base is not None}")
-print(f"  opacities.base is data._base: {data.opacities.base is data._base if data.opacities.base is not None else False}")
+import numpy as np
 
-print("\n[Field: sh0]")
-print(f"  sh0.base is data._base: {data.sh0.base is data._base if data.sh0.base is not None else False}")
+import gsply
+from _testdata import get_test_file
+from gsply.writer import _validate_and_normalize_inputs
 
-print("\n[Field: shN]")
-if data.shN is not None:
-    print(f"  shN.base is not None: {data.shN.base is not None}")
-    print(f"  shN.base is data._base: {data.shN.base is data._base if data.shN.base is not None else False}")
-else:
-    print(f"  shN is None")
+FIELDS = ("means", "scales", "quats", "opacities", "sh0", "shN")
+
+
+def _root_base(arr):
+    """Follow the .base chain to the outermost ndarray (stops at an mmap buffer).
+
+    Only used to classify the storage behind _base; zero-copy checks use
+    np.shares_memory, which holds regardless of how views are chained.
+    """
+    while isinstance(arr.base, np.ndarray):
+        arr = arr.base
+    return arr
+
+
+def describe(arrays, base):
+    """Build one row per field describing its relationship to base."""
+    rows = []
+    for name, arr in zip(FIELDS, arrays, strict=True):
+        if arr is None or arr.size == 0:
+            # SH0 files have an empty, freshly allocated shN placeholder
+            continue
+        rows.append(
+            {
+                "field": name,
+                "zero_copy": bool(np.shares_memory(arr, base)),
+                "shape": arr.shape,
+                "dtype": arr.dtype,
+                "c_contiguous": arr.flags.c_contiguous,
+            }
+        )
+    return rows
+
+
+def report(title, rows):
+    """Emit one stage as a single JSON block."""
+    print(json.dumps({"stage": title, "fields": rows}, indent=2, default=str))
+
+
+file_path = sys.argv[1] if len(sys.argv) > 1 else get_test_file()
+data = gsply.plyread(file_path)
+assert data._base is not None, "plyread did not return a _base array"
+
+# Is _base backed by a file mapping or by a heap buffer the file was copied into?
+root = _root_base(data._base)
+report(
+    "base",
+    [
+        {
+            "shape": data._base.shape,
+            "dtype": data._base.dtype,
+            "type": type(data._base).__name__,
+            "owndata": data._base.flags.owndata,
+            "root_type": type(root).__name__,
+            "root_is_memmap": isinstance(root, np.memmap) or isinstance(root.base, mmap.mmap),
+        }
+    ],
+)
 
-# Test after unpacking
-print("\n" + "=" * 80)
-print("AFTER UNPACKING")
-print("=" * 80)
+field_rows = describe([getattr(data, name) for name in FIELDS], data._base)
+report("fields", field_rows)
 
 means, scales, quats, opacities, sh0, shN = data.unpack()
+unpacked_rows = describe((means, scales, quats, opacities, sh0, shN), data._base)
+report("unpacked", unpacked_rows)
 
-print("\n[Unpacked: means]")
-print(f"  means.base is not None: {means.base is not None}")
-if means.base is not None:
-    print(f"  means.base is data._base: {means.base is data._base}")
-    print(f"  means.base shape: {means.base.shape}")
-
-print("\n[Unpacked: opacities]")
-print(f"  opacities shape: {opacities.shape}")
-print(f"  opacities.base is not None: {opacities.base is not None}")
-if opacities.base is not None:
-    print(f"  opacities.base is data._base: {opacities.base is data._base}")
-
-# Check what validate_and_normalize does
-print("\n" + "=" * 80)
-print("AFTER VALIDATE_AND_NORMALIZE")
-print("=" * 80)
-
-from gsply.writer import _validate_and_normalize_inputs
-
-means2, scales2, quats2, opacities2, sh02, shN2 = _validate_and_normalize_inputs(
+# Writer normalization (float32 conversion + shN flattening) should not copy either
+normalized = _validate_and_normalize_inputs(
     means, scales, quats, opacities, sh0, shN, validate=False
 )
+report("validate_and_normalize", describe(normalized, data._base))
 
-print("\n[After normalize: means]")
-print(f"  means2 is means: {means2 is means}")
-print(f"  means2.base is not None: {means2.base is not None}")
-if means2.base is not None:
-    print(f"  means2.base is data._base: {means2.base is data._base}")
-
-print("\n[After normalize: opacities]")
-print(f"  opacities2 is opacities: {opacities2 is opacities}")
-print(f"  opacities2 shape: {opacities2.shape}")
-print(f"  opacities2.base is not None: {opacities2.base is not None}")
-if opacities2.base is not None:
-    print(f"  opacities2.base is data._base: {opacities2.base is data._base}")
-
-print("\n[After normalize: shN]")
-if shN2 is not None:
-    print(f"  shN2 is shN: {shN2 is shN}")
-    print(f"  shN2 shape: {shN2.shape}")
-    print(f"  shN2.base is not None: {shN2.base is not None}")
-    if shN2.base is not None:
-        print(f"  shN2.base is data._base: {shN2.base is data._base}")
-        print(f"  shN2.base shape: {shN2.base.shape}")
-        print(f"  data._base shape: {data._base.shape}")
+assert all(r["zero_copy"] for r in field_rows), "GSData fields are not views on _base"
+assert all(r["zero_copy"] for r in unpacked_rows), "unpack() arrays are not views on _base"
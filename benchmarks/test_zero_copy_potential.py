@@ -0,0 +1,275 @@
+"""Explore how much of an uncompressed read is the payload copy.
+
+read_uncompressed() pulls the whole binary payload into RAM with np.fromfile and
+slices views from it. This script compares that against viewing the payload
+directly in an mmap of the file, where the kernel pages data in only when it is
+touched. Both readers share one mmap-based header parse.
+
+Each reader returns (means, scales, quats, opacities, sh0, shN, base); base keeps
+the buffer (or mapping) alive for the views.
+"""
+
+import functools
+import mmap
+import sys
+from collections import deque
+import tempfile
+import tracemalloc
+from pathlib import Path
+from timeit import Timer
+
+import numpy as np
+
+import gsply
+from _testdata import get_test_file, make_gaussians
+from test_read_performance import drop_caches
+
+END_HEADER = b"end_header\n"
+COLD_REPEAT = 5
+
+
+def _header_end(file_path, sequential=True):
+    """Map the file and locate the end of the ASCII header with a single find().
+
+    Mirrors _read_header_fast() in reader.py: one C-level search instead of a
+    Python readline() loop. With ``sequential`` the mapping is advised
+    MADV_SEQUENTIAL (aggressive readahead, early reclaim) and whole pages holding
+    only header bytes are dropped once parsed; both are no-ops where madvise is
+    unavailable (e.g. Windows).
+
+    :returns: (mapping, vertex_count, property_count, data_offset)
+    """
+    with open(file_path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    if sequential and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    data_offset = mm.find(END_HEADER) + len(END_HEADER)
+    header = mm[:data_offset].split(b"\n")
+    vertex_count = next(int(line.split()[2]) for line in header if line.startswith(b"element vertex"))
+    property_count = sum(line.startswith(b"property") for line in header)
+    header_pages = data_offset - data_offset % mmap.PAGESIZE
+    if sequential and header_pages and hasattr(mmap, "MADV_DONTNEED"):
+        mm.madvise(mmap.MADV_DONTNEED, 0, header_pages)
+    return mm, vertex_count, property_count, data_offset
+
+
+def _slice_fields(data, property_count):
+    """Zero-copy field views on an (N, property_count) float32 buffer."""
+    n = data.shape[0]
+    sh_coeffs = property_count - 14
+    means = data[:, 0:3]
+    sh0 = data[:, 3:6]
+    # f_rest is channel-grouped: (N, 3, K) -> (N, K, 3). The column slice keeps a
+    # unit inner stride, so reshape splits that axis without copying; no
+    # as_strided is needed (benchmark_read_strategies asserts every field is a view).
+    shN = data[:, 6 : 6 + sh_coeffs].reshape(n, 3, sh_coeffs // 3).transpose(0, 2, 1)  # noqa: N806
+    opacities = data[:, 6 + sh_coeffs]
+    scales = data[:, 7 + sh_coeffs : 10 + sh_coeffs]
+    quats = data[:, 10 + sh_coeffs : 14 + sh_coeffs]
+    return means, scales, quats, opacities, sh0, shN
+
+
+@functools.lru_cache
+def _make_slicer(property_count):
+    """Build a field slicer with the column offsets for one layout folded in.
+
+    Numba cannot do this step: its reshape() only accepts contiguous arrays, and
+    the f_rest columns are a strided view. So the specialization is a closure over
+    precomputed slice objects, cached per property count (i.e. per SH degree).
+    """
+    sh_coeffs = property_count - 14
+    sh_bands = sh_coeffs // 3
+    means_cols = np.s_[:, 0:3]
+    sh0_cols = np.s_[:, 3:6]
+    shn_cols = np.s_[:, 6 : 6 + sh_coeffs]
+    opacity_col = np.s_[:, 6 + sh_coeffs]
+    scales_cols = np.s_[:, 7 + sh_coeffs : 10 + sh_coeffs]
+    quats_cols = np.s_[:, 10 + sh_coeffs : 14 + sh_coeffs]
+
+    def slice_fields(data):
+        shN = data[shn_cols].reshape(data.shape[0], 3, sh_bands).transpose(0, 2, 1)  # noqa: N806
+        return data[means_cols], data[scales_cols], data[quats_cols], data[opacity_col], data[sh0_cols], shN
+
+    return slice_fields
+
+
+def benchmark_slicers(file_path, number=10_000):
+    """Per-call cost of generic vs specialized field slicing on a loaded payload."""
+    *_, data = read_fromfile(file_path)
+    props = data.shape[1]
+    specialized = _make_slicer(props)
+    for field, expected in zip(specialized(data), _slice_fields(data, props), strict=True):
+        assert np.array_equal(field, expected), "specialized slicer mismatch"
+
+    generic = Timer(lambda: _slice_fields(data, props)).timeit(number) / number
+    special = Timer(lambda: specialized(data)).timeit(number) / number
+    return {"_slice_fields (generic)": generic * 1e6, "_make_slicer (specialized)": special * 1e6}
+
+
+def read_fromfile(file_path):
+    """Current reader strategy: copy the payload into RAM, then slice."""
+    mm, n, props, data_offset = _header_end(file_path)
+    mm.close()
+    data = np.fromfile(file_path, dtype=np.float32, count=n * props, offset=data_offset)
+    data = data.reshape(n, props)
+    return (*_make_slicer(props)(data), data)
+
+
+def read_memmap(file_path, sequential=True):
+    """View the payload straight out of the (copy-on-write) mapping; no up-front copy.
+
+    The returned base array holds the mapping alive for the field views.
+    """
+    mm, n, props, data_offset = _header_end(file_path, sequential)
+    data = np.frombuffer(mm, dtype=np.float32, count=n * props, offset=data_offset)
+    data = data.reshape(n, props)
+    return (*_make_slicer(props)(data), data)
+
+
+# Round-robin pool of payload buffers per (n, props); see read_readinto
+N_POOLED_BUFFERS = 3
+_buffer_pool = {}
+
+
+def read_readinto(file_path):
+    """Read the payload into a pooled, preallocated buffer with readinto().
+
+    Buffers are reused round-robin, so results from more than N_POOLED_BUFFERS - 1
+    calls ago (for the same shape) are overwritten. Fine for this benchmark loop,
+    not for a general reader that hands arrays to callers.
+    """
+    mm, n, props, data_offset = _header_end(file_path)
+    mm.close()
+    pool = _buffer_pool.setdefault((n, props), deque(maxlen=N_POOLED_BUFFERS))
+    if len(pool) < N_POOLED_BUFFERS:
+        data = np.empty((n, props), dtype=np.float32)
+    else:
+        data = pool.popleft()
+    pool.append(data)
+    with open(file_path, "rb") as f:
+        f.seek(data_offset)
+        f.readinto(memoryview(data).cast("B"))
+    return (*_make_slicer(props)(data), data)
+
+
+def ply_dtype(property_count):
+    """Structured record for one vertex (59 floats for SH3).
+
+    shN is declared (3, K) because f_rest is channel-grouped on disk; readers
+    transpose it to the (N, K, 3) convention.
+    """
+    sh_bands = (property_count - 14) // 3
+    return np.dtype(
+        [
+            ("means", "<f4", 3),
+            ("sh0", "<f4", 3),
+            ("shN", "<f4", (3, sh_bands)),
+            ("opacity", "<f4"),
+            ("scales", "<f4", 3),
+            ("quats", "<f4", 4),
+        ]
+    )
+
+
+def read_structured(file_path):
+    """Read the payload as a record array and take fields by name (all views)."""
+    mm, n, props, data_offset = _header_end(file_path)
+    mm.close()
+    rec = np.fromfile(file_path, dtype=ply_dtype(props), count=n, offset=data_offset)
+    fields = (
+        rec["means"],
+        rec["scales"],
+        rec["quats"],
+        rec["opacity"],
+        rec["sh0"],
+        rec["shN"].transpose(0, 2, 1),
+    )
+    return (*fields, rec)
+
+
+READERS = {
+    "np.fromfile (reader.py)": read_fromfile,
+    "mmap + np.frombuffer": read_memmap,
+    "mmap (no madvise)": functools.partial(read_memmap, sequential=False),
+    "structured record": read_structured,
+    "readinto (pooled buffer)": read_readinto,
+}
+
+
+def _touch(fields):
+    """One full pass over every field, forcing mapped pages in."""
+    for field in fields[:6]:
+        np.add.reduce(field, axis=None)
+
+
+def benchmark_read_strategies(file_path, iterations=50):
+    """Time each reader, alone and followed by one full pass over the data.
+
+    A mapped open is O(header); the touch column shows the cost once every page
+    has actually been touched. Times are means over timeit repeats (GC disabled).
+    Peak is the traced heap allocation of one read; mmap pages are not traced.
+    Cold is the median open+touch right after evicting the file from the page cache.
+    """
+    reference = gsply.plyread(file_path)
+    results = {}
+
+    for name, reader in READERS.items():
+        fields = reader(file_path)
+        for field, expected in zip(fields[:6], reference.unpack(), strict=True):
+            assert np.shares_memory(field, fields[-1]), f"{name}: field is not a view"
+            assert np.array_equal(field, expected), f"{name}: field mismatch"
+        del fields
+
+        open_times = Timer(lambda: reader(file_path)).repeat(repeat=iterations, number=1)
+        touch_times = Timer(lambda: _touch(reader(file_path))).repeat(repeat=iterations, number=1)
+
+        tracemalloc.start()
+        fields = reader(file_path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del fields
+
+        # First read after evicting the file from the page cache (where readahead
+        # hints matter); equals a warm read where eviction is unsupported
+        cold_times = []
+        for _ in range(COLD_REPEAT):
+            drop_caches(file_path)
+            cold_times.append(min(Timer(lambda: _touch(reader(file_path))).repeat(repeat=1, number=1)))
+
+        results[name] = (
+            np.mean(open_times) * 1e3,
+            np.mean(touch_times) * 1e3,
+            np.median(cold_times) * 1e3,
+            peak / 1e6,
+        )
+
+    return results
+
+
+def main():
+    """Run read-strategy comparison on a real or synthetic file."""
+    file_path = Path(sys.argv[1]) if len(sys.argv) > 1 else get_test_file()
+    cleanup = False
+    if not file_path.exists():
+        file_path = Path(tempfile.mktemp(suffix=".ply"))
+        gsply.plywrite(file_path, *make_gaussians(400_000, sh_degree=3))
+        cleanup = True
+
+    print("=" * 80)
+    print(f"Read strategies: {file_path.name} ({file_path.stat().st_size / 1e6:.1f} MB)")
+    print("=" * 80)
+    print(f"  {'strategy':<28} {'open ms':>10} {'open+touch ms':>15} {'cold ms':>9} {'peak MB':>9}")
+    for name, (open_ms, touch_ms, cold_ms, peak_mb) in benchmark_read_strategies(file_path).items():
+        print(f"  {name:<28} {open_ms:>10.3f} {touch_ms:>15.3f} {cold_ms:>9.2f} {peak_mb:>9.1f}")
+
+    print()
+    print("Field slicing per call:")
+    for name, us in benchmark_slicers(file_path).items():
+        print(f"  {name:<28} {us:>10.2f} us")
+
+    if cleanup:
+        file_path.unlink()
+
+
+if __name__ == "__main__":
+    main()
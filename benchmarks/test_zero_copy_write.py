@@ -1,12 +1,15 @@
 """Test and benchmark zero-copy write optimization."""
 
+import os
 import tempfile
-import time
+import tracemalloc
 from pathlib import Path
+from timeit import Timer
 
 import numpy as np
 
 import gsply
+from _testdata import get_test_file, make_gaussians
 
 
 def test_zero_copy_correctness():
@@ -16,23 +19,14 @@ def test_zero_copy_correctness():
     print("=" * 80)
 
     # Test with real PLY file from disk
-    test_file = Path("D:/4D/all_plys/frame_0.ply")
+    test_file = get_test_file()
     if not test_file.exists():
         print(f"[SKIP] Test file not found: {test_file}")
         # Fallback to synthetic data
         print("Generating synthetic test data...")
-        n = 10000
-        means = np.random.randn(n, 3).astype(np.float32)
-        scales = np.random.rand(n, 3).astype(np.float32)
-        quats = np.random.randn(n, 4).astype(np.float32)
-        quats = quats / np.linalg.norm(quats, axis=1, keepdims=True)
-        opacities = np.random.rand(n).astype(np.float32)
-        sh0 = np.random.rand(n, 3).astype(np.float32)
-        shN = np.random.rand(n, 45).astype(np.float32)
-
         # Write test file
         test_file = Path(tempfile.mktemp(suffix=".ply"))
-        gsply.plywrite(str(test_file), means, scales, quats, opacities, sh0, shN)
+        gsply.plywrite(str(test_file), *make_gaussians(10_000, sh_degree=3))
 
     # Read data (creates _base array with views)
     print(f"\n[1/4] Reading test file: {test_file.name}")
@@ -76,13 +70,11 @@ def test_zero_copy_correctness():
     data_zero = gsply.plyread(str(output_zero_copy))
     data_std = gsply.plyread(str(output_standard))
 
-    assert np.allclose(data_zero.means, data.means), "means mismatch"
-    assert np.allclose(data_zero.scales, data.scales), "scales mismatch"
-    assert np.allclose(data_zero.quats, data.quats), "quats mismatch"
-    assert np.allclose(data_zero.opacities, data.opacities), "opacities mismatch"
-    assert np.allclose(data_zero.sh0, data.sh0), "sh0 mismatch"
-    if data.shN is not None:
-        assert np.allclose(data_zero.shN, data.shN), "shN mismatch"
+    # Round-trip is bit-exact (the same bytes were written), so compare exactly
+    for name in ("means", "scales", "quats", "opacities", "sh0", "shN"):
+        expected = getattr(data, name)
+        if expected is not None:
+            assert np.array_equal(getattr(data_zero, name), expected), f"{name} mismatch"
 
     print("  [OK] Round-trip verification passed")
 
@@ -96,8 +88,27 @@ def test_zero_copy_correctness():
     return True
 
 
+def peak_allocation_mb(fn):
+    """Peak traced allocation (MB) of one call, kept apart from the timed runs."""
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
 def benchmark_zero_copy_speedup():
-    """Benchmark zero-copy vs standard write performance."""
+    """Benchmark zero-copy vs standard write performance.
+
+    Each path is timed with timeit (GC disabled, best-effort low noise). plywrite
+    only accepts paths, so output goes to one file in a RAM-backed directory
+    (tmpfs) when available, overwritten in place between runs: the reported
+    throughput covers encoding + write(), not disk or file create/unlink.
+    """
+    ram_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    output_dir = tempfile.TemporaryDirectory(prefix="gsply_zero_copy_", dir=ram_dir)
+    output_file = Path(output_dir.name) / "output.ply"
+
     print("\n" * 2)
     print("=" * 80)
     print("BENCHMARK: Zero-Copy Write Speedup")
@@ -116,45 +127,29 @@ def benchmark_zero_copy_speedup():
         print(f"Test: {label} ({num_gaussians:,} Gaussians)")
         print(f"{'-' * 80}")
 
-        # Generate data
-        means = np.random.randn(num_gaussians, 3).astype(np.float32)
-        scales = np.random.rand(num_gaussians, 3).astype(np.float32) * 0.1
-        quats = np.random.randn(num_gaussians, 4).astype(np.float32)
-        quats = quats / np.linalg.norm(quats, axis=1, keepdims=True)
-        opacities = np.random.rand(num_gaussians).astype(np.float32)
-        sh0 = np.random.rand(num_gaussians, 3).astype(np.float32)
-
-        if sh_degree > 0:
-            sh_coeffs = {1: 9, 2: 24, 3: 45}[sh_degree]
-            shN = np.random.rand(num_gaussians, sh_coeffs).astype(np.float32) * 0.1
-        else:
-            shN = None
-
         # Create test file
         test_file = Path(tempfile.mktemp(suffix=".ply"))
-        gsply.plywrite(str(test_file), means, scales, quats, opacities, sh0, shN)
+        gsply.plywrite(str(test_file), *make_gaussians(num_gaussians, sh_degree))
 
         # Read back (creates _base with views)
         data = gsply.plyread(str(test_file))
 
         # Benchmark zero-copy path
         print("\n[1/2] Benchmarking ZERO-COPY path (from plyread)...")
-        output_file = Path(tempfile.mktemp(suffix=".ply"))
         iterations = 20
 
-        times_zero_copy = []
-        for _ in range(iterations):
-            start = time.perf_counter()
+        def write_zero_copy():
             gsply.plywrite(str(output_file), *data.unpack())
-            elapsed = (time.perf_counter() - start) * 1000
-            times_zero_copy.append(elapsed)
-            output_file.unlink()
+
+        times_zero_copy = np.array(Timer(write_zero_copy).repeat(repeat=iterations, number=1)) * 1000
+        peak_zero = peak_allocation_mb(write_zero_copy)
 
         mean_zero = np.mean(times_zero_copy)
         min_zero = np.min(times_zero_copy)
 
         print(f"  Mean: {mean_zero:.2f} ms")
         print(f"  Min:  {min_zero:.2f} ms")
+        print(f"  Peak alloc: {peak_zero:.1f} MB")
         print(f"  Throughput: {num_gaussians / mean_zero * 1000 / 1e6:.1f} M Gaussians/sec")
 
         # Benchmark standard path (copy data first)
@@ -166,20 +161,19 @@ def benchmark_zero_copy_speedup():
         sh0_copy = data.sh0.copy()
         shN_copy = data.shN.copy() if data.shN is not None else None
 
-        times_standard = []
-        for _ in range(iterations):
-            start = time.perf_counter()
+        def write_standard():
             gsply.plywrite(str(output_file), means_copy, scales_copy, quats_copy,
                            opacities_copy, sh0_copy, shN_copy)
-            elapsed = (time.perf_counter() - start) * 1000
-            times_standard.append(elapsed)
-            output_file.unlink()
+
+        times_standard = np.array(Timer(write_standard).repeat(repeat=iterations, number=1)) * 1000
+        peak_std = peak_allocation_mb(write_standard)
 
         mean_std = np.mean(times_standard)
         min_std = np.min(times_standard)
 
         print(f"  Mean: {mean_std:.2f} ms")
         print(f"  Min:  {min_std:.2f} ms")
+        print(f"  Peak alloc: {peak_std:.1f} MB")
         print(f"  Throughput: {num_gaussians / mean_std * 1000 / 1e6:.1f} M Gaussians/sec")
 
         # Calculate speedup
@@ -193,21 +187,28 @@ def benchmark_zero_copy_speedup():
             'zero_copy_ms': mean_zero,
             'standard_ms': mean_std,
             'speedup': speedup,
+            'zero_copy_peak_mb': peak_zero,
+            'standard_peak_mb': peak_std,
         })
 
         # Cleanup
         test_file.unlink()
 
+    output_dir.cleanup()
+
     # Summary
     print("\n" * 2)
     print("=" * 80)
     print("SUMMARY: Zero-Copy Write Speedup")
     print("=" * 80)
     print()
-    print(f"{'Test':<12} | {'Zero-Copy':<12} | {'Standard':<12} | {'Speedup':<10}")
+    print(f"{'Test':<12} | {'Zero-Copy':<12} | {'Standard':<12} | {'Speedup':<10} | {'Peak MB (zc/std)':<16}")
     print("-" * 80)
     for r in results:
-        print(f"{r['label']:<12} | {r['zero_copy_ms']:>8.1f} ms | {r['standard_ms']:>8.1f} ms | {r['speedup']:>6.1f}x")
+        print(
+            f"{r['label']:<12} | {r['zero_copy_ms']:>8.1f} ms | {r['standard_ms']:>8.1f} ms | "
+            f"{r['speedup']:>6.1f}x    | {r['zero_copy_peak_mb']:>6.1f} / {r['standard_peak_mb']:.1f}"
+        )
 
     print()
     print("=" * 80)
@@ -1,8 +1,12 @@
 """Verify benchmark data integrity and test a quick sanity check."""
 
+import multiprocessing
+import os
 import sys
-import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from timeit import Timer
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -15,28 +19,38 @@ logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
 
-def verify_file(file_path: Path):
-    """Verify a single file can be read correctly."""
-    logger.info(f"Verifying: {file_path.name}")
+def verify_file(file_path: Path, repeat: int = 5):
+    """Verify a single file can be read correctly.
+
+    Read time is the best of ``repeat`` timeit runs (GC disabled while timing);
+    the peak traced allocation of one further read is reported separately.
+
+    The report is emitted as one log record so output from parallel workers does
+    not interleave.
+    """
+    lines = [f"Verifying: {file_path.name}"]
 
     try:
         # Detect format
         is_compressed, sh_degree = gsply.detect_format(file_path)
-        logger.info(f"  Format: {'Compressed' if is_compressed else 'Uncompressed'}, SH degree: {sh_degree}")
+        lines.append(f"  Format: {'Compressed' if is_compressed else 'Uncompressed'}, SH degree: {sh_degree}")
 
-        # Read file
-        start = time.perf_counter()
+        # Read file (timed runs first so JIT warmup stays out of the traced read)
+        elapsed = min(Timer(lambda: gsply.plyread(file_path)).repeat(repeat=repeat, number=1)) * 1000
+        tracemalloc.start()
         data = gsply.plyread(file_path)
-        elapsed = (time.perf_counter() - start) * 1000
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
 
         # Check data
         num_gaussians = data.means.shape[0]
         file_size = file_path.stat().st_size / (1024 * 1024)
 
-        logger.info(f"  Gaussians: {num_gaussians:,}")
-        logger.info(f"  File size: {file_size:.2f} MB")
-        logger.info(f"  Read time: {elapsed:.2f} ms")
-        logger.info(f"  Throughput: {num_gaussians / (elapsed/1000) / 1e6:.1f} M/s")
+        lines.append(f"  Gaussians: {num_gaussians:,}")
+        lines.append(f"  File size: {file_size:.2f} MB")
+        lines.append(f"  Read time: {elapsed:.2f} ms (best of {repeat})")
+        lines.append(f"  Peak alloc: {peak_bytes / (1024 * 1024):.2f} MB")
+        lines.append(f"  Throughput: {num_gaussians / (elapsed/1000) / 1e6:.1f} M/s")
 
         # Verify shapes
         assert data.means.shape == (num_gaussians, 3), "Invalid means shape"
@@ -45,19 +59,23 @@ def verify_file(file_path: Path):
         assert data.opacities.shape == (num_gaussians,), "Invalid opacities shape"
         assert data.sh0.shape == (num_gaussians, 3), "Invalid sh0 shape"
 
-        logger.info("  [OK] All shapes valid")
-        logger.info("")
-
-        return True
+        lines.append("  [OK] All shapes valid")
+        ok = True
 
     except Exception as e:
-        logger.error(f"  [FAIL] {e}")
-        logger.info("")
-        return False
+        lines.append(f"  [FAIL] {e}")
+        ok = False
+
+    lines.append("")
+    logger.log(logging.INFO if ok else logging.ERROR, "\n".join(lines))
+    return ok
 
 
-def main():
-    """Run verification on test data files."""
+def main(max_workers: int | None = None):
+    """Run verification on test data files.
+
+    :param max_workers: Worker processes (default: one per CPU; 1 runs in-process)
+    """
     logger.info("=" * 80)
     logger.info("BENCHMARK DATA VERIFICATION")
     logger.info("=" * 80)
@@ -79,11 +97,17 @@ def main():
     logger.info(f"Found {len(test_files)} test files")
     logger.info("")
 
-    # Verify each file
-    results = []
-    for file_path in test_files:
-        result = verify_file(file_path)
-        results.append((file_path.name, result))
+    # Verify files in parallel; each worker reads its own file. Read times under
+    # concurrency include contention, so pass max_workers=1 for clean timings.
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1:
+        ok = [verify_file(file_path) for file_path in test_files]
+    else:
+        # spawn, not fork: gsply may already hold worker threads in this process
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+            ok = list(executor.map(verify_file, test_files, chunksize=1))
+    results = [(file_path.name, result) for file_path, result in zip(test_files, ok, strict=True)]
 
     # Summary
     logger.info("=" * 80)
@@ -56,15 +56,20 @@ from gsply.formats import detect_format
 from gsply.gsdata import GSData, create_ply_format, create_rasterizer_format
 from gsply.reader import decompress_from_bytes, plyread
 from gsply.utils import (
+    INV_SH_C0,
     SH_C0,
     apply_pre_activations,
     apply_pre_deactivations,
     logit,
+    logit_chunked,
     rgb2sh,
     sh2rgb,
+    sh2rgb_u8,
     sigmoid,
+    sigmoid_chunked,
+    sigmoid_fast,
 )
-from gsply.writer import compress_to_arrays, compress_to_bytes, plywrite
+from gsply.writer import compress_batch, compress_to_arrays, compress_to_bytes, plywrite
 
 __version__ = "0.2.16"
 __all__ = [
@@ -73,17 +78,23 @@ __all__ = [
     "plywrite",
     "compress_to_bytes",
     "compress_to_arrays",
+    "compress_batch",
     "decompress_from_bytes",
     "detect_format",
     "create_ply_format",
     "create_rasterizer_format",
     "sh2rgb",
+    "sh2rgb_u8",
     "rgb2sh",
     "logit",
+    "logit_chunked",
     "sigmoid",
+    "sigmoid_chunked",
+    "sigmoid_fast",
     "apply_pre_activations",
     "apply_pre_deactivations",
     "SH_C0",
+    "INV_SH_C0",
     "__version__",
 ]
 # Note: GSTensor and sogread are available via lazy import but not in __all__ (they're optional)
@@ -3,16 +3,20 @@
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 __all__ = [
     "detect_format",
     "get_sh_degree_from_property_count",
     "SH_C0",
+    "INV_SH_C0",
     "CHUNK_SIZE",
     "CHUNK_SIZE_SHIFT",
     "PROPERTY_COUNTS_BY_SH_DEGREE",
     "PROPERTY_COUNT_TO_SH_DEGREE",
     "SH_BANDS_TO_DEGREE",
     "EXPECTED_PROPERTIES_BY_SH_DEGREE",
+    "PLY_VERTEX_DTYPE_BY_SH_DEGREE",
     "SH_DEGREE_TO_COEFFS",
     # Quantization constants
     "INV_2047",
@@ -106,6 +110,12 @@ EXPECTED_PROPERTIES_BY_SH_DEGREE: dict[int, list[str]] = {
     degree: _build_property_list(degree) for degree in range(4)
 }
 
+# Packed little-endian float32 vertex record for each SH degree (same layout as GSData._base)
+PLY_VERTEX_DTYPE_BY_SH_DEGREE: dict[int, np.dtype] = {
+    degree: np.dtype([(name, "<f4") for name in properties])
+    for degree, properties in EXPECTED_PROPERTIES_BY_SH_DEGREE.items()
+}
+
 # Compressed format constants
 CHUNK_SIZE = 256
 CHUNK_SIZE_SHIFT = 8  # log2(256) - for fast division using bit shift
@@ -114,6 +124,7 @@ COMPRESSED_VERTEX_PROPERTIES = 4  # packed position, rotation, scale, color
 
 # SH coefficient for color conversion
 SH_C0 = 0.28209479177387814  # sqrt(1/(4*pi))
+INV_SH_C0 = 1.0 / SH_C0  # = 3.544907701811032, multiply instead of dividing by SH_C0
 
 # ======================================================================================
 # QUANTIZATION CONSTANTS (shared between reader.py and writer.py)
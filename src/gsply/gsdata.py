@@ -2,14 +2,20 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import TypedDict
 
 import numba
 import numpy as np
 from numba import jit, prange
 
-from gsply.formats import SH_BANDS_TO_DEGREE
+from gsply.formats import (
+    PLY_VERTEX_DTYPE_BY_SH_DEGREE,
+    PROPERTY_COUNT_TO_SH_DEGREE,
+    SH_BANDS_TO_DEGREE,
+)
 
 # Lazy imports to avoid circular dependencies
 # These are imported inside methods to break circular import cycles
@@ -118,6 +124,60 @@ def _interleave_shn_jit(
         output[i, opacity_idx + 7] = quats[i, 3]
 
 
+def _base_props(shN: np.ndarray | None) -> int:  # noqa: N803
+    """Number of float32 properties per Gaussian in a _base record for this shN.
+
+    :param shN: (N, K, 3) higher-order SH coefficients or None
+    :returns: 14 + 3*K (means, sh0, shN, opacity, scales, quats)
+    """
+    if shN is None or shN.shape[1] == 0:
+        return 14
+    return 14 + shN.shape[1] * 3
+
+
+def _fill_base(
+    out: np.ndarray,
+    *,
+    means: np.ndarray,
+    scales: np.ndarray,
+    quats: np.ndarray,
+    opacities: np.ndarray,
+    sh0: np.ndarray,
+    shN: np.ndarray | None,  # noqa: N803
+) -> None:
+    """Interleave separate Gaussian arrays into a C-contiguous _base record array.
+
+    :param out: (N, _base_props(shN)) float32 output, C-contiguous (filled in place)
+    :param means: (N, 3) positions
+    :param scales: (N, 3) scales
+    :param quats: (N, 4) quaternions
+    :param opacities: (N,) opacities
+    :param sh0: (N, 3) DC spherical harmonics
+    :param shN: (N, K, 3) higher-order SH coefficients or None
+    """
+    n_gaussians = out.shape[0]
+
+    # Ensure arrays are contiguous float32 for JIT
+    means = np.ascontiguousarray(means, dtype=np.float32)
+    sh0 = np.ascontiguousarray(sh0, dtype=np.float32)
+    opacities = np.ascontiguousarray(opacities.ravel(), dtype=np.float32)
+    scales = np.ascontiguousarray(scales, dtype=np.float32)
+    quats = np.ascontiguousarray(quats, dtype=np.float32)
+
+    # Layout: means(3) + sh0(3) + shN(K*3) + opacity(1) + scales(3) + quats(4)
+    if shN is not None and shN.shape[1] > 0:
+        # SH1-3: use general kernel with variable SH coefficients (9, 24, or 45)
+        sh_coeffs = shN.shape[1] * 3
+        # Flatten shN from (N, bands, 3) to channel-major (N, 3*bands) like f_rest_*
+        shn_flat = np.ascontiguousarray(
+            shN.transpose(0, 2, 1).reshape(n_gaussians, sh_coeffs), dtype=np.float32
+        )
+        _interleave_shn_jit(means, sh0, shn_flat, opacities, scales, quats, out, sh_coeffs)
+    else:
+        # SH0: use optimized kernel (14 properties)
+        _interleave_sh0_jit(means, sh0, opacities, scales, quats, out)
+
+
 class DataFormat(Enum):
     """Format tracking for individual attributes - each value specifies attribute and format."""
 
@@ -167,6 +227,16 @@ _SH_DEGREE_TO_FORMAT: dict[int, DataFormat] = {
     3: DataFormat.SH_ORDER_3,
 }
 
+# Mapping from from_arrays/from_dict format preset names to (scales, opacities) formats
+_FORMAT_PRESETS: dict[str, tuple[DataFormat, DataFormat]] = {
+    "ply": (DataFormat.SCALES_PLY, DataFormat.OPACITIES_PLY),
+    "linear": (DataFormat.SCALES_LINEAR, DataFormat.OPACITIES_LINEAR),
+    "rasterizer": (DataFormat.SCALES_LINEAR, DataFormat.OPACITIES_LINEAR),
+}
+
+# Storage precisions accepted by from_arrays/from_dict
+_PRECISIONS = ("full", "mixed")
+
 
 def _create_format_dict(
     scales: DataFormat | None = None,
@@ -221,18 +291,46 @@ def _create_format_preset(
     :param opacities_format: Format for opacities (OPACITIES_PLY or OPACITIES_LINEAR)
     :param sh_degree: Spherical harmonics degree (0-3), default 0
     :param sh0_format: Format for sh0 (SH0_SH or SH0_RGB), default SH0_SH
-    :returns: Format dict with specified settings
+    :returns: Format dict with specified settings (a new dict the caller may modify)
     """
-    return _create_format_dict(
-        scales=scales_format,
-        opacities=opacities_format,
-        sh0=sh0_format,
-        sh_order=_get_sh_order_format(sh_degree),
-        means=DataFormat.MEANS_RAW,
-        quats=DataFormat.QUATS_RAW,
+    return dict(_format_preset_cached(scales_format, opacities_format, sh_degree, sh0_format))
+
+
+@lru_cache(maxsize=32)
+def _format_preset_cached(
+    scales_format: DataFormat,
+    opacities_format: DataFormat,
+    sh_degree: int,
+    sh0_format: DataFormat,
+) -> MappingProxyType:
+    """Build a format preset once per argument tuple (read-only; callers get a copy)."""
+    return MappingProxyType(
+        _create_format_dict(
+            scales=scales_format,
+            opacities=opacities_format,
+            sh0=sh0_format,
+            sh_order=_get_sh_order_format(sh_degree),
+            means=DataFormat.MEANS_RAW,
+            quats=DataFormat.QUATS_RAW,
+        )
     )
 
 
+def _lookup_format_preset(format: str) -> tuple[DataFormat, DataFormat]:
+    """Look up the (scales, opacities) formats of a from_arrays format preset name.
+
+    :param format: Preset name - "ply", "linear" or "rasterizer" ("auto" is handled by callers)
+    :returns: Tuple of (scales_format, opacities_format)
+    :raises ValueError: If format is not a known preset name
+    """
+    try:
+        return _FORMAT_PRESETS[format]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"Invalid format preset: {format}. Must be 'auto', 'ply', 'linear', or 'rasterizer'"
+        ) from None
+
+
 def create_ply_format(sh_degree: int = 0, sh0_format: DataFormat = DataFormat.SH0_SH) -> FormatDict:
     """Create format dict for PLY file format (log-scales, logit-opacities).
 
@@ -288,6 +386,124 @@ def create_rasterizer_format(
     )
 
 
+# Format detection thresholds (shared by the Numba scan and the classifier)
+_SCALES_PLY_NEGATIVE_RATIO = 0.1  # More negative scales than this -> log-scales
+_SCALES_LINEAR_MAX = 10.0  # Any |scale| above this -> log-scales
+_OPACITIES_PLY_IN_RANGE_RATIO = 0.9  # Fewer opacities in [0, 1] than this -> logits
+_OPACITIES_LINEAR_IN_RANGE_RATIO = 0.95  # More opacities in [0, 1] than this -> linear
+
+
+@jit(nopython=True, cache=True)
+def _format_stats_numba(scales, opacities):
+    """Compute the statistics used by _detect_format_from_values in one pass.
+
+    Each scan stops as soon as its format can only classify as PLY; the partial
+    statistics returned then classify the same way the full ones would.
+    No fastmath: a NaN scale must propagate to the max like np.max does.
+
+    :param scales: (N, K) scale array (any strides)
+    :param opacities: (M,) opacity array (any strides)
+    :returns: (negative scale count, max abs scale, count of opacities in [0, 1])
+    """
+    n_scales = scales.size
+    negative_count = 0
+    max_abs = 0.0
+    scales_decided = False
+    for i in range(scales.shape[0]):
+        for j in range(scales.shape[1]):
+            v = scales[i, j]
+            if v < 0:
+                negative_count += 1
+                if negative_count / n_scales > _SCALES_PLY_NEGATIVE_RATIO:
+                    scales_decided = True
+                    break
+            a = abs(v)
+            if a > max_abs or np.isnan(a):
+                max_abs = a
+                if a > _SCALES_LINEAR_MAX or np.isnan(a):
+                    scales_decided = True
+                    break
+        if scales_decided:
+            break
+
+    return negative_count, max_abs, _opacities_in_range_numba(opacities)
+
+
+@jit(nopython=True, cache=True)
+def _opacities_in_range_numba(opacities):
+    """Count opacities in [0, 1], stopping once they can only classify as PLY.
+
+    :param opacities: (M,) opacity array (any strides)
+    :returns: Count of opacities in [0, 1] (an upper bound if the scan stopped early)
+    """
+    n_opacities = opacities.shape[0]
+    out_of_range_count = 0
+    for i in range(n_opacities):
+        v = opacities[i]
+        if not (v >= 0 and v <= 1):
+            out_of_range_count += 1
+            in_range_bound = n_opacities - out_of_range_count
+            if in_range_bound / n_opacities <= _OPACITIES_LINEAR_IN_RANGE_RATIO:
+                return in_range_bound
+    return n_opacities - out_of_range_count
+
+
+# float32 bit patterns for the branch-free scale scan: IEEE-754 orders non-negative
+# floats like their bits (NaN above inf), so magnitudes compare as sign-cleared uint32
+_F32_SIGN_BIT = np.uint32(0x80000000)
+_F32_MAGNITUDE_MASK = np.uint32(0x7FFFFFFF)
+_SCALES_LINEAR_MAX_BITS = np.float32(_SCALES_LINEAR_MAX).view(np.uint32)
+_FORMAT_SCAN_BLOCK = 4096
+
+
+@jit(nopython=True, cache=True)
+def _scale_bits_block_stats_numba(block):
+    """Negative count and max sign-cleared bits of a block of float32 scale bits.
+
+    Branch-free so the loop vectorizes: a value is negative iff its bits exceed
+    the sign bit (-0.0 is not), and the largest sign-cleared bits belong to the
+    max |scale| (NaN included).
+
+    :param block: (B,) uint32 view of float32 scales
+    :returns: (negative count, max sign-cleared bits)
+    """
+    negative_count = 0
+    max_abs_bits = np.uint32(0)
+    for i in range(block.shape[0]):
+        bits = block[i]
+        negative_count += bits > _F32_SIGN_BIT
+        max_abs_bits = max(max_abs_bits, bits & _F32_MAGNITUDE_MASK)
+    return negative_count, max_abs_bits
+
+
+@jit(nopython=True, cache=True)
+def _format_stats_f32_bits_numba(scale_bits, opacities):
+    """Variant of _format_stats_numba for C-contiguous float32 scales.
+
+    Scans the raw bits of the flattened scales block by block (see
+    _scale_bits_block_stats_numba), checking the early exit between blocks.
+
+    :param scale_bits: (N*K,) uint32 view of the scales
+    :param opacities: (M,) opacity array (any strides)
+    :returns: (negative scale count, bits of the max abs scale, count of opacities in [0, 1])
+    """
+    n_scales = scale_bits.shape[0]
+    negative_count = 0
+    max_abs_bits = np.uint32(0)
+    for start in range(0, n_scales, _FORMAT_SCAN_BLOCK):
+        block_negative, block_max = _scale_bits_block_stats_numba(
+            scale_bits[start : start + _FORMAT_SCAN_BLOCK]
+        )
+        negative_count += block_negative
+        max_abs_bits = max(max_abs_bits, block_max)
+        if (
+            negative_count / n_scales > _SCALES_PLY_NEGATIVE_RATIO
+            or max_abs_bits > _SCALES_LINEAR_MAX_BITS
+        ):
+            break
+    return negative_count, max_abs_bits, _opacities_in_range_numba(opacities)
+
+
 def _detect_format_from_values(
     scales: np.ndarray, opacities: np.ndarray
 ) -> tuple[DataFormat, DataFormat]:
@@ -310,17 +526,55 @@ def _detect_format_from_values(
     if scales.size == 0 or opacities.size == 0:
         return DataFormat.SCALES_PLY, DataFormat.OPACITIES_PLY
 
+    if (
+        scales.ndim == 2
+        and opacities.ndim == 1
+        and scales.dtype in (np.float32, np.float64)
+        and opacities.dtype in (np.float32, np.float64)
+    ):
+        if (
+            scales.size >= _FORMAT_SCAN_BLOCK
+            and scales.dtype == np.float32
+            and scales.flags["C_CONTIGUOUS"]
+        ):
+            # Vectorized integer scan over the float bits (small inputs skip the
+            # extra view/bit-cast overhead)
+            negative_count, max_bits, in_range_count = _format_stats_f32_bits_numba(
+                scales.reshape(-1).view(np.uint32), opacities
+            )
+            max_scale = float(np.uint32(max_bits).view(np.float32))
+        else:
+            # Single pass, no temporaries (works on strided views from plyread)
+            negative_count, max_scale, in_range_count = _format_stats_numba(scales, opacities)
+    else:
+        negative_count = np.count_nonzero(scales < 0)
+        max_scale = np.max(np.abs(scales))
+        in_range_count = np.count_nonzero((opacities >= 0) & (opacities <= 1))
+
+    return _classify_format_stats(
+        negative_count / scales.size, max_scale, in_range_count / opacities.size
+    )
+
+
+def _classify_format_stats(
+    negative_ratio: float, max_scale: float, in_range_ratio: float
+) -> tuple[DataFormat, DataFormat]:
+    """Apply the format detection heuristics to precomputed statistics.
+
+    Shared by the NumPy and PyTorch detectors so both classify identically.
+
+    :param negative_ratio: Fraction of scale values below zero
+    :param max_scale: Largest absolute scale value (NaN if any scale is NaN)
+    :param in_range_ratio: Fraction of opacity values within [0, 1]
+    :returns: Tuple of (scales_format, opacities_format)
+    """
     # Check scales: PLY format (log-scales) often has negative values
     # Linear scales are typically positive
-    scales_flat = scales.flatten()
-    negative_ratio = np.sum(scales_flat < 0) / scales_flat.size
-    max_scale = np.max(np.abs(scales_flat))
-
     # If many negative values or very large values, likely PLY format (log-scales)
-    if negative_ratio > 0.1 or max_scale > 10.0:
+    if negative_ratio > _SCALES_PLY_NEGATIVE_RATIO or max_scale > _SCALES_LINEAR_MAX:
         scales_format = DataFormat.SCALES_PLY
     # If all positive and small, likely linear
-    elif negative_ratio == 0.0 and max_scale < 10.0:
+    elif negative_ratio == 0.0 and max_scale < _SCALES_LINEAR_MAX:
         scales_format = DataFormat.SCALES_LINEAR
     else:
         # Uncertain: default to PLY format (backward compatibility)
@@ -328,13 +582,11 @@ def _detect_format_from_values(
 
     # Check opacities: PLY format (logit-opacities) often outside [0, 1]
     # Linear opacities are typically in [0, 1]
-    in_range_ratio = np.sum((opacities >= 0) & (opacities <= 1)) / opacities.size
-
     # If mostly outside [0, 1], likely PLY format (logit-opacities)
-    if in_range_ratio < 0.9:
+    if in_range_ratio < _OPACITIES_PLY_IN_RANGE_RATIO:
         opacities_format = DataFormat.OPACITIES_PLY
     # If mostly in [0, 1], likely linear
-    elif in_range_ratio > 0.95:
+    elif in_range_ratio > _OPACITIES_LINEAR_IN_RANGE_RATIO:
         opacities_format = DataFormat.OPACITIES_LINEAR
     else:
         # Uncertain: default to PLY format (backward compatibility)
@@ -390,8 +642,110 @@ def _combine_masks_numba_or(masks):
     return result
 
 
-@dataclass
-class GSData:
+# Morton (Z-order) spatial sorting: 10 bits per axis -> 30-bit codes
+_MORTON_AXIS_MAX = 1023
+
+
+@numba.jit(nopython=True, cache=True, nogil=True)
+def _part1by2(v):
+    """Spread the low 10 bits of ``v`` so two zero bits separate each bit."""
+    v &= 0x3FF
+    v = (v | (v << 16)) & 0x030000FF
+    v = (v | (v << 8)) & 0x0300F00F
+    v = (v | (v << 4)) & 0x030C30C3
+    return (v | (v << 2)) & 0x09249249
+
+
+@numba.jit(nopython=True, parallel=True, cache=True, nogil=True)
+def _morton_codes_numba(means, lo, scale):
+    """Compute 30-bit Morton codes of positions quantized to a 1024^3 grid.
+
+    :param means: (N, 3) positions
+    :param lo: (3,) bounding box minimum
+    :param scale: (3,) grid cells per unit along each axis
+    :returns: uint32 array of shape (N,)
+    """
+    n = means.shape[0]
+    codes = np.empty(n, dtype=np.uint32)
+    for i in prange(n):
+        code = 0
+        for axis in range(3):
+            cell = (means[i, axis] - lo[axis]) * scale[axis]
+            cell = min(max(cell, 0.0), _MORTON_AXIS_MAX)
+            code |= _part1by2(np.int64(cell)) << (2 - axis)
+        codes[i] = code
+    return codes
+
+
+@numba.jit(nopython=True, cache=True, nogil=True)
+def _permute_rows_numba(rows, order):
+    """Reorder rows in place so that ``rows[j]`` becomes the old ``rows[order[j]]``.
+
+    Follows each permutation cycle with one row of scratch, so the extra memory
+    is an N-byte visited map instead of a second copy of the array.
+
+    :param rows: (N, C) array, modified in-place
+    :param order: (N,) permutation
+    """
+    n = rows.shape[0]
+    done = np.zeros(n, dtype=np.bool_)
+    tmp = np.empty(rows.shape[1], dtype=rows.dtype)
+    for start in range(n):
+        if done[start]:
+            continue
+        tmp[:] = rows[start]
+        j = start
+        while True:
+            done[j] = True
+            k = order[j]
+            if k == start:
+                rows[j] = tmp
+                break
+            rows[j] = rows[k]
+            j = k
+
+
+def _permute_rows_inplace(array: np.ndarray, order: np.ndarray) -> None:
+    """Apply ``array[:] = array[order]`` along axis 0 without a full temporary when possible."""
+    row_size = int(np.prod(array.shape[1:]))
+    rows = array[:, np.newaxis] if array.ndim == 1 else array.reshape(array.shape[0], row_size)
+    if not np.shares_memory(rows, array):
+        # reshape had to copy (strided >2-D array): fall back to a gather
+        array[...] = array[order]
+        return
+    if rows.dtype == np.float16:
+        # Numba has no float16 (precision="mixed"): move the same bits as uint16
+        rows = rows.view(np.uint16)
+    _permute_rows_numba(rows, order)
+
+
+def _aligned_copy(array: np.ndarray, align: int) -> np.ndarray:
+    """Copy ``array`` into a C-contiguous buffer whose data pointer is a multiple of ``align`` bytes.
+
+    :param array: Array to copy
+    :param align: Byte alignment (power of two, e.g. 64)
+    :returns: Aligned copy with the same shape and dtype
+    """
+    raw = np.empty(array.nbytes + align, dtype=np.uint8)
+    offset = -raw.ctypes.data % align
+    out = raw[offset : offset + array.nbytes].view(array.dtype).reshape(array.shape)
+    out[...] = array
+    return out
+
+
+class _WeakrefSlot:
+    """Base class giving slotted dataclasses a ``__weakref__`` slot.
+
+    ``@dataclass(slots=True)`` drops weak-reference support, and its
+    ``weakref_slot=True`` option needs Python 3.11; a slot inherited from a base
+    class works on every supported version.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+@dataclass(slots=True)
+class GSData(_WeakrefSlot):
     """Gaussian Splatting data container.
 
     This container holds Gaussian parameters, either as separate arrays
@@ -823,6 +1177,29 @@ class GSData:
         # Return filtered copy
         return self[combined_mask]
 
+    def to_ply_records(self) -> np.ndarray:
+        """View the Gaussians as a structured array of PLY vertex records.
+
+        Fields are named like the PLY properties (x, y, z, f_dc_*, f_rest_*, opacity,
+        scale_*, rot_*). The records are a zero-copy view of _base when it exists
+        (e.g. after plyread or consolidate()); otherwise the data is consolidated
+        first. The result can be written after a PLY header with ``tofile()``,
+        wrapped with ``memoryview`` or ``torch.frombuffer``, or compared field by field.
+
+        :returns: (N,) structured array with dtype PLY_VERTEX_DTYPE_BY_SH_DEGREE[sh_degree]
+        :raises ValueError: If the SH degree is not 0-3
+
+        Example:
+            >>> records = plyread("scene.ply").to_ply_records()
+            >>> bright = records[records["opacity"] > 0.0]
+        """
+        data = self.consolidate() if self._base is None else self
+        base = np.ascontiguousarray(data._base, dtype=np.float32)
+        sh_degree = PROPERTY_COUNT_TO_SH_DEGREE.get(base.shape[1])
+        if sh_degree is None:
+            raise ValueError(f"Unsupported property count for PLY records: {base.shape[1]}")
+        return base.view(PLY_VERTEX_DTYPE_BY_SH_DEGREE[sh_degree])[:, 0]
+
     def consolidate(self) -> "GSData":
         """Consolidate separate arrays into a single base array.
 
@@ -844,36 +1221,16 @@ class GSData:
             return self  # Already consolidated
 
         # Create base array with standard layout
-        n_gaussians = len(self)
-
-        # Ensure arrays are contiguous float32 for JIT
-        means = np.ascontiguousarray(self.means, dtype=np.float32)
-        sh0 = np.ascontiguousarray(self.sh0, dtype=np.float32)
-        opacities = np.ascontiguousarray(self.opacities.ravel(), dtype=np.float32)
-        scales = np.ascontiguousarray(self.scales, dtype=np.float32)
-        quats = np.ascontiguousarray(self.quats, dtype=np.float32)
-
-        # Determine property count and use appropriate JIT kernel
-        # Layout: means(3) + sh0(3) + shN(K*3) + opacity(1) + scales(3) + quats(4)
-        if self.shN is not None and self.shN.shape[1] > 0:
-            # SH1-3: use general kernel with variable SH coefficients
-            sh_bands = self.shN.shape[1]
-            sh_coeffs = sh_bands * 3  # Total coefficients (9, 24, or 45)
-            n_props = 14 + sh_coeffs
-
-            # Flatten shN from (N, bands, 3) to (N, bands*3)
-            shn_flat = np.ascontiguousarray(
-                self.shN.reshape(n_gaussians, sh_coeffs), dtype=np.float32
-            )
-
-            # Allocate and populate using JIT kernel
-            new_base = np.empty((n_gaussians, n_props), dtype=np.float32)
-            _interleave_shn_jit(means, sh0, shn_flat, opacities, scales, quats, new_base, sh_coeffs)
-        else:
-            # SH0: use optimized kernel (14 properties)
-            n_props = 14
-            new_base = np.empty((n_gaussians, n_props), dtype=np.float32)
-            _interleave_sh0_jit(means, sh0, opacities, scales, quats, new_base)
+        new_base = np.empty((len(self), _base_props(self.shN)), dtype=np.float32)
+        _fill_base(
+            new_base,
+            means=self.means,
+            scales=self.scales,
+            quats=self.quats,
+            opacities=self.opacities,
+            sh0=self.sh0,
+            shN=self.shN,
+        )
 
         # Recreate GSData with new base
         return GSData._recreate_from_base(
@@ -1251,7 +1608,7 @@ class GSData:
             _format=format_flag,  # Preserve format if all are same
         )
 
-    def make_contiguous(self, inplace: bool = True) -> "GSData":
+    def make_contiguous(self, inplace: bool = True, align: int | None = None) -> "GSData":
         """Convert all arrays to contiguous memory layout for better performance.
 
         When data is loaded from PLY files via _base arrays, all field arrays
@@ -1285,6 +1642,9 @@ class GSData:
 
         :param inplace: If True, modify arrays in-place and clear _base (default).
                         If False, return new GSData with contiguous arrays.
+        :param align: Optional byte alignment (e.g. 64 for AVX-512 cache lines).
+                      Arrays whose data pointer is not a multiple of it are
+                      copied into aligned buffers. NumPy alone only guarantees 16.
         :returns: Self if inplace=True, new GSData if inplace=False
 
         Example:
@@ -1301,25 +1661,34 @@ class GSData:
         See Also:
             is_contiguous: Check if arrays are already contiguous
         """
+
+        def is_ready(arr: np.ndarray) -> bool:
+            return arr.flags["C_CONTIGUOUS"] and (align is None or arr.ctypes.data % align == 0)
+
+        def convert(arr: np.ndarray | None) -> np.ndarray | None:
+            if arr is None or is_ready(arr):
+                return arr
+            return np.ascontiguousarray(arr) if align is None else _aligned_copy(arr, align)
+
         # Check if already contiguous
         if self._base is None:
             # No _base means separate arrays, likely already contiguous
             all_contiguous = all(
-                arr.flags["C_CONTIGUOUS"]
+                is_ready(arr)
                 for arr in [self.means, self.scales, self.quats, self.opacities, self.sh0]
                 if arr is not None
             )
-            if all_contiguous and (self.shN is None or self.shN.flags["C_CONTIGUOUS"]):
+            if all_contiguous and (self.shN is None or is_ready(self.shN)):
                 return self  # Already contiguous, nothing to do
 
         # Convert to contiguous arrays
-        means = np.ascontiguousarray(self.means)
-        scales = np.ascontiguousarray(self.scales)
-        quats = np.ascontiguousarray(self.quats)
-        opacities = np.ascontiguousarray(self.opacities)
-        sh0 = np.ascontiguousarray(self.sh0)
-        shN = np.ascontiguousarray(self.shN) if self.shN is not None else None  # noqa: N806
-        masks = np.ascontiguousarray(self.masks) if self.masks is not None else None
+        means = convert(self.means)
+        scales = convert(self.scales)
+        quats = convert(self.quats)
+        opacities = convert(self.opacities)
+        sh0 = convert(self.sh0)
+        shN = convert(self.shN)  # noqa: N806
+        masks = convert(self.masks)
 
         if inplace:
             # Modify in-place
@@ -1365,6 +1734,57 @@ class GSData:
 
         return all(arr.flags["C_CONTIGUOUS"] for arr in arrays_to_check)
 
+    def morton_order(self) -> np.ndarray:
+        """Permutation that sorts Gaussians by the Morton (Z-order) code of their means.
+
+        Positions are quantized to a 1024^3 grid over their bounding box and the
+        bits of the three cell coordinates are interleaved into a 30-bit code.
+
+        :returns: int64 index array of shape (N,)
+        """
+        means = np.asarray(self.means, dtype=np.float32)
+        if len(means) == 0:
+            return np.empty(0, dtype=np.int64)
+        lo = means.min(axis=0).astype(np.float64)
+        extent = means.max(axis=0).astype(np.float64) - lo
+        scale = (_MORTON_AXIS_MAX + 1) / np.maximum(extent, np.finfo(np.float32).tiny)
+        codes = _morton_codes_numba(means, lo, scale)
+        return np.argsort(codes, kind="stable")
+
+    def morton_sort(self, inplace: bool = True) -> "GSData":
+        """Reorder Gaussians along a Morton (Z-order) curve of their positions.
+
+        Spatially close Gaussians end up next to each other in memory, so each
+        256-Gaussian chunk of the compressed format covers a small region
+        (tighter quantization bounds) and spatial passes get better cache reuse.
+
+        :param inplace: If True, permute the arrays in place (default): the
+                        shared _base record (or each field array) is reordered
+                        by following permutation cycles, so no second copy of the
+                        data is allocated. If False, return a new reordered GSData.
+        :returns: Self if inplace=True, new GSData if inplace=False
+
+        Example:
+            >>> data = gsply.plyread("scene.ply")
+            >>> data.morton_sort()
+            >>> gsply.plywrite("scene.compressed.ply", data, compressed=True)
+        """
+        order = self.morton_order()
+        if not inplace:
+            return self[order]
+
+        if self._base is not None:
+            # Every field is a view into _base, so one pass reorders them all
+            arrays = [self._base]
+        else:
+            arrays = [self.means, self.scales, self.quats, self.opacities, self.sh0, self.shN]
+        if self.masks is not None:
+            arrays.append(self.masks)
+        for array in arrays:
+            if array is not None:
+                _permute_rows_inplace(array, order)
+        return self
+
     def unpack(self, include_shN: bool = True) -> tuple:
         """Unpack Gaussian data into tuple of arrays.
 
@@ -1534,8 +1954,12 @@ class GSData:
         from gsply.utils import _sh2rgb_inplace_jit
 
         if inplace:
-            # True in-place: modify self.sh0 directly using Numba JIT
-            _sh2rgb_inplace_jit(self.sh0, SH_C0)
+            # True in-place: modify self.sh0 directly (Numba JIT for float32/float64)
+            if self.sh0.dtype in (np.float32, np.float64):
+                _sh2rgb_inplace_jit(self.sh0, SH_C0)
+            else:
+                self.sh0 *= SH_C0
+                self.sh0 += 0.5
             self._base = None  # Invalidate _base since we modified arrays
             # Update format dict: sh0 is now in RGB format
             self._format["sh0"] = DataFormat.SH0_RGB
@@ -1576,19 +2000,23 @@ class GSData:
             >>> # Or create a copy if you need to keep RGB format
             >>> sh_data = data.to_sh(inplace=False)
         """
-        from gsply.formats import SH_C0
+        from gsply.formats import INV_SH_C0
         from gsply.utils import _rgb2sh_inplace_jit
 
         if inplace:
-            # True in-place: modify self.sh0 directly using Numba JIT
-            _rgb2sh_inplace_jit(self.sh0, 1.0 / SH_C0)
+            # True in-place: modify self.sh0 directly (Numba JIT for float32/float64)
+            if self.sh0.dtype in (np.float32, np.float64):
+                _rgb2sh_inplace_jit(self.sh0, INV_SH_C0)
+            else:
+                self.sh0 -= 0.5
+                self.sh0 *= INV_SH_C0
             self._base = None  # Invalidate _base since we modified arrays
             # Update format dict: sh0 is now in SH format
             self._format["sh0"] = DataFormat.SH0_SH
             return self
 
         # Create copy for non-inplace operation
-        sh = (self.sh0 - 0.5) / SH_C0
+        sh = (self.sh0 - 0.5) * INV_SH_C0
         return GSData(
             means=self.means,
             scales=self.scales,
@@ -1991,11 +2419,17 @@ class GSData:
         format: str = "auto",
         sh_degree: int | None = None,
         sh0_format: DataFormat = DataFormat.SH0_SH,
+        *,
+        consolidate: bool = False,
+        precision: str = "full",
+        order: str | None = None,
     ) -> "GSData":
         """Create GSData from individual arrays with format preset.
 
         Convenient factory method for creating GSData from external arrays
-        with automatic format detection or explicit format presets.
+        with automatic format detection or explicit format presets. Array shapes
+        are not validated here (construction stays O(1) per field); mismatches
+        surface in later operations, and plywrite(validate=True) checks them.
 
         :param means: (N, 3) array - Gaussian centers
         :param scales: (N, 3) array - Scale parameters
@@ -2006,6 +2440,14 @@ class GSData:
         :param format: Format preset - "auto" (detect), "ply" (log/logit), "linear" or "rasterizer" (linear)
         :param sh_degree: SH degree (0-3) - auto-detected from shN if None
         :param sh0_format: Format for sh0 (SH0_SH or SH0_RGB), default SH0_SH
+        :param consolidate: Pack the arrays into one interleaved _base buffer (see
+            consolidate()); costs a copy, speeds up plywrite and boolean masking
+        :param precision: "full" keeps the input dtypes; "mixed" stores every field except
+            means as float16, halving their memory (operations that rebuild a float32
+            _base buffer, such as consolidate(), return float32)
+        :param order: None keeps the input order; "morton" reorders the Gaussians along a
+            Morton (Z-order) curve of their means (see morton_sort()) without
+            modifying the input arrays
         :returns: GSData object with specified format
 
         Example:
@@ -2018,38 +2460,35 @@ class GSData:
             >>> # Explicit linear format (for rasterizer)
             >>> data = GSData.from_arrays(means, scales, quats, opacities, sh0, format="linear")
         """
-        # Determine SH degree
+        if precision not in _PRECISIONS:
+            raise ValueError(f"Invalid precision: {precision}. Must be 'full' or 'mixed'")
+        if order not in (None, "morton"):
+            raise ValueError(f"Invalid order: {order}. Must be None or 'morton'")
+        # Resolve explicit presets before touching the arrays (invalid ones fail in O(1))
+        if format != "auto":
+            scales_format, opacities_format = _lookup_format_preset(format)
+        if precision == "mixed":
+            if consolidate:
+                raise ValueError("consolidate=True cannot be combined with precision='mixed'")
+            scales = np.asarray(scales, dtype=np.float16)
+            quats = np.asarray(quats, dtype=np.float16)
+            opacities = np.asarray(opacities, dtype=np.float16)
+            sh0 = np.asarray(sh0, dtype=np.float16)
+            if shN is not None:
+                shN = np.asarray(shN, dtype=np.float16)  # noqa: N806
+
+        # Determine SH degree (no shN or 0 bands -> degree 0)
         if sh_degree is None:
-            if shN is not None and shN.shape[1] > 0:
-                sh_bands = shN.shape[1]
-                sh_degree = SH_BANDS_TO_DEGREE.get(sh_bands, 0)
-            else:
-                sh_degree = 0
+            sh_degree = 0 if shN is None else SH_BANDS_TO_DEGREE.get(shN.shape[1], 0)
 
         # Create format dict based on preset
         if format == "auto":
             # Auto-detect format from values
             scales_format, opacities_format = _detect_format_from_values(scales, opacities)
-            format_dict = _create_format_dict(
-                scales=scales_format,
-                opacities=opacities_format,
-                sh0=sh0_format,
-                sh_order=_get_sh_order_format(sh_degree),
-                means=DataFormat.MEANS_RAW,
-                quats=DataFormat.QUATS_RAW,
-            )
-        elif format == "ply":
-            # PLY format (log-scales, logit-opacities)
-            format_dict = create_ply_format(sh_degree=sh_degree, sh0_format=sh0_format)
-        elif format in ("linear", "rasterizer"):
-            # Linear/rasterizer format (linear scales, linear opacities)
-            format_dict = create_rasterizer_format(sh_degree=sh_degree, sh0_format=sh0_format)
-        else:
-            raise ValueError(
-                f"Invalid format preset: {format}. Must be 'auto', 'ply', 'linear', or 'rasterizer'"
-            )
+        # Shared read-only preset; __post_init__ makes the instance's own copy
+        format_dict = _format_preset_cached(scales_format, opacities_format, sh_degree, sh0_format)
 
-        return cls(
+        data = cls(
             means=means,
             scales=scales,
             quats=quats,
@@ -2061,6 +2500,12 @@ class GSData:
             _base=None,
             _format=format_dict,
         )
+        if consolidate:
+            # consolidate() allocates a fresh buffer, so sorting it in place is safe
+            data = data.consolidate()
+            return data.morton_sort(inplace=True) if order == "morton" else data
+        # Never permute the caller's arrays in place
+        return data.morton_sort(inplace=False) if order == "morton" else data
 
     @classmethod
     def from_dict(
@@ -2069,6 +2514,10 @@ class GSData:
         format: str = "auto",
         sh_degree: int | None = None,
         sh0_format: DataFormat = DataFormat.SH0_SH,
+        *,
+        consolidate: bool = False,
+        precision: str = "full",
+        order: str | None = None,
     ) -> "GSData":
         """Create GSData from dictionary with format preset.
 
@@ -2079,6 +2528,14 @@ class GSData:
         :param format: Format preset - "auto" (detect), "ply" (log/logit), "linear" or "rasterizer" (linear)
         :param sh_degree: SH degree (0-3) - auto-detected from shN if None
         :param sh0_format: Format for sh0 (SH0_SH or SH0_RGB), default SH0_SH
+        :param consolidate: Pack the arrays into one interleaved _base buffer (see
+            consolidate()); costs a copy, speeds up plywrite and boolean masking
+        :param precision: "full" keeps the input dtypes; "mixed" stores every field except
+            means as float16, halving their memory (operations that rebuild a float32
+            _base buffer, such as consolidate(), return float32)
+        :param order: None keeps the input order; "morton" reorders the Gaussians along a
+            Morton (Z-order) curve of their means (see morton_sort()) without
+            modifying the input arrays
         :returns: GSData object with specified format
 
         Example:
@@ -2104,4 +2561,73 @@ class GSData:
             format=format,
             sh_degree=sh_degree,
             sh0_format=sh0_format,
+            consolidate=consolidate,
+            precision=precision,
+            order=order,
         )
+
+    @classmethod
+    def from_arrays_batch(
+        cls,
+        data_dicts: list[dict],
+        format: str = "auto",
+        sh0_format: DataFormat = DataFormat.SH0_SH,
+    ) -> list["GSData"]:
+        """Create many consolidated GSData objects backed by one shared buffer.
+
+        All items are interleaved into a single float32 _base arena with one
+        allocation, and each returned GSData views its own row range of it (as
+        from_arrays(..., consolidate=True) would, but without one allocation per item).
+        The arena stays alive as long as any of the returned objects does.
+
+        :param data_dicts: Dictionaries with keys: means, scales, quats, opacities, sh0,
+            shN (optional); all items must have the same number of SH bands
+        :param format: Format preset - "auto" (detect per item), "ply" (log/logit),
+            "linear" or "rasterizer" (linear)
+        :param sh0_format: Format for sh0 (SH0_SH or SH0_RGB), default SH0_SH
+        :returns: List of GSData objects, in the order of data_dicts
+
+        Example:
+            >>> batch = GSData.from_arrays_batch([frame0_dict, frame1_dict], format="ply")
+            >>> print([len(data) for data in batch])
+        """
+        if not data_dicts:
+            return []
+
+        shNs = [d.get("shN") for d in data_dicts]  # noqa: N806
+        n_props = _base_props(shNs[0])
+        if any(_base_props(shN) != n_props for shN in shNs):
+            raise ValueError("All items of a batch must have the same number of SH bands")
+
+        sh_bands = (n_props - 14) // 3
+        if sh_bands != 0 and sh_bands not in SH_BANDS_TO_DEGREE:
+            raise ValueError(f"Unsupported number of SH bands: {sh_bands}")
+        sh_degree = SH_BANDS_TO_DEGREE.get(sh_bands, 0)
+        if format != "auto":
+            # Explicit preset: resolve once and share it (each GSData copies its _format)
+            format_dict = _format_preset_cached(
+                *_lookup_format_preset(format), sh_degree, sh0_format
+            )
+
+        offsets = np.zeros(len(data_dicts) + 1, dtype=np.int64)
+        np.cumsum([len(d["means"]) for d in data_dicts], out=offsets[1:])
+        arena = np.empty((int(offsets[-1]), n_props), dtype=np.float32)
+
+        batch = []
+        for i, d in enumerate(data_dicts):
+            base = arena[offsets[i] : offsets[i + 1]]
+            _fill_base(
+                base,
+                means=d["means"],
+                scales=d["scales"],
+                quats=d["quats"],
+                opacities=d["opacities"],
+                sh0=d["sh0"],
+                shN=shNs[i],
+            )
+            if format == "auto":
+                format_dict = _format_preset_cached(
+                    *_detect_format_from_values(d["scales"], d["opacities"]), sh_degree, sh0_format
+                )
+            batch.append(cls._recreate_from_base(base, format_flag=format_dict))
+        return batch
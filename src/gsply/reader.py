@@ -20,6 +20,7 @@ Performance:
 """
 
 import logging
+import mmap as mmap_module
 from pathlib import Path
 
 import numba
@@ -36,6 +37,7 @@ from gsply.formats import (
     INV_255,
     INV_1023,
     INV_2047,
+    INV_SH_C0,
     MASK_2_BIT,
     MASK_8_BIT,
     MASK_10_BIT,
@@ -50,7 +52,6 @@ from gsply.formats import (
     QUAT_NORM,
     SH_BANDS_TO_DEGREE,
     SH_C0,
-    detect_format,
     get_sh_degree_from_property_count,
 )
 
@@ -89,9 +90,6 @@ _CHUNK_SIZE_SHIFT = CHUNK_SIZE_SHIFT
 _SH_UNPACK_SCALE = 1.0 / 32.0  # 0.03125
 _SH_UNPACK_OFFSET = -127.5 * _SH_UNPACK_SCALE  # -3.984375
 
-# SH0 conversion constant (pre-computed inverse for multiplication)
-_INV_SH_C0 = 1.0 / SH_C0  # = 3.544907701811032
-
 # Header reading constants
 _HEADER_READ_CHUNK_SIZE = 8192  # bytes - typical header is 300-2000 bytes
 _MAX_HEADER_LINES = 200  # sanity limit to prevent infinite loops on malformed files
@@ -323,9 +321,9 @@ def _unpack_all_jit(
         color_g = min_g[chunk_idx] + cg * range_g[chunk_idx]
         color_b = min_b[chunk_idx] + cb * range_b[chunk_idx]
 
-        sh0[i, 0] = (color_r - 0.5) * _INV_SH_C0
-        sh0[i, 1] = (color_g - 0.5) * _INV_SH_C0
-        sh0[i, 2] = (color_b - 0.5) * _INV_SH_C0
+        sh0[i, 0] = (color_r - 0.5) * INV_SH_C0
+        sh0[i, 1] = (color_g - 0.5) * INV_SH_C0
+        sh0[i, 2] = (color_b - 0.5) * INV_SH_C0
 
         # --- Step 3.1: Opacity conversion ---
         if co > 0.0 and co < 1.0:
@@ -411,7 +409,7 @@ def _unpack_sh_jit(shN_data):  # noqa: N803
 # ======================================================================================
 
 
-def read_uncompressed(file_path: str | Path) -> GSData | None:  # noqa: PLR0911
+def read_uncompressed(file_path: str | Path, mmap: bool = False) -> GSData | None:
     """Read uncompressed Gaussian splatting PLY file with zero-copy optimization.
 
     Uses zero-copy views into a single base array for maximum performance.
@@ -422,6 +420,7 @@ def read_uncompressed(file_path: str | Path) -> GSData | None:  # noqa: PLR0911
     implemented with NumPy zero-copy views. JIT is only used for compressed format.
 
     :param file_path: Path to PLY file
+    :param mmap: Map the file instead of reading it (see :func:`plyread`)
     :returns: GSData container with zero-copy array views, or None if format
               is incompatible. The base array is kept alive to ensure views remain valid.
 
@@ -442,105 +441,126 @@ def read_uncompressed(file_path: str | Path) -> GSData | None:  # noqa: PLR0911
     try:
         # Single file handle optimization: read header and data in one go
         with open(file_path, "rb") as f:
-            # Use existing header reading function
             header_result = _read_header_fast(f)
             if header_result is None:
                 return None
-            header_lines, data_offset = header_result
-
-            # Parse header
-            vertex_count = None
-            is_binary_le = False
-            property_names = []
-
-            for line in header_lines:
-                if line.startswith("format "):
-                    format_type = line.split()[1]
-                    is_binary_le = format_type == "binary_little_endian"
-                elif line.startswith("element vertex "):
-                    vertex_count = int(line.split()[2])
-                elif line.startswith("property float "):
-                    prop_name = line.split()[2]
-                    property_names.append(prop_name)
-
-            # Validate format
-            if not is_binary_le or vertex_count is None:
-                return None
+            return _read_uncompressed_body(f, *header_result, use_mmap=mmap)
 
-            # Detect SH degree from property count
-            property_count = len(property_names)
-            sh_degree = get_sh_degree_from_property_count(property_count)
+    except (OSError, ValueError):
+        return None
 
-            if sh_degree is None:
-                return None
 
-            # Validate property names and order
-            expected_properties = EXPECTED_PROPERTIES_BY_SH_DEGREE[sh_degree]
-            if property_names != expected_properties:
-                return None
+def _read_uncompressed_body(
+    f, header_lines: list[str], data_offset: int, use_mmap: bool = False
+) -> GSData | None:
+    """Read an uncompressed payload from an open file whose header is already parsed.
 
-            # Seek to data position and read binary data
-            f.seek(data_offset)
-            data = np.fromfile(f, dtype=np.float32, count=vertex_count * property_count)
+    :param f: Open file handle in binary mode
+    :param header_lines: Header lines from _read_header_fast()
+    :param data_offset: Byte offset of the binary payload
+    :param use_mmap: Return views into a copy-on-write mapping of the file
+                     instead of reading the payload into memory
+    :returns: GSData with zero-copy views into one base array, or None if the
+              header does not describe a supported uncompressed layout
+    """
+    # Parse header
+    vertex_count = None
+    is_binary_le = False
+    property_names = []
 
-            if data.size != vertex_count * property_count:
-                return None
+    for line in header_lines:
+        if line.startswith("format "):
+            format_type = line.split()[1]
+            is_binary_le = format_type == "binary_little_endian"
+        elif line.startswith("element vertex "):
+            vertex_count = int(line.split()[2])
+        elif line.startswith("property float "):
+            prop_name = line.split()[2]
+            property_names.append(prop_name)
+
+    # Validate format
+    if not is_binary_le or vertex_count is None:
+        return None
 
-            data = data.reshape(vertex_count, property_count)
+    # Detect SH degree from property count
+    property_count = len(property_names)
+    sh_degree = get_sh_degree_from_property_count(property_count)
 
-        # Extract arrays as zero-copy views
-        means = data[:, 0:3]
-        sh0 = data[:, 3:6]
+    if sh_degree is None:
+        return None
 
-        # Use lookup table to eliminate branching
-        indices = _SLICE_INDICES[sh_degree]
+    # Validate property names and order
+    expected_properties = EXPECTED_PROPERTIES_BY_SH_DEGREE[sh_degree]
+    if property_names != expected_properties:
+        return None
 
-        # Handle SH coefficients (special case for degree 0)
-        if sh_degree == 0:
-            shN = np.zeros((vertex_count, 0, 3), dtype=np.float32)  # noqa: N806
-        else:
-            shN_flat = data[:, indices["shN_start"] : indices["shN_end"]]  # noqa: N806
-            num_sh_coeffs = shN_flat.shape[1]
-            # PLY stores SH coefficients channel-grouped: [R0..Rk, G0..Gk, B0..Bk]
-            # Reshape to [N, 3, K] then transpose to [N, K, 3] for gsplat convention
-            shN = shN_flat.reshape(vertex_count, 3, num_sh_coeffs // 3).transpose(0, 2, 1)  # noqa: N806
-
-        # Extract remaining properties using lookup indices
-        opacities = data[:, indices["opacity"]]
-        scales = data[:, indices["scales_start"] : indices["scales_end"]]
-        quats = data[:, indices["quats_start"] : indices["quats_end"]]
-
-        logger.debug(
-            f"[Gaussian PLY] Read uncompressed (fast): {vertex_count} Gaussians, SH degree {sh_degree}"
-        )
-
-        # Initialize masks to all True
-        num_gaussians = means.shape[0]
-        masks = np.ones(num_gaussians, dtype=bool)
-
-        # Return GSData with base array to keep views alive
-        return GSData(
-            means=means,
-            scales=scales,
-            quats=quats,
-            opacities=opacities,
-            sh0=sh0,
-            shN=shN,
-            masks=masks,
-            _base=data,  # Keep alive for zero-copy views
-            _format=_create_format_dict(
-                scales=DataFormat.SCALES_PLY,
-                opacities=DataFormat.OPACITIES_PLY,
-                sh0=DataFormat.SH0_SH,
-                sh_order=_get_sh_order_format(sh_degree),
-                means=DataFormat.MEANS_RAW,
-                quats=DataFormat.QUATS_RAW,
-            ),  # PLY files use log-scales and logit-opacities
-        )
+    if use_mmap:
+        # ACCESS_COPY: pages load lazily on first touch, and writes (normalize(),
+        # to_rgb(), ...) go to private pages instead of the file. The array keeps
+        # the mapping alive after f is closed.
+        mapping = mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_COPY)
+        count = min(vertex_count * property_count, max(len(mapping) - data_offset, 0) // 4)
+        data = np.frombuffer(mapping, dtype=np.float32, count=count, offset=data_offset)
+    else:
+        # Seek to data position and read binary data
+        f.seek(data_offset)
+        data = np.fromfile(f, dtype=np.float32, count=vertex_count * property_count)
 
-    except (OSError, ValueError):
+    if data.size != vertex_count * property_count:
         return None
 
+    data = data.reshape(vertex_count, property_count)
+
+    # Extract arrays as zero-copy views
+    means = data[:, 0:3]
+    sh0 = data[:, 3:6]
+
+    # Use lookup table to eliminate branching
+    indices = _SLICE_INDICES[sh_degree]
+
+    # Handle SH coefficients (special case for degree 0)
+    if sh_degree == 0:
+        shN = np.zeros((vertex_count, 0, 3), dtype=np.float32)  # noqa: N806
+    else:
+        shN_flat = data[:, indices["shN_start"] : indices["shN_end"]]  # noqa: N806
+        num_sh_coeffs = shN_flat.shape[1]
+        # PLY stores SH coefficients channel-grouped: [R0..Rk, G0..Gk, B0..Bk]
+        # Reshape to [N, 3, K] then transpose to [N, K, 3] for gsplat convention
+        shN = shN_flat.reshape(vertex_count, 3, num_sh_coeffs // 3).transpose(0, 2, 1)  # noqa: N806
+
+    # Extract remaining properties using lookup indices
+    opacities = data[:, indices["opacity"]]
+    scales = data[:, indices["scales_start"] : indices["scales_end"]]
+    quats = data[:, indices["quats_start"] : indices["quats_end"]]
+
+    logger.debug(
+        f"[Gaussian PLY] Read uncompressed (fast): {vertex_count} Gaussians, SH degree {sh_degree}"
+    )
+
+    # Initialize masks to all True
+    num_gaussians = means.shape[0]
+    masks = np.ones(num_gaussians, dtype=bool)
+
+    # Return GSData with base array to keep views alive
+    return GSData(
+        means=means,
+        scales=scales,
+        quats=quats,
+        opacities=opacities,
+        sh0=sh0,
+        shN=shN,
+        masks=masks,
+        _base=data,  # Keep alive for zero-copy views
+        _format=_create_format_dict(
+            scales=DataFormat.SCALES_PLY,
+            opacities=DataFormat.OPACITIES_PLY,
+            sh0=DataFormat.SH0_SH,
+            sh_order=_get_sh_order_format(sh_degree),
+            means=DataFormat.MEANS_RAW,
+            quats=DataFormat.QUATS_RAW,
+        ),  # PLY files use log-scales and logit-opacities
+    )
+
 
 # ======================================================================================
 # COMPRESSED PLY READER
@@ -802,33 +822,43 @@ def read_compressed(file_path: str | Path) -> GSData | None:
             if not _is_compressed_format(header_lines):
                 return None
 
-            # Parse element info using shared helper
-            elements = _parse_elements_from_header(header_lines)
+            return _read_compressed_body(f, header_lines, data_offset)
 
-            # Seek to data and read binary from same file handle
-            f.seek(data_offset)
+    except (OSError, ValueError):
+        return None
+
+
+def _read_compressed_body(f, header_lines: list[str], data_offset: int) -> GSData:
+    """Read and decompress a compressed payload from an open file.
+
+    :param f: Open file handle in binary mode
+    :param header_lines: Header lines from _read_header_fast(), already known to
+                         describe the compressed format
+    :param data_offset: Byte offset of the binary payload
+    :returns: GSData with decompressed Gaussian parameters
+    """
+    # Parse element info using shared helper
+    elements = _parse_elements_from_header(header_lines)
 
-            num_chunks = elements["chunk"]["count"]
-            chunk_data = np.fromfile(f, dtype=np.float32, count=num_chunks * 18)
-            chunk_data = chunk_data.reshape(num_chunks, 18)
+    # Seek to data and read binary from same file handle
+    f.seek(data_offset)
 
-            num_vertices = elements["vertex"]["count"]
-            vertex_data = np.fromfile(f, dtype=np.uint32, count=num_vertices * 4)
-            vertex_data = vertex_data.reshape(num_vertices, 4)
+    num_chunks = elements["chunk"]["count"]
+    chunk_data = np.fromfile(f, dtype=np.float32, count=num_chunks * 18)
+    chunk_data = chunk_data.reshape(num_chunks, 18)
 
-            shN_data = None  # noqa: N806
-            if "sh" in elements:
-                num_sh_coeffs = len(elements["sh"]["properties"])
-                shN_data = np.fromfile(f, dtype=np.uint8, count=num_vertices * num_sh_coeffs)  # noqa: N806
-                shN_data = shN_data.reshape(num_vertices, num_sh_coeffs)  # noqa: N806
+    num_vertices = elements["vertex"]["count"]
+    vertex_data = np.fromfile(f, dtype=np.uint32, count=num_vertices * 4)
+    vertex_data = vertex_data.reshape(num_vertices, 4)
 
-        # Decompress using shared internal function
-        return _decompress_data_internal(
-            chunk_data, vertex_data, shN_data, num_vertices, num_chunks
-        )
+    shN_data = None  # noqa: N806
+    if "sh" in elements:
+        num_sh_coeffs = len(elements["sh"]["properties"])
+        shN_data = np.fromfile(f, dtype=np.uint8, count=num_vertices * num_sh_coeffs)  # noqa: N806
+        shN_data = shN_data.reshape(num_vertices, num_sh_coeffs)  # noqa: N806
 
-    except (OSError, ValueError):
-        return None
+    # Decompress using shared internal function
+    return _decompress_data_internal(chunk_data, vertex_data, shN_data, num_vertices, num_chunks)
 
 
 def decompress_from_bytes(compressed_bytes: bytes) -> GSData:
@@ -883,15 +913,25 @@ def decompress_from_bytes(compressed_bytes: bytes) -> GSData:
 # ======================================================================================
 
 
-def plyread(file_path: str | Path) -> GSData:
+def plyread(file_path: str | Path, mmap: bool = False) -> GSData:
     """Read Gaussian splatting PLY file (auto-detect format).
 
     Automatically detects and reads both compressed and uncompressed formats.
-    Uses formats.detect_format() for fast format detection.
+    The file is opened and its header parsed once; the format is detected from
+    that header and the payload read through the same handle.
 
     All reads use zero-copy optimization for maximum performance.
 
+    With ``mmap=True`` an uncompressed file is memory-mapped instead of read:
+    the call returns almost immediately and pages are loaded on first access,
+    which suits large files of which only part is used. The mapping is
+    copy-on-write, so in-place edits never reach the file. Do not overwrite or
+    truncate the file while the returned data is alive (accessing a truncated
+    mapping crashes the process; on Windows the file cannot be replaced). The
+    option is ignored for compressed files, which are always decoded into memory.
+
     :param file_path: Path to PLY file
+    :param mmap: Memory-map uncompressed files instead of reading them
     :returns: GSData container with Gaussian parameters
     :raises ValueError: If file format is not recognized or invalid
 
@@ -911,14 +951,20 @@ def plyread(file_path: str | Path) -> GSData:
     """
     file_path = Path(file_path)
 
-    # Detect format first
-    is_compressed, sh_degree = detect_format(file_path)
-
-    # Try appropriate reader based on format
-    if is_compressed:
-        result = read_compressed(file_path)
-    else:
-        result = read_uncompressed(file_path)
+    # Open and parse the header once, then dispatch on it with the same handle
+    # (rather than detect_format() followed by a reader re-parsing the header)
+    result = None
+    try:
+        with open(file_path, "rb") as f:
+            header_result = _read_header_fast(f)
+            if header_result is not None:
+                header_lines, data_offset = header_result
+                if _is_compressed_format(header_lines):
+                    result = _read_compressed_body(f, header_lines, data_offset)
+                else:
+                    result = _read_uncompressed_body(f, header_lines, data_offset, use_mmap=mmap)
+    except (OSError, ValueError):
+        result = None
 
     if result is not None:
         return result
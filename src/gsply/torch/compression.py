@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 import torch
 
-from gsply.formats import CHUNK_SIZE, SH_C0
+from gsply.formats import CHUNK_SIZE, INV_SH_C0, SH_C0
 
 if TYPE_CHECKING:
     from gsply.torch.gstensor import GSTensor
@@ -45,9 +45,6 @@ _NORM_FACTOR = 1.4142135623730951 * 0.5  # sqrt(2) * 0.5, pre-computed
 # Using + 0.5 before int conversion is faster than torch.round() and matches CPU behavior
 _ROUNDING_OFFSET = 0.5
 
-# SH conversion constant
-_INV_SH_C0 = 1.0 / SH_C0  # 1.0 / 0.28209479177387814 = 3.544907701811032
-
 # Quaternion permutation table (Phase 2B: cached for gather-based unpacking)
 # Shape: (4, 4) - for each 'which' value [0-3], the permutation of [m, a, b, c]
 # Cache keyed by device to avoid global state issues
@@ -231,7 +228,7 @@ def _unpack_colors_and_opacities_gpu(
     color_rgb = min_color + normalized_color * range_color
 
     # Convert RGB to SH0: sh0 = (color - 0.5) / SH_C0 (use pre-computed constant)
-    sh0 = (color_rgb - 0.5) * _INV_SH_C0
+    sh0 = (color_rgb - 0.5) * INV_SH_C0
 
     # Convert opacity from linear to logit space
     # opacity = -log(1/x - 1)
@@ -354,7 +351,8 @@ def decompress_gpu(
     else:
         # CPU path: separate transfers (no benefit from batching)
         chunk_bounds = torch.from_numpy(chunk_data).to(device)
-        vertex_packed = torch.from_numpy(vertex_data.astype(np.int32)).to(device)
+        # Reinterpret uint32 as int32 (same bits) without copying
+        vertex_packed = torch.from_numpy(vertex_data.view(np.int32)).to(device)
 
     # Phase 4A: Use views instead of reshape to avoid redundant operations
     # Extract packed components directly using view (more efficient than reshape)
@@ -736,8 +734,9 @@ def compress_gpu(
         packed_sh = packed_sh.cpu().numpy()
 
     # Transfer to CPU
-    chunk_bounds_np = chunk_bounds.cpu().numpy().astype(np.float32)
-    packed_vertex_np = packed_vertex.cpu().numpy().astype(np.uint32)
+    # Packed words are int32 on device; reinterpret as uint32 (same bits) without copying
+    chunk_bounds_np = chunk_bounds.cpu().numpy().astype(np.float32, copy=False)
+    packed_vertex_np = packed_vertex.cpu().numpy().view(np.uint32)
 
     logger.debug(f"[GPU Compression] Compressed {num_gaussians:,} Gaussians ({num_chunks} chunks)")
 
@@ -8,19 +8,23 @@ from pathlib import Path
 import numpy as np
 import torch
 
-from gsply.formats import SH_BANDS_TO_DEGREE, SH_C0
+from gsply.formats import INV_SH_C0, SH_BANDS_TO_DEGREE, SH_C0
 
 # Import DataFormat, FormatDict, GSData, and helpers from gsdata
 # No circular dependency - gsdata.py doesn't import GSTensor
 from gsply.gsdata import (
+    _MORTON_AXIS_MAX,
+    _PRECISIONS,
     DataFormat,
     FormatDict,
     GSData,
+    _classify_format_stats,
     _create_format_dict,
     _detect_format_from_values,
+    _format_preset_cached,
     _get_sh_order_format,
-    create_ply_format,
-    create_rasterizer_format,
+    _lookup_format_preset,
+    _WeakrefSlot,
 )
 
 # Import compression functions (no circular dependency - compression.py only imports GSTensor for type hints)
@@ -30,8 +34,137 @@ from gsply.torch.compression import read_compressed_gpu, write_compressed_gpu
 # (writer.py and reader.py import GSData at module level, creating circular imports)
 
 
-@dataclass
-class GSTensor:
+def _as_tensor(value: torch.Tensor | np.ndarray) -> torch.Tensor:
+    """Wrap an array as a tensor without copying (tensors pass through unchanged).
+
+    ``torch.from_numpy`` shares the buffer like ``torch.as_tensor`` does, but with
+    about a third of the per-call overhead.
+
+    :param value: Tensor, NumPy array or other array-like
+    :returns: Tensor (sharing memory with value when it is a tensor or ndarray)
+    """
+    if isinstance(value, torch.Tensor):
+        return value
+    if isinstance(value, np.ndarray):
+        return torch.from_numpy(value)
+    return torch.as_tensor(value)
+
+
+def _to_device_dtype(
+    tensor: torch.Tensor, device: torch.device, dtype: torch.dtype
+) -> torch.Tensor:
+    """Move and cast a tensor so that the cross-device copy uses the smaller dtype.
+
+    A blocking ``tensor.to(device=..., dtype=...)`` between CPU and GPU converts
+    on the CPU side, so a widening cast would transfer the widened data.
+
+    :param tensor: Source tensor
+    :param device: Target device
+    :param dtype: Target dtype
+    :returns: Tensor on device with dtype (the input itself if already matching)
+    """
+    if tensor.dtype == dtype and tensor.device == device:
+        # Skip the .to() dispatch entirely (it costs ~1 us even when it is a no-op)
+        return tensor
+    if tensor.device == device or tensor.dtype == dtype:
+        return tensor.to(device=device, dtype=dtype)
+    if dtype.itemsize < tensor.dtype.itemsize:
+        # Narrowing: cast on the source device, transfer fewer bytes
+        return tensor.to(dtype=dtype).to(device=device)
+    # Widening: transfer the narrow data, cast on the target device
+    return tensor.to(device=device).to(dtype=dtype)
+
+
+def _pinned_to_device(
+    tensors: list[torch.Tensor], device: torch.device, dtype: torch.dtype
+) -> list[torch.Tensor]:
+    """Move CPU tensors to a CUDA device with one pinned host-to-device copy.
+
+    The tensors are cast into a single page-locked staging buffer, copied with
+    one asynchronous transfer (ordered on the current stream) and returned as
+    views of the flat device buffer. Tensors the caller already pinned (e.g. host
+    buffers reused across a chunked load) are copied as they are, skipping the
+    staging allocation and the host-side copy into it; those copies are waited on
+    before returning, so the caller may refill its buffers right away.
+
+    :param tensors: CPU source tensors
+    :param device: Target CUDA device
+    :param dtype: Target dtype
+    :returns: Device tensors with the shapes of the inputs
+    """
+    if all(
+        tensor.dtype == dtype and tensor.is_contiguous() and tensor.is_pinned()
+        for tensor in tensors
+    ):
+        copies = [tensor.to(device=device, non_blocking=True) for tensor in tensors]
+        # The copies read the caller's buffers asynchronously: finish them before
+        # the caller can overwrite those buffers (the staging path owns its buffer)
+        torch.cuda.current_stream(device).synchronize()
+        return copies
+
+    sizes = [tensor.numel() for tensor in tensors]
+    staging = torch.empty(sum(sizes), dtype=dtype, pin_memory=True)
+    for tensor, chunk in zip(tensors, staging.split(sizes), strict=True):
+        chunk.copy_(tensor.reshape(-1))
+    flat = staging.to(device=device, non_blocking=True)
+    return [
+        chunk.view(tensor.shape) for tensor, chunk in zip(tensors, flat.split(sizes), strict=True)
+    ]
+
+
+def _part1by2(v: torch.Tensor) -> torch.Tensor:
+    """Spread the low 10 bits of each element so two zero bits separate each bit."""
+    v = v & 0x3FF
+    v = (v | (v << 16)) & 0x030000FF
+    v = (v | (v << 8)) & 0x0300F00F
+    v = (v | (v << 4)) & 0x030C30C3
+    return (v | (v << 2)) & 0x09249249
+
+
+def _detect_format_from_tensors(
+    scales: torch.Tensor, opacities: torch.Tensor
+) -> tuple[DataFormat, DataFormat]:
+    """Detect format from scale and opacity tensors (same heuristic as GSData).
+
+    CPU float32/float64 tensors are viewed as NumPy arrays (zero-copy) and use
+    the Numba detector. Other devices reduce on-device and copy back only three
+    scalars instead of the full scale and opacity arrays.
+
+    :param scales: Scale tensor (N, 3)
+    :param opacities: Opacity tensor (N,)
+    :returns: Tuple of (scales_format, opacities_format)
+    """
+    scales = scales.detach()
+    opacities = opacities.detach()
+    if (
+        scales.device.type == "cpu"
+        and opacities.device.type == "cpu"
+        and scales.dtype in (torch.float32, torch.float64)
+        and opacities.dtype in (torch.float32, torch.float64)
+    ):
+        return _detect_format_from_values(scales.numpy(), opacities.numpy())
+
+    if scales.numel() == 0 or opacities.numel() == 0:
+        return DataFormat.SCALES_PLY, DataFormat.OPACITIES_PLY
+
+    # Linear scales need no negative value at all, so one min/max pass decides the
+    # scale format exactly (NaN propagates through aminmax and classifies as PLY)
+    min_scale, max_scale = torch.aminmax(scales)
+    stats = torch.stack(
+        [
+            min_scale.double(),
+            max_scale.double(),
+            ((opacities >= 0) & (opacities <= 1)).sum(dtype=torch.float64) / opacities.numel(),
+        ]
+    )
+    min_scale, max_scale, in_range_ratio = stats.tolist()
+    # Any negative (or NaN) scale classifies as PLY, whatever the exact ratio
+    negative_ratio = 0.0 if min_scale >= 0 else 1.0
+    return _classify_format_stats(negative_ratio, max_scale, in_range_ratio)
+
+
+@dataclass(slots=True)
+class GSTensor(_WeakrefSlot):
     """GPU-accelerated Gaussian Splatting data container using PyTorch tensors.
 
     This container holds Gaussian parameters as PyTorch tensors, supporting both
@@ -90,10 +223,9 @@ class GSTensor:
 
         # If _format is empty dict, auto-detect from values
         if not self._format:
-            # Convert tensors to numpy for format detection
-            scales_np = self.scales.detach().cpu().numpy()
-            opacities_np = self.opacities.detach().cpu().numpy()
-            scales_format, opacities_format = _detect_format_from_values(scales_np, opacities_np)
+            scales_format, opacities_format = _detect_format_from_tensors(
+                self.scales, self.opacities
+            )
             self._format = _create_format_dict(
                 scales=scales_format,
                 opacities=opacities_format,
@@ -367,7 +499,7 @@ class GSTensor:
             base_array = np.ascontiguousarray(data._base)
 
             # Single tensor transfer (zero CPU copy if already contiguous)
-            base_tensor = torch.from_numpy(base_array).to(device=device_obj, dtype=dtype)
+            base_tensor = _to_device_dtype(torch.from_numpy(base_array), device_obj, dtype)
             base_tensor.requires_grad_(requires_grad)
 
             # Transfer masks separately if present
@@ -418,7 +550,7 @@ class GSTensor:
         base_cpu[:, opacity_idx + 4 : opacity_idx + 8] = data.quats
 
         # Single GPU transfer (2x faster than 5 separate transfers)
-        base_tensor = torch.from_numpy(base_cpu).to(device=device_obj, dtype=dtype)
+        base_tensor = _to_device_dtype(torch.from_numpy(base_cpu), device_obj, dtype)
         base_tensor.requires_grad_(requires_grad)
 
         # Transfer masks separately
@@ -727,14 +859,14 @@ class GSTensor:
         """
         if inplace:
             # True in-place: modify self.sh0 directly using PyTorch in-place operations
-            self.sh0.sub_(0.5).div_(SH_C0)
+            self.sh0.sub_(0.5).mul_(INV_SH_C0)
             self._base = None  # Invalidate _base since we modified tensors
             # Update format dict: sh0 is now in SH format
             self._format["sh0"] = DataFormat.SH0_SH
             return self
 
         # Create copy for non-inplace operation
-        sh = (self.sh0 - 0.5) / SH_C0
+        sh = (self.sh0 - 0.5) * INV_SH_C0
         return GSTensor(
             means=self.means,
             scales=self.scales,
@@ -885,7 +1017,8 @@ class GSTensor:
         # Handle shN if present
         if self.shN is not None and self.shN.shape[1] > 0:
             sh_coeffs = self.shN.shape[1]
-            shN_flat = self.shN.reshape(n_gaussians, sh_coeffs * 3)
+            # Channel-major (N, 3*K) like f_rest_*, matching _recreate_from_base
+            shN_flat = self.shN.transpose(1, 2).reshape(n_gaussians, sh_coeffs * 3)
             new_base[:, 6 : 6 + sh_coeffs * 3] = shN_flat
             opacity_idx = 6 + sh_coeffs * 3
         else:
@@ -1399,6 +1532,58 @@ class GSTensor:
             _format=format_flag,  # Preserve format flag
         )
 
+    def morton_order(self) -> torch.Tensor:
+        """Permutation that sorts Gaussians by the Morton (Z-order) code of their means.
+
+        Uses the same quantization as GSData.morton_order() (1024^3 grid over the
+        bounding box, 30-bit interleaved codes), computed on the tensors' device.
+
+        :returns: int64 index tensor of shape (N,) on the same device
+        """
+        # float32 positions with float64 grid math, matching the Numba kernel
+        means = self.means.detach().float().double()
+        if means.shape[0] == 0:
+            return torch.empty(0, dtype=torch.int64, device=means.device)
+        lo, hi = torch.aminmax(means, dim=0)
+        extent = torch.clamp(hi - lo, min=float(np.finfo(np.float32).tiny))
+        cells = torch.clamp((means - lo) * ((_MORTON_AXIS_MAX + 1) / extent), 0, _MORTON_AXIS_MAX)
+        cells = cells.to(torch.int64)
+        codes = (
+            (_part1by2(cells[:, 0]) << 2) | (_part1by2(cells[:, 1]) << 1) | _part1by2(cells[:, 2])
+        )
+        return torch.argsort(codes, stable=True)
+
+    def morton_sort(self, inplace: bool = True) -> GSTensor:
+        """Reorder Gaussians along a Morton (Z-order) curve of their positions.
+
+        Torch counterpart of GSData.morton_sort(). The reordered tensors are
+        gathered in one indexing pass (over _base when present); with inplace=True
+        this object's fields are rebound to them, so tensors held elsewhere are not
+        modified.
+
+        :param inplace: If True, reorder this object (default). If False, return a
+                        new reordered GSTensor.
+        :returns: Self if inplace=True, new GSTensor if inplace=False
+
+        Example:
+            >>> gstensor = GSTensor.from_gsdata(gsply.plyread("scene.ply"), device="cuda")
+            >>> gstensor.morton_sort()
+            >>> gstensor.save("scene.compressed.ply")
+        """
+        reordered = self[self.morton_order()]
+        if not inplace:
+            return reordered
+
+        self.means = reordered.means
+        self.scales = reordered.scales
+        self.quats = reordered.quats
+        self.opacities = reordered.opacities
+        self.sh0 = reordered.sh0
+        self.shN = reordered.shN
+        self.masks = reordered.masks
+        self._base = reordered._base
+        return self
+
     def unpack(self, include_shN: bool = True) -> tuple:
         """Unpack Gaussian data into tuple of tensors.
 
@@ -1541,34 +1726,47 @@ class GSTensor:
     @classmethod
     def from_arrays(
         cls,
-        means: torch.Tensor,
-        scales: torch.Tensor,
-        quats: torch.Tensor,
-        opacities: torch.Tensor,
-        sh0: torch.Tensor,
-        shN: torch.Tensor | None = None,
+        means: torch.Tensor | np.ndarray,
+        scales: torch.Tensor | np.ndarray,
+        quats: torch.Tensor | np.ndarray,
+        opacities: torch.Tensor | np.ndarray,
+        sh0: torch.Tensor | np.ndarray,
+        shN: torch.Tensor | np.ndarray | None = None,
         format: str = "auto",
         sh_degree: int | None = None,
         sh0_format: DataFormat = DataFormat.SH0_SH,
         device: str | torch.device | None = None,
         dtype: torch.dtype | None = None,
+        *,
+        consolidate: bool = False,
+        precision: str = "full",
+        order: str | None = None,
     ) -> GSTensor:
         """Create GSTensor from individual tensors with format preset.
 
         Convenient factory method for creating GSTensor from external tensors
-        with automatic format detection or explicit format presets.
-
-        :param means: (N, 3) tensor - Gaussian centers
-        :param scales: (N, 3) tensor - Scale parameters
-        :param quats: (N, 4) tensor - Rotation quaternions
-        :param opacities: (N,) tensor - Opacity values
-        :param sh0: (N, 3) tensor - DC spherical harmonics
-        :param shN: (N, K, 3) tensor or None - Higher-order SH coefficients
+        with automatic format detection or explicit format presets. NumPy arrays
+        are wrapped without copying when no device or dtype change is needed.
+        Shapes are not validated; mismatches surface in later operations.
+
+        :param means: (N, 3) tensor or array - Gaussian centers
+        :param scales: (N, 3) tensor or array - Scale parameters
+        :param quats: (N, 4) tensor or array - Rotation quaternions
+        :param opacities: (N,) tensor or array - Opacity values
+        :param sh0: (N, 3) tensor or array - DC spherical harmonics
+        :param shN: (N, K, 3) tensor, array or None - Higher-order SH coefficients
         :param format: Format preset - "auto" (detect), "ply" (log/logit), "linear" or "rasterizer" (linear)
         :param sh_degree: SH degree (0-3) - auto-detected from shN if None
         :param sh0_format: Format for sh0 (SH0_SH or SH0_RGB), default SH0_SH
         :param device: Target device - inferred from tensors if None
         :param dtype: Target dtype - inferred from tensors if None
+        :param consolidate: Pack the tensors into one interleaved _base tensor (see
+            consolidate()); costs a copy, speeds up boolean masking
+        :param precision: "full" uses dtype for every field; "mixed" keeps means in dtype
+            and stores the other fields as float16, halving their memory
+        :param order: None keeps the input order; "morton" reorders the Gaussians along a
+            Morton (Z-order) curve of their means (see morton_sort()) without
+            modifying the input tensors
         :returns: GSTensor object with specified format
 
         Example:
@@ -1581,56 +1779,67 @@ class GSTensor:
             >>> # Explicit linear format (for rasterizer)
             >>> gstensor = GSTensor.from_arrays(means, scales, quats, opacities, sh0, format="linear", device="cuda")
         """
+        if precision not in _PRECISIONS:
+            raise ValueError(f"Invalid precision: {precision}. Must be 'full' or 'mixed'")
+        if precision == "mixed" and consolidate:
+            raise ValueError("consolidate=True cannot be combined with precision='mixed'")
+        if order not in (None, "morton"):
+            raise ValueError(f"Invalid order: {order}. Must be None or 'morton'")
+        # Resolve explicit presets before touching the tensors (invalid ones fail in O(1))
+        if format != "auto":
+            scales_format, opacities_format = _lookup_format_preset(format)
+
+        # Wrap NumPy arrays zero-copy (tensors pass through unchanged)
+        means = _as_tensor(means)
+        scales = _as_tensor(scales)
+        quats = _as_tensor(quats)
+        opacities = _as_tensor(opacities)
+        sh0 = _as_tensor(sh0)
+        if shN is not None:
+            shN = _as_tensor(shN)
+
         # Infer device and dtype from first tensor if not provided
         if device is None:
             device = means.device
         if dtype is None:
             dtype = means.dtype
 
+        field_dtype = torch.float16 if precision == "mixed" else dtype
+
         # Ensure all tensors are on correct device and dtype
         device_obj = torch.device(device)
-        means = means.to(device=device_obj, dtype=dtype)
-        scales = scales.to(device=device_obj, dtype=dtype)
-        quats = quats.to(device=device_obj, dtype=dtype)
-        opacities = opacities.to(device=device_obj, dtype=dtype)
-        sh0 = sh0.to(device=device_obj, dtype=dtype)
-        if shN is not None:
-            shN = shN.to(device=device_obj, dtype=dtype)
-
-        # Determine SH degree
+        fields = [means, scales, quats, opacities, sh0] + ([] if shN is None else [shN])
+        if (
+            device_obj.type == "cuda"
+            and field_dtype == dtype
+            and all(field.device.type == "cpu" for field in fields)
+        ):
+            # One pinned transfer instead of a blocking pageable copy per field
+            # (caller-pinned inputs are copied directly)
+            fields = _pinned_to_device(fields, device_obj, dtype)
+            means, scales, quats, opacities, sh0 = fields[:5]
+            shN = fields[5] if shN is not None else None
+        else:
+            means = _to_device_dtype(means, device_obj, dtype)
+            scales = _to_device_dtype(scales, device_obj, field_dtype)
+            quats = _to_device_dtype(quats, device_obj, field_dtype)
+            opacities = _to_device_dtype(opacities, device_obj, field_dtype)
+            sh0 = _to_device_dtype(sh0, device_obj, field_dtype)
+            if shN is not None:
+                shN = _to_device_dtype(shN, device_obj, field_dtype)
+
+        # Determine SH degree (no shN or 0 bands -> degree 0)
         if sh_degree is None:
-            if shN is not None and shN.shape[1] > 0:
-                sh_bands = int(shN.shape[1])
-                sh_degree = SH_BANDS_TO_DEGREE.get(sh_bands, 0)
-            else:
-                sh_degree = 0
+            sh_degree = 0 if shN is None else SH_BANDS_TO_DEGREE.get(int(shN.shape[1]), 0)
 
         # Create format dict based on preset
         if format == "auto":
-            # Auto-detect format from values (convert to numpy for detection)
-            scales_np = scales.detach().cpu().numpy()
-            opacities_np = opacities.detach().cpu().numpy()
-            scales_format, opacities_format = _detect_format_from_values(scales_np, opacities_np)
-            format_dict = _create_format_dict(
-                scales=scales_format,
-                opacities=opacities_format,
-                sh0=sh0_format,
-                sh_order=_get_sh_order_format(sh_degree),
-                means=DataFormat.MEANS_RAW,
-                quats=DataFormat.QUATS_RAW,
-            )
-        elif format == "ply":
-            # PLY format (log-scales, logit-opacities)
-            format_dict = create_ply_format(sh_degree=sh_degree, sh0_format=sh0_format)
-        elif format in ("linear", "rasterizer"):
-            # Linear/rasterizer format (linear scales, linear opacities)
-            format_dict = create_rasterizer_format(sh_degree=sh_degree, sh0_format=sh0_format)
-        else:
-            raise ValueError(
-                f"Invalid format preset: {format}. Must be 'auto', 'ply', 'linear', or 'rasterizer'"
-            )
+            # Auto-detect format from values
+            scales_format, opacities_format = _detect_format_from_tensors(scales, opacities)
+        # Shared read-only preset; __post_init__ makes the instance's own copy
+        format_dict = _format_preset_cached(scales_format, opacities_format, sh_degree, sh0_format)
 
-        return cls(
+        gstensor = cls(
             means=means,
             scales=scales,
             quats=quats,
@@ -1642,6 +1851,10 @@ class GSTensor:
             _base=None,
             _format=format_dict,
         )
+        if consolidate:
+            gstensor = gstensor.consolidate()
+        # morton_sort() rebinds fields instead of writing into the caller's tensors
+        return gstensor.morton_sort(inplace=True) if order == "morton" else gstensor
 
     @classmethod
     def from_dict(
@@ -1652,18 +1865,30 @@ class GSTensor:
         sh0_format: DataFormat = DataFormat.SH0_SH,
         device: str | torch.device = "cuda",
         dtype: torch.dtype | None = None,
+        *,
+        consolidate: bool = False,
+        precision: str = "full",
+        order: str | None = None,
     ) -> GSTensor:
         """Create GSTensor from dictionary with format preset.
 
         Convenient factory method for creating GSTensor from a dictionary
         with automatic format detection or explicit format presets.
 
-        :param data_dict: Dictionary with keys: means, scales, quats, opacities, sh0, shN (optional)
+        :param data_dict: Dictionary of tensors or NumPy arrays with keys: means, scales, quats,
+            opacities, sh0, shN (optional)
         :param format: Format preset - "auto" (detect), "ply" (log/logit), "linear" or "rasterizer" (linear)
         :param sh_degree: SH degree (0-3) - auto-detected from shN if None
         :param sh0_format: Format for sh0 (SH0_SH or SH0_RGB), default SH0_SH
         :param device: Target device (default "cuda")
         :param dtype: Target dtype - inferred from tensors if None
+        :param consolidate: Pack the tensors into one interleaved _base tensor (see
+            consolidate()); costs a copy, speeds up boolean masking
+        :param precision: "full" uses dtype for every field; "mixed" keeps means in dtype
+            and stores the other fields as float16, halving their memory
+        :param order: None keeps the input order; "morton" reorders the Gaussians along a
+            Morton (Z-order) curve of their means (see morton_sort()) without
+            modifying the input tensors
         :returns: GSTensor object with specified format
 
         Example:
@@ -1691,6 +1916,9 @@ class GSTensor:
             sh0_format=sh0_format,
             device=device,
             dtype=dtype,
+            consolidate=consolidate,
+            precision=precision,
+            order=order,
         )
 
     # ==========================================================================
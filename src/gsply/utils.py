@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import logging
+import math
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Final
 
+import numba
 import numpy as np
 from numba import jit, njit, prange
 from numpy.typing import NDArray
 
-from gsply.formats import SH_C0
+from gsply.formats import INV_SH_C0, SH_C0
 
 if TYPE_CHECKING:
     from gsply.gsdata import GSData
@@ -23,12 +26,119 @@ _DEFAULT_MIN_SCALE: Final[np.float32] = np.float32(1e-4)
 _DEFAULT_MAX_SCALE: Final[np.float32] = np.float32(100.0)
 _DEFAULT_MIN_NORM: Final[np.float32] = np.float32(1e-8)
 
+# LLVM fast-math flags for the exp/log kernels (spelled out: "afn" lets LLVM use
+# approximate/vector transcendentals, which become packed SVML calls when the
+# Intel SVML runtime is installed, see the "svml" extra)
+_FASTMATH: Final[set[str]] = {"nnan", "ninf", "nsz", "arcp", "contract", "afn", "reassoc"}
 
-def sh2rgb(sh: np.ndarray | float) -> np.ndarray | float:
+# Below this many elements sigmoid/logit use NumPy ufuncs: the work is smaller
+# than the cost of launching the prange thread pool
+_SMALL_ARRAY_SIZE: Final[int] = 4096
+
+# From here up to this many elements the serial kernel twins run instead: a
+# prange region costs tens of microseconds to fan out across a multi-core pool
+_PARALLEL_MIN_SIZE: Final[int] = 1 << 16
+
+# Strided 2-D inputs up to this many (contiguous) columns, e.g. sh0 or shN views
+# into a PLY record, are processed row by row instead of being copied first
+_MAX_ROW_KERNEL_WIDTH: Final[int] = 64
+
+# Tile length for the *_chunked generators: 64K float32 in + out is 512 KB, so a
+# tile stays in a typical L2 until the caller's next stage consumes it
+_CHUNK_SIZE: Final[int] = 1 << 16
+
+logger.debug(
+    "Numba SVML vectorized math: %s", "enabled" if numba.config.USING_SVML else "unavailable"
+)
+
+
+def _as_kernel_input(x, order: str = "C") -> np.ndarray:
+    """Return ``x`` as a C-contiguous float32/float64 array for the typed kernels.
+
+    float32 and float64 pass through without a copy; integer and float16 inputs
+    are promoted (to float64 and float32 respectively) so the kernels only ever
+    compile float32 and float64 specializations.
+
+    :param order: Memory layout to enforce ("K" keeps the input strides)
+    """
+    x = np.asarray(x)
+    return np.asarray(x, dtype=np.result_type(x.dtype, np.float32), order=order)
+
+
+def _check_out(out: np.ndarray | None, shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    """Allocate ``out``, or check a caller-supplied one is C-contiguous ``dtype`` of ``shape``."""
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.shape != shape or out.dtype != dtype or not out.flags.c_contiguous:
+        raise ValueError(
+            f"out must be a C-contiguous {np.dtype(dtype)} array of shape {shape}, "
+            f"got {out.dtype} array of shape {out.shape}"
+        )
+    return out
+
+
+def _iter_tiles(
+    kernel, x: np.ndarray, out: np.ndarray, chunk_size: int, *args
+) -> Iterator[np.ndarray]:
+    """Run ``kernel`` over consecutive flat tiles of ``x``, yielding each finished ``out`` tile."""
+    flat_x = x.reshape(-1)
+    flat_out = out.reshape(-1)
+    for start in range(0, flat_x.shape[0], chunk_size):
+        tile = slice(start, start + chunk_size)
+        kernel(flat_x[tile], flat_out[tile], *args)
+        yield flat_out[tile]
+
+
+def _use_row_kernel(x: np.ndarray) -> bool:
+    """Whether ``x`` is a strided 2-D view with contiguous rows of a few columns."""
+    return (
+        x.ndim == 2
+        and not x.flags.c_contiguous
+        and 1 < x.shape[1] <= _MAX_ROW_KERNEL_WIDTH
+        and x.strides[1] == x.itemsize
+    )
+
+
+def _fused_layout(x: np.ndarray, out: np.ndarray | None) -> bool:
+    """Whether ``x``/``out`` fit the flat typed color kernels (C-contiguous f4/f8, same dtype)."""
+    return (
+        x.dtype in (np.float32, np.float64)
+        and x.flags.c_contiguous
+        and (out is None or (out.dtype == x.dtype and out.flags.c_contiguous))
+    )
+
+
+@jit(
+    nopython=True,
+    parallel=True,
+    fastmath=True,
+    cache=True,
+    nogil=True,
+    boundscheck=False,
+)
+def _sh2rgb_impl(sh: np.ndarray, out: np.ndarray, clip: bool):
+    """Fused multiply-add (and optional [0, 1] clamp) over contiguous 1-D views."""
+    for i in prange(sh.shape[0]):
+        v = sh[i] * SH_C0 + 0.5
+        if clip:
+            v = min(max(v, 0.0), 1.0)
+        out[i] = v
+
+
+def sh2rgb(
+    sh: np.ndarray | float, out: np.ndarray | None = None, clip: bool = False
+) -> np.ndarray | float:
     """Convert SH DC coefficients to RGB colors.
 
+    C-contiguous float32/float64 arrays are converted in one fused Numba pass
+    (multiply-add plus the optional clamp); other inputs use two in-place ufunc
+    passes over one output buffer. Pass ``out=sh`` to convert in place, or a
+    float16 ``out`` for half-size output. For 8-bit colors use :func:`sh2rgb_u8`.
+
     :param sh: SH DC coefficients (N, 3) or scalar
-    :returns: RGB colors in [0, 1] range
+    :param out: Optional output array (same shape as ``sh``)
+    :param clip: Clamp the result to [0, 1] in the same pass
+    :returns: RGB colors (in [0, 1] when ``clip`` is set)
 
     Example:
         >>> import gsply
@@ -36,13 +146,82 @@ def sh2rgb(sh: np.ndarray | float) -> np.ndarray | float:
         >>> rgb = gsply.sh2rgb(sh)
         >>> print(rgb)  # [[0.5, 0.641, 0.359]]
     """
-    return sh * SH_C0 + 0.5
+    if np.isscalar(sh):
+        rgb = sh * SH_C0 + 0.5
+        return min(max(rgb, 0.0), 1.0) if clip else rgb
+
+    sh = np.asarray(sh)
+    if _fused_layout(sh, out):
+        out = _check_out(out, sh.shape, sh.dtype)
+        _sh2rgb_impl(sh.reshape(-1), out.reshape(-1), clip)
+        return out
+
+    out = np.multiply(sh, SH_C0, out=out)
+    out += 0.5
+    if clip:
+        np.clip(out, 0.0, 1.0, out=out)
+    return out
+
+
+@jit(
+    nopython=True,
+    parallel=True,
+    fastmath=True,
+    cache=True,
+    nogil=True,
+    boundscheck=False,
+)
+def _sh2rgb_u8_impl(sh: np.ndarray, out: np.ndarray):
+    """Fused multiply-add, clamp and round to uint8 over contiguous 1-D views."""
+    for i in prange(sh.shape[0]):
+        v = min(max(sh[i] * SH_C0 + 0.5, 0.0), 1.0)
+        out[i] = np.uint8(v * 255.0 + 0.5)
+
+
+def sh2rgb_u8(sh: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Convert SH DC coefficients straight to 8-bit RGB colors.
+
+    One pass that writes uint8 (a quarter of the float32 output bandwidth) with
+    no float intermediate: RGB is clamped to [0, 1] and rounded to nearest.
+
+    :param sh: SH DC coefficients (N, 3)
+    :param out: Optional C-contiguous uint8 output array (same shape as ``sh``)
+    :returns: RGB colors as uint8 in [0, 255]
+
+    Example:
+        >>> import gsply
+        >>> sh = np.array([[0.0, 0.5, -0.5]], dtype=np.float32)
+        >>> gsply.sh2rgb_u8(sh)  # [[128, 163, 92]]
+    """
+    sh = _as_kernel_input(sh)
+    out = _check_out(out, sh.shape, np.uint8)
+    _sh2rgb_u8_impl(sh.reshape(-1), out.reshape(-1))
+    return out
+
+
+@jit(
+    nopython=True,
+    parallel=True,
+    fastmath=True,
+    cache=True,
+    nogil=True,
+    boundscheck=False,
+)
+def _rgb2sh_impl(rgb: np.ndarray, out: np.ndarray):
+    """Fused subtract-multiply over contiguous 1-D views."""
+    for i in prange(rgb.shape[0]):
+        out[i] = (rgb[i] - 0.5) * INV_SH_C0
 
 
-def rgb2sh(rgb: np.ndarray | float) -> np.ndarray | float:
+def rgb2sh(rgb: np.ndarray | float, out: np.ndarray | None = None) -> np.ndarray | float:
     """Convert RGB colors to SH DC coefficients.
 
+    C-contiguous float32/float64 arrays are converted in one fused Numba pass;
+    other inputs use two in-place ufunc passes over one output buffer. Pass
+    ``out=rgb`` to convert in place.
+
     :param rgb: RGB colors in [0, 1] range (N, 3) or scalar
+    :param out: Optional output array (same shape as ``rgb``)
     :returns: SH DC coefficients
 
     Example:
@@ -50,21 +229,69 @@ def rgb2sh(rgb: np.ndarray | float) -> np.ndarray | float:
         >>> rgb = np.array([[1.0, 0.5, 0.0]])
         >>> sh = gsply.rgb2sh(rgb)
     """
-    return (rgb - 0.5) / SH_C0
+    if np.isscalar(rgb):
+        return (rgb - 0.5) * INV_SH_C0
 
+    rgb = np.asarray(rgb)
+    if _fused_layout(rgb, out):
+        out = _check_out(out, rgb.shape, rgb.dtype)
+        _rgb2sh_impl(rgb.reshape(-1), out.reshape(-1))
+        return out
 
-@jit(nopython=True, parallel=True, fastmath=True, cache=True, nogil=True, boundscheck=False)
-def _logit_impl(x: np.ndarray, out: np.ndarray, eps: float):
-    for i in prange(x.size):
-        val = x.flat[i]
-        if val < eps:
-            val = eps
-        elif val > 1.0 - eps:
-            val = 1.0 - eps
-        out.flat[i] = np.log(val / (1.0 - val))
+    out = np.subtract(rgb, 0.5, out=out)
+    out *= INV_SH_C0
+    return out
 
 
-def logit(x: np.ndarray | float, eps: float = 1e-6) -> np.ndarray | float:
+@jit(
+    ["void(f4[::1], f4[::1], f8)", "void(f8[::1], f8[::1], f8)"],
+    nopython=True,
+    parallel=True,
+    fastmath=_FASTMATH,
+    cache=True,
+    nogil=True,
+    boundscheck=False,
+)
+def _logit_impl(x: np.ndarray, out: np.ndarray, eps: float):
+    """Element-wise logit over contiguous 1-D views (unit stride lets LLVM vectorize).
+
+    The clamp is a branchless min/max. The math runs in float64, where 1 - x is
+    exact for float32 inputs, so log(x / (1 - x)) has no endpoint cancellation.
+    """
+    hi = 1.0 - eps
+    for i in prange(x.shape[0]):
+        val = min(max(x[i], eps), hi)
+        out[i] = np.log(val / (1.0 - val))
+
+
+@jit(
+    nopython=True,
+    fastmath=_FASTMATH,
+    cache=True,
+    nogil=True,
+    boundscheck=False,
+)
+def _logit_serial_impl(x: np.ndarray, out: np.ndarray, eps: float):
+    """Single-threaded twin of :func:`_logit_impl` for mid-size inputs."""
+    hi = 1.0 - eps
+    for i in range(x.shape[0]):
+        val = min(max(x[i], eps), hi)
+        out[i] = np.log(val / (1.0 - val))
+
+
+@jit(nopython=True, parallel=True, fastmath=_FASTMATH, cache=True, nogil=True, boundscheck=False)
+def _logit_rows_impl(x: np.ndarray, out: np.ndarray, eps: float):
+    """Row-wise logit for strided (N, C) views: one prange over N, serial C."""
+    hi = 1.0 - eps
+    for i in prange(x.shape[0]):
+        for j in range(x.shape[1]):
+            val = min(max(x[i, j], eps), hi)
+            out[i, j] = np.log(val / (1.0 - val))
+
+
+def logit(
+    x: np.ndarray | float, eps: float = 1e-6, out: np.ndarray | None = None
+) -> np.ndarray | float:
     """Compute logit function (inverse sigmoid) with numerical stability.
 
     Optimized for both scalar and array inputs using Numba.
@@ -72,48 +299,206 @@ def logit(x: np.ndarray | float, eps: float = 1e-6) -> np.ndarray | float:
 
     :param x: Input values in [0, 1] range (probabilities)
     :param eps: Epsilon for numerical stability (clamping)
+    :param out: Optional C-contiguous output array (shape and dtype of ``x``),
+        e.g. to reuse one buffer across repeated calls or to pass ``out=x``
     :returns: Logit values
     """
     if np.isscalar(x):
-        val = float(x)
-        val = max(eps, min(val, 1.0 - eps))
-        return np.log(val / (1.0 - val))
-
-    out = np.empty_like(x)
-    _logit_impl(x, out, eps)
+        # math, not NumPy: no 0-d array round trip for a single value
+        val = min(max(float(x), eps), 1.0 - eps)
+        return math.log(val / (1.0 - val))
+
+    x = _as_kernel_input(x, order="K")
+    out = _check_out(out, x.shape, x.dtype)
+    if x.size < _SMALL_ARRAY_SIZE:
+        # float64 like the kernel, so small and large inputs round identically
+        # (clip into the copy: on a 0-d input np.clip would return a scalar)
+        val = x.astype(np.float64)
+        np.clip(val, eps, 1.0 - eps, out=val)
+        np.divide(val, 1.0 - val, out=val)
+        np.copyto(out, np.log(val, out=val), casting="same_kind")
+        return out
+
+    if _use_row_kernel(x):
+        _logit_rows_impl(x, out, eps)
+    else:
+        kernel = _logit_impl if x.size >= _PARALLEL_MIN_SIZE else _logit_serial_impl
+        kernel(np.ascontiguousarray(x).reshape(-1), out.reshape(-1), eps)
     return out
 
 
-@jit(nopython=True, parallel=True, fastmath=True, cache=True, nogil=True, boundscheck=False)
+@jit(
+    ["void(f4[::1], f4[::1])", "void(f8[::1], f8[::1])"],
+    nopython=True,
+    parallel=True,
+    fastmath=_FASTMATH,
+    cache=True,
+    nogil=True,
+    boundscheck=False,
+)
 def _sigmoid_impl(x: np.ndarray, out: np.ndarray):
-    for i in prange(x.size):
-        val = x.flat[i]
-        # Stable sigmoid
-        if val >= 0:
-            out.flat[i] = 1.0 / (1.0 + np.exp(-val))
-        else:
-            z = np.exp(val)
-            out.flat[i] = z / (1.0 + z)
-
+    """Element-wise stable sigmoid over contiguous 1-D views.
 
-def sigmoid(x: np.ndarray | float) -> np.ndarray | float:
+    Branchless: exp(-|x|) never overflows, and the final select compiles to a
+    blend instead of a per-element branch, so the loop vectorizes.
+    """
+    for i in prange(x.shape[0]):
+        val = x[i]
+        z = np.exp(-abs(val))
+        s = 1.0 / (1.0 + z)
+        out[i] = s if val >= 0 else z * s
+
+
+@jit(
+    nopython=True,
+    fastmath=_FASTMATH,
+    cache=True,
+    nogil=True,
+    boundscheck=False,
+)
+def _sigmoid_serial_impl(x: np.ndarray, out: np.ndarray):
+    """Single-threaded twin of :func:`_sigmoid_impl` for mid-size inputs."""
+    for i in range(x.shape[0]):
+        val = x[i]
+        z = np.exp(-abs(val))
+        s = 1.0 / (1.0 + z)
+        out[i] = s if val >= 0 else z * s
+
+
+@jit(nopython=True, parallel=True, fastmath=_FASTMATH, cache=True, nogil=True, boundscheck=False)
+def _sigmoid_rows_impl(x: np.ndarray, out: np.ndarray):
+    """Row-wise sigmoid for strided (N, C) views: one prange over N, serial C."""
+    for i in prange(x.shape[0]):
+        for j in range(x.shape[1]):
+            val = x[i, j]
+            z = np.exp(-abs(val))
+            s = 1.0 / (1.0 + z)
+            out[i, j] = s if val >= 0 else z * s
+
+
+def sigmoid(x: np.ndarray | float, out: np.ndarray | None = None) -> np.ndarray | float:
     """Compute sigmoid function (inverse logit) with numerical stability.
 
     Optimized for both scalar and array inputs using Numba.
     Formula: 1 / (1 + exp(-x))
 
     :param x: Input values (logits)
+    :param out: Optional C-contiguous output array (shape and dtype of ``x``),
+        e.g. to reuse one buffer across repeated calls or to pass ``out=x``
     :returns: Values in [0, 1] range (probabilities)
     """
     if np.isscalar(x):
+        # math, not NumPy: no 0-d array round trip for a single value
         val = float(x)
-        if val >= 0:
-            return 1.0 / (1.0 + np.exp(-val))
-        z = np.exp(val)
-        return z / (1.0 + z)
+        z = math.exp(-abs(val))
+        s = 1.0 / (1.0 + z)
+        return s if val >= 0 else z * s
+
+    x = _as_kernel_input(x, order="K")
+    out = _check_out(out, x.shape, x.dtype)
+    if x.size < _SMALL_ARRAY_SIZE:
+        xf = x.astype(np.float64, copy=False)
+        z = np.exp(-np.abs(xf))
+        s = 1.0 / (1.0 + z)
+        np.copyto(out, np.where(xf >= 0, s, z * s), casting="same_kind")
+        return out
+
+    if _use_row_kernel(x):
+        _sigmoid_rows_impl(x, out)
+    else:
+        kernel = _sigmoid_impl if x.size >= _PARALLEL_MIN_SIZE else _sigmoid_serial_impl
+        kernel(np.ascontiguousarray(x).reshape(-1), out.reshape(-1))
+    return out
+
+
+def logit_chunked(
+    x: np.ndarray, eps: float = 1e-6, chunk_size: int = _CHUNK_SIZE, out: np.ndarray | None = None
+) -> Iterator[np.ndarray]:
+    """Compute :func:`logit` tile by tile, yielding each tile as soon as it is done.
+
+    Lets a following stage (quantization, packing, I/O) consume a tile while it
+    is still in cache instead of re-reading the whole result from memory. The
+    kernel releases the GIL, so the generator can also be driven from a worker
+    thread. After exhaustion ``out`` holds the full result.
+
+    :param x: Input values in [0, 1] range (probabilities)
+    :param eps: Epsilon for numerical stability (clamping)
+    :param chunk_size: Elements per tile
+    :param out: Optional C-contiguous output array (shape and dtype of ``x``)
+    :returns: Iterator over flat, consecutive tiles of ``out``
+
+    Example:
+        >>> out = np.empty_like(opacities)
+        >>> for tile in gsply.logit_chunked(opacities, out=out):
+        ...     np.clip(tile, -10.0, 10.0, out=tile)
+    """
+    x = _as_kernel_input(x)
+    out = _check_out(out, x.shape, x.dtype)
+    return _iter_tiles(_logit_impl, x, out, chunk_size, eps)
+
 
+def sigmoid_chunked(
+    x: np.ndarray, chunk_size: int = _CHUNK_SIZE, out: np.ndarray | None = None
+) -> Iterator[np.ndarray]:
+    """Compute :func:`sigmoid` tile by tile, yielding each tile as soon as it is done.
+
+    See :func:`logit_chunked`.
+
+    :param x: Input values (logits)
+    :param chunk_size: Elements per tile
+    :param out: Optional C-contiguous output array (shape and dtype of ``x``)
+    :returns: Iterator over flat, consecutive tiles of ``out``
+    """
+    x = _as_kernel_input(x)
+    out = _check_out(out, x.shape, x.dtype)
+    return _iter_tiles(_sigmoid_impl, x, out, chunk_size)
+
+
+# Padé (7, 6) approximant of tanh; past |y| = 4.97 it exceeds 1, so the input is
+# clamped there. Max abs error of the derived sigmoid is 4.8e-5
+_TANH_PADE_CLAMP: Final[float] = 4.97
+
+
+@jit(
+    nopython=True,
+    parallel=True,
+    fastmath=_FASTMATH,
+    cache=True,
+    nogil=True,
+    boundscheck=False,
+)
+def _sigmoid_fast_impl(x: np.ndarray, out: np.ndarray):
+    """Element-wise sigmoid(x) = 0.5 + 0.5 * tanh(x / 2) via a rational tanh.
+
+    Only multiplies, adds and one divide: no exp call, so the loop vectorizes
+    without SVML.
+    """
+    for i in prange(x.shape[0]):
+        y = min(max(0.5 * x[i], -_TANH_PADE_CLAMP), _TANH_PADE_CLAMP)
+        y2 = y * y
+        num = y * (135135.0 + y2 * (17325.0 + y2 * (378.0 + y2)))
+        den = 135135.0 + y2 * (62370.0 + y2 * (3150.0 + 28.0 * y2))
+        out[i] = 0.5 + 0.5 * (num / den)
+
+
+def sigmoid_fast(x: np.ndarray | float) -> np.ndarray | float:
+    """Approximate sigmoid for low-precision consumers.
+
+    Max absolute error is 4.8e-5, far below one 8-bit step (1/255), so it is
+    suitable for opacities headed to uint8 textures or compressed PLY. Use
+    :func:`sigmoid` where full precision matters.
+
+    :param x: Input values (logits)
+    :returns: Values in [0, 1] range (probabilities)
+    """
+    if np.isscalar(x):
+        out = np.empty(1)
+        _sigmoid_fast_impl(np.array([x], dtype=np.float64), out)
+        return float(out[0])
+
+    x = _as_kernel_input(x)
     out = np.empty_like(x)
-    _sigmoid_impl(x, out)
+    _sigmoid_fast_impl(x.reshape(-1), out.reshape(-1))
     return out
 
 
@@ -258,11 +643,9 @@ def _ensure_float32_contiguous(array: Float32Array | None, name: str) -> Float32
     if array is None:
         raise ValueError(f"GSData.{name} is required.")
 
-    if array.dtype != np.float32:
-        array = array.astype(np.float32, copy=False)
-
-    if not array.flags["C_CONTIGUOUS"]:
-        array = np.ascontiguousarray(array)
+    # One conversion covers both (a cast followed by a layout fix would copy twice)
+    if array.dtype != np.float32 or not array.flags["C_CONTIGUOUS"]:
+        array = np.ascontiguousarray(array, dtype=np.float32)
 
     return array
 
@@ -441,10 +824,15 @@ def apply_pre_deactivations(
 
 __all__ = [
     "sh2rgb",
+    "sh2rgb_u8",
     "rgb2sh",
     "SH_C0",
+    "INV_SH_C0",
     "sigmoid",
+    "sigmoid_chunked",
+    "sigmoid_fast",
     "logit",
+    "logit_chunked",
     "apply_pre_activations",
     "apply_pre_deactivations",
 ]
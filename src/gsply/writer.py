@@ -17,6 +17,9 @@ Performance:
 """
 
 import logging
+import sys
+from collections.abc import Iterable, Sized
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -65,6 +68,26 @@ _LARGE_BUFFER_SIZE = 2 * 1024 * 1024  # 2MB buffer for large files
 _SMALL_BUFFER_SIZE = 1 * 1024 * 1024  # 1MB buffer for small files
 _LARGE_FILE_THRESHOLD = 10_000_000  # 10MB threshold for buffer size selection
 
+# Windows CRT write() stages memoryviews through an extra copy, so keep tofile() there
+_USE_MEMORYVIEW_WRITE = sys.platform != "win32"
+
+
+def _write_array(f, arr: np.ndarray) -> None:
+    """Write the raw bytes of an array to an open binary file.
+
+    On POSIX a C-contiguous array is handed to ``f.write`` as a byte memoryview,
+    which goes straight to the OS without materializing a ``bytes`` copy. On
+    Windows (or for non-contiguous arrays) fall back to ``ndarray.tofile``, which
+    calls ``fwrite`` directly.
+
+    :param f: File object opened in binary write mode
+    :param arr: Array to write (native little-endian layout)
+    """
+    if _USE_MEMORYVIEW_WRITE and arr.flags.c_contiguous:
+        f.write(memoryview(arr).cast("B"))
+    else:
+        arr.tofile(f)
+
 
 # ======================================================================================
 # BIT-PACKING QUANTIZATION CONSTANTS (aliases from formats.py for JIT functions)
@@ -1157,7 +1180,7 @@ def write_uncompressed(
         )
         with open(file_path, "wb", buffering=buffer_size) as f:
             f.write(header_bytes)
-            data._base.tofile(f)
+            _write_array(f, data._base)
 
         logger.debug(
             f"[Gaussian PLY] Wrote uncompressed (zero-copy): {num_gaussians} Gaussians to {file_path.name}"
@@ -1202,7 +1225,7 @@ def write_uncompressed(
     )
     with open(file_path, "wb", buffering=buffer_size) as f:
         f.write(header_bytes)
-        output_array.tofile(f)
+        _write_array(f, output_array)
 
     logger.debug(
         f"[Gaussian PLY] Wrote uncompressed: {num_gaussians} Gaussians to {file_path.name}"
@@ -1269,13 +1292,34 @@ def write_compressed(
         _compress_data_internal(means, scales, quats, opacities, sh0, shN)
     )
 
-    # Write to file
+    _write_compressed_parts(
+        file_path,
+        header_bytes,
+        chunk_bounds,
+        packed_data,
+        packed_sh,
+        num_gaussians=num_gaussians,
+        num_chunks=num_chunks,
+    )
+
+
+def _write_compressed_parts(
+    file_path: Path,
+    header_bytes: bytes,
+    chunk_bounds: np.ndarray,
+    packed_data: np.ndarray,
+    packed_sh: np.ndarray | None,
+    *,
+    num_gaussians: int,
+    num_chunks: int,
+) -> None:
+    """Write the output of _compress_data_internal() to a file."""
     with open(file_path, "wb") as f:
         f.write(header_bytes)
-        chunk_bounds.tofile(f)
-        packed_data.tofile(f)
+        _write_array(f, chunk_bounds)
+        _write_array(f, packed_data)
         if packed_sh is not None:
-            packed_sh.tofile(f)
+            _write_array(f, packed_sh)
 
     logger.debug(
         f"[Gaussian PLY] Wrote compressed: {num_gaussians} Gaussians to {file_path.name} "
@@ -1283,6 +1327,16 @@ def write_compressed(
     )
 
 
+def _compressed_path(file_path: Path) -> Path:
+    """Return file_path with a .compressed.ply extension (unchanged if it already has one)."""
+    if file_path.name.endswith((".ply_compressed", ".compressed.ply")):
+        return file_path
+    # Replace .ply with .compressed.ply, or just append if no .ply
+    if file_path.suffix == ".ply":
+        return file_path.with_suffix(".compressed.ply")
+    return Path(str(file_path) + ".compressed.ply")
+
+
 def compress_to_bytes(
     data_or_means: GSData | np.ndarray,
     scales: np.ndarray | None = None,
@@ -1574,12 +1628,7 @@ def plywrite(
     # Check if compressed format requested
     if compressed or is_compressed_ext:
         # If compressed=True but no compressed extension, add .compressed.ply
-        if compressed and not is_compressed_ext:
-            # Replace .ply with .compressed.ply, or just append if no .ply
-            if file_path.suffix == ".ply":
-                file_path = file_path.with_suffix(".compressed.ply")
-            else:
-                file_path = Path(str(file_path) + ".compressed.ply")
+        file_path = _compressed_path(file_path)
 
         # Ensure data is in PLY format (log-scales, logit-opacities) before writing
         data = _ensure_ply_format(data, inplace=True)
@@ -1593,7 +1642,77 @@ def plywrite(
         write_uncompressed(file_path, data, validate=validate)
 
 
+def compress_batch(
+    items: Iterable[GSData],
+    out_paths: Iterable[str | Path],
+    validate: bool = True,
+) -> list[Path]:
+    """Write several GSData objects as compressed PLY files.
+
+    Equivalent to calling ``plywrite(path, data, compressed=True)`` for each
+    pair, but each file is written on a background thread while the next one
+    is being compressed, so disk I/O overlaps compression. Compression itself
+    stays on the calling thread: its kernels are already parallel, and running
+    several at once would only oversubscribe the Numba thread pool. At most one
+    compressed file is held in memory waiting to be written.
+
+    :param items: GSData objects to compress (converted to PLY format in place,
+                  like plywrite)
+    :param out_paths: Output paths, one per item (extension adjusted as with
+                      ``plywrite(..., compressed=True)``)
+    :param validate: If True, validate input shapes (default True)
+    :returns: Paths of the written files, in input order
+    :raises ValueError: If items and out_paths have different lengths. Sized inputs
+                        (lists, tuples) are checked before anything is written; with
+                        lazy iterables the mismatch is only found when the shorter one
+                        runs out, after the files before it have been written
+
+    Example:
+        >>> frames = [plyread(f"frame_{i:04d}.ply") for i in range(100)]
+        >>> paths = [f"out/frame_{i:04d}.ply" for i in range(100)]
+        >>> written = compress_batch(frames, paths)
+    """
+    sized = isinstance(items, Sized) and isinstance(out_paths, Sized)
+    if sized and len(items) != len(out_paths):
+        raise ValueError(f"compress_batch got {len(items)} items but {len(out_paths)} output paths")
+
+    written = []
+    pending: Future | None = None
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="gsply-write") as executor:
+        for item, out_path in zip(items, out_paths, strict=True):
+            file_path = _compressed_path(Path(out_path))
+            data = _ensure_ply_format(item, inplace=True)
+            means, scales, quats, opacities, sh0, shN = _validate_and_normalize_inputs(  # noqa: N806
+                *data.unpack(), validate
+            )
+            header_bytes, chunk_bounds, packed_data, packed_sh, num_gaussians, num_chunks = (
+                _compress_data_internal(means, scales, quats, opacities, sh0, shN)
+            )
+
+            # Wait for the previous write (re-raising its error) before queueing this one
+            if pending is not None:
+                pending.result()
+            pending = executor.submit(
+                _write_compressed_parts,
+                file_path,
+                header_bytes,
+                chunk_bounds,
+                packed_data,
+                packed_sh,
+                num_gaussians=num_gaussians,
+                num_chunks=num_chunks,
+            )
+            written.append(file_path)
+
+        if pending is not None:
+            pending.result()
+
+    return written
+
+
 __all__ = [
+    "compress_batch",
     "plywrite",
     "write_uncompressed",
     "write_compressed",
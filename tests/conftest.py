@@ -10,31 +10,31 @@ import pytest
 @pytest.fixture
 def sample_gaussian_data():
     """Create sample Gaussian data for testing."""
-    np.random.seed(42)  # For reproducibility
+    rng = np.random.default_rng(42)  # For reproducibility
 
     num_gaussians = 100
     return {
-        "means": np.random.randn(num_gaussians, 3).astype(np.float32),
-        "scales": np.random.randn(num_gaussians, 3).astype(np.float32),
-        "quats": np.random.randn(num_gaussians, 4).astype(np.float32),
-        "opacities": np.random.randn(num_gaussians).astype(np.float32),
-        "sh0": np.random.randn(num_gaussians, 3).astype(np.float32),
-        "shN": np.random.randn(num_gaussians, 15, 3).astype(np.float32),
+        "means": rng.standard_normal((num_gaussians, 3), dtype=np.float32),
+        "scales": rng.standard_normal((num_gaussians, 3), dtype=np.float32),
+        "quats": rng.standard_normal((num_gaussians, 4), dtype=np.float32),
+        "opacities": rng.standard_normal(num_gaussians, dtype=np.float32),
+        "sh0": rng.standard_normal((num_gaussians, 3), dtype=np.float32),
+        "shN": rng.standard_normal((num_gaussians, 15, 3), dtype=np.float32),
     }
 
 
 @pytest.fixture
 def sample_sh0_data():
     """Create sample SH degree 0 data (no higher-order SH)."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
 
     num_gaussians = 50
     return {
-        "means": np.random.randn(num_gaussians, 3).astype(np.float32),
-        "scales": np.random.randn(num_gaussians, 3).astype(np.float32),
-        "quats": np.random.randn(num_gaussians, 4).astype(np.float32),
-        "opacities": np.random.randn(num_gaussians).astype(np.float32),
-        "sh0": np.random.randn(num_gaussians, 3).astype(np.float32),
+        "means": rng.standard_normal((num_gaussians, 3), dtype=np.float32),
+        "scales": rng.standard_normal((num_gaussians, 3), dtype=np.float32),
+        "quats": rng.standard_normal((num_gaussians, 4), dtype=np.float32),
+        "opacities": rng.standard_normal(num_gaussians, dtype=np.float32),
+        "sh0": rng.standard_normal((num_gaussians, 3), dtype=np.float32),
     }
 
 
@@ -97,6 +97,64 @@ def multiple_test_files(test_data_dir):
     return list(ply_files)
 
 
+@pytest.fixture(scope="module")
+def rand_np():
+    """Random float32 arrays shared by the tests of a module (read-only).
+
+    Only shapes and value ranges matter to format detection, so tests slice
+    ``rand_np[key][:n]`` instead of sampling new arrays. Tests that modify an
+    array in place must copy it first.
+    """
+    rng = np.random.default_rng(0)
+    n = 100
+    # One fill per distribution; fields are column views into the two buffers,
+    # laid out like the per-Gaussian records that plyread returns views into
+    normal = rng.standard_normal((n, 59), dtype=np.float32)
+    uniform = rng.random((n, 4), dtype=np.float32)
+    normal.flags.writeable = False
+    uniform.flags.writeable = False
+    return {
+        "means": normal[:, 0:3],
+        "quats": normal[:, 3:7],
+        "sh0": normal[:, 7:10],
+        "shN": normal[:, 14:59].reshape(n, 15, 3),  # up to SH degree 3
+        # PLY format: log-scales and logit-opacities (mixed signs, outside [0, 1])
+        "log_scales": normal[:, 10:13],
+        "logit_opacities": normal[:, 13],
+        # Linear format: positive scales and opacities in [0, 1]
+        "scales": uniform[:, 0:3],
+        "opacities": uniform[:, 3],
+    }
+
+
+@pytest.fixture(scope="module")
+def make_fields(rand_np):
+    """Factory slicing GSData/GSTensor field arrays out of rand_np.
+
+    ``make_fields(n, ply=False, sh_bands=0, copy=False)`` returns the first ``n``
+    rows of means, scales, quats, opacities and sh0 (linear scales and opacities,
+    or log-scales and logit-opacities with ``ply=True``), plus shN with
+    ``sh_bands`` bands when non-zero. Without ``copy`` the values are read-only
+    views into rand_np.
+    """
+
+    def make(n, *, ply=False, sh_bands=0, copy=False):
+        fields = {
+            "means": rand_np["means"][:n],
+            "scales": rand_np["log_scales" if ply else "scales"][:n],
+            "quats": rand_np["quats"][:n],
+            "opacities": rand_np["logit_opacities" if ply else "opacities"][:n],
+            "sh0": rand_np["sh0"][:n],
+        }
+        if sh_bands:
+            fields["shN"] = rand_np["shN"][:n, :sh_bands]
+        if copy:
+            fields = {key: value.copy() for key, value in fields.items()}
+        return fields
+
+    return make
+
+
 def pytest_configure(config):
     """Configure pytest."""
     config.addinivalue_line(
@@ -9,9 +9,11 @@ import pytest
 
 from gsply import (
     GSData,
+    compress_batch,
     compress_to_arrays,
     compress_to_bytes,
     plyread,
+    plywrite,
 )
 
 
@@ -216,6 +218,63 @@ class TestCompressToArrays:
         assert packed_data.dtype == np.uint32
 
 
+class TestCompressBatch:
+    """Test compress_batch function."""
+
+    def test_matches_plywrite(self, tmp_path):
+        """Test that each written file equals plywrite(..., compressed=True) of its item."""
+        items = []
+        for i in range(4):
+            means, scales, quats, opacities, sh0, shN = create_test_data(300, 1)  # noqa: N806
+            items.append(
+                GSData(
+                    means=means + i,
+                    scales=scales,
+                    quats=quats,
+                    opacities=opacities,
+                    sh0=sh0,
+                    shN=shN,
+                )
+            )
+        for i, data in enumerate(items):
+            plywrite(tmp_path / f"expected_{i}.ply", data.copy(), compressed=True)
+
+        written = compress_batch(items, [tmp_path / f"frame_{i}.ply" for i in range(4)])
+
+        assert written == [tmp_path / f"frame_{i}.compressed.ply" for i in range(4)]
+        for i, path in enumerate(written):
+            assert path.read_bytes() == (tmp_path / f"expected_{i}.compressed.ply").read_bytes()
+
+    def test_accepts_generators(self, tmp_path):
+        """Test that items and paths may be lazy iterables."""
+        means, scales, quats, opacities, sh0, _ = create_test_data(100)
+        items = (
+            GSData(means=means, scales=scales, quats=quats, opacities=opacities, sh0=sh0, shN=None)
+            for _ in range(3)
+        )
+        paths = (tmp_path / f"{i}.compressed.ply" for i in range(3))
+
+        written = compress_batch(items, paths)
+
+        assert len(written) == 3
+        for path in written:
+            assert len(plyread(path)) == 100
+
+    def test_length_mismatch(self, tmp_path):
+        """Test that mismatched items and paths raise ValueError before writing anything."""
+        means, scales, quats, opacities, sh0, _ = create_test_data(100)
+        data = GSData(
+            means=means, scales=scales, quats=quats, opacities=opacities, sh0=sh0, shN=None
+        )
+
+        with pytest.raises(ValueError, match="2 items but 1 output paths"):
+            compress_batch([data, data], [tmp_path / "a.ply"])
+        with pytest.raises(ValueError, match="1 items but 2 output paths"):
+            compress_batch([data], [tmp_path / "a.ply", tmp_path / "b.ply"])
+
+        assert list(tmp_path.iterdir()) == []
+
+
 class TestIntegration:
     """Integration tests for compress APIs."""
 
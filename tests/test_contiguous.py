@@ -129,6 +129,20 @@ def test_make_contiguous_preserves_data(data_noncontiguous):
     np.testing.assert_array_equal(data_noncontiguous.sh0, original_sh0)
 
 
+@pytest.mark.parametrize("fixture", ["data_noncontiguous", "data_contiguous"])
+def test_make_contiguous_aligned(fixture, request):
+    """Test make_contiguous(align=64) yields 64-byte aligned, unchanged arrays."""
+    data = request.getfixturevalue(fixture)
+    original_means = data.means.copy()
+
+    result = data.make_contiguous(align=64)
+
+    assert result.is_contiguous() is True
+    for arr in (result.means, result.scales, result.quats, result.opacities, result.sh0):
+        assert arr.ctypes.data % 64 == 0
+    np.testing.assert_array_equal(result.means, original_means)
+
+
 def test_make_contiguous_with_masks(data_noncontiguous):
     """Test make_contiguous with mask layers."""
     # Add mask layers
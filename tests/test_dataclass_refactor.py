@@ -1,5 +1,7 @@
 """Test dataclass functionality."""
 
+import weakref
+
 import numpy as np
 
 from gsply import GSData
@@ -115,6 +117,22 @@ class TestDataclassRefactoring:
         data.scales[0, 0] = 999.0
         assert data.scales[0, 0] == 999.0
 
+    def test_weakref_supported(self):
+        """Test that slotted GSData instances can still be weakly referenced."""
+        n = 10
+        data = GSData(
+            means=np.zeros((n, 3), dtype=np.float32),
+            scales=np.ones((n, 3), dtype=np.float32),
+            quats=np.zeros((n, 4), dtype=np.float32),
+            opacities=np.ones(n, dtype=np.float32),
+            sh0=np.zeros((n, 3), dtype=np.float32),
+            shN=None,
+        )
+
+        ref = weakref.ref(data)
+        assert ref() is data
+        assert not hasattr(data, "__dict__")
+
     def test_private_base_field(self):
         """Test that _base field is private."""
         n = 20
@@ -0,0 +1,1051 @@
+"""Tests for GSTensor format management: auto-detection, validation, and conversion."""
+
+import numpy as np
+import pytest
+
+from gsply import GSData, create_ply_format, create_rasterizer_format
+from gsply.gsdata import DataFormat
+
+# Check if PyTorch is available
+pytest.importorskip("torch")
+import torch  # noqa: E402
+
+from gsply.torch import GSTensor  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def rand_torch(rand_np):
+    """Torch copies of rand_np (treat as read-only; clone before in-place edits)."""
+    return {key: torch.tensor(array) for key, array in rand_np.items()}
+
+
+def _torch_fields(make_fields, n, *, ply=False, sh_bands=0):
+    """make_fields() as CPU tensors over fresh copies (safe to modify in place)."""
+    fields = make_fields(n, ply=ply, sh_bands=sh_bands, copy=True)
+    return {key: torch.from_numpy(value) for key, value in fields.items()}
+
+
+def _make_gstensor(make_fields, n, format_dict, *, sh_bands=0, **overrides):
+    """Create a GSTensor from make_fields() whose scales/opacities match format_dict.
+
+    :param sh_bands: Number of higher-order SH bands in shN (0 for no shN)
+    :param overrides: Replacement tensors for individual fields
+    """
+    ply = format_dict["scales"] != DataFormat.SCALES_LINEAR
+    fields = _torch_fields(make_fields, n, ply=ply, sh_bands=sh_bands)
+    fields.update(overrides)
+    return GSTensor(**fields, _format=format_dict)
+
+
+# =============================================================================
+# GSTensor Format Tests
+# =============================================================================
+
+
+class TestGSTensorFormatManagement:
+    """Test format management for GSTensor."""
+
+    def test_gstensor_format_auto_detection(self, rand_torch):
+        """Test auto-detection of format in GSTensor."""
+        n = 100
+        # Create log-scales (PLY format)
+        scales = rand_torch["log_scales"][:n].abs().neg_()
+
+        gstensor = GSTensor(
+            means=rand_torch["means"][:n],
+            scales=scales,
+            quats=rand_torch["quats"][:n],
+            opacities=rand_torch["logit_opacities"][:n],
+            sh0=rand_torch["sh0"][:n],
+            shN=None,
+        )
+
+        # Should auto-detect PLY format
+        assert gstensor._format["scales"] == DataFormat.SCALES_PLY
+        assert gstensor._format["opacities"] == DataFormat.OPACITIES_PLY
+
+    @pytest.mark.parametrize("dtype", [torch.float16, torch.bfloat16])
+    @pytest.mark.parametrize("linear", [False, True], ids=["ply", "linear"])
+    def test_from_arrays_auto_format_low_precision(self, rand_torch, dtype, linear):
+        """Test auto-detection of half-precision tensors (no NumPy equivalent for bfloat16)."""
+        n = 100
+        fields = {
+            "means": rand_torch["means"][:n],
+            "scales": rand_torch["scales" if linear else "log_scales"][:n],
+            "quats": rand_torch["quats"][:n],
+            "opacities": rand_torch["opacities" if linear else "logit_opacities"][:n],
+            "sh0": rand_torch["sh0"][:n],
+        }
+        fields = {key: value.to(dtype) for key, value in fields.items()}
+
+        gstensor = GSTensor.from_arrays(**fields, format="auto", device="cpu", dtype=dtype)
+
+        expected = create_rasterizer_format() if linear else create_ply_format()
+        assert gstensor._format["scales"] == expected["scales"]
+        assert gstensor._format["opacities"] == expected["opacities"]
+
+    @pytest.mark.parametrize("bad_scale", [-0.5, 10.0, float("nan")], ids=["neg", "big", "nan"])
+    def test_low_precision_single_outlier_scale_means_ply(self, rand_torch, bad_scale):
+        """Test one negative, large or NaN scale blocks linear detection on device."""
+        from gsply.torch.gstensor import _detect_format_from_tensors
+
+        n = 100
+        scales = rand_torch["scales"][:n].to(torch.bfloat16)
+        scales[7, 2] = bad_scale
+        opacities = rand_torch["opacities"][:n].to(torch.bfloat16)
+
+        assert _detect_format_from_tensors(scales, opacities) == (
+            DataFormat.SCALES_PLY,
+            DataFormat.OPACITIES_LINEAR,
+        )
+
+    def test_gstensor_add_same_format_succeeds(self, make_fields):
+        """Test that GSTensor.add() succeeds when formats match."""
+        n = 10
+        format_dict = create_ply_format(sh_degree=0)
+
+        gstensor1 = _make_gstensor(make_fields, n, format_dict)
+
+        gstensor2 = _make_gstensor(make_fields, n, format_dict)
+
+        result = gstensor1.add(gstensor2)
+        assert len(result) == n * 2
+        assert result._format == format_dict
+
+    def test_gstensor_add_different_formats_raises(self, make_fields):
+        """Test that GSTensor.add() raises ValueError when formats don't match."""
+        n = 10
+
+        gstensor1 = _make_gstensor(make_fields, n, create_ply_format(sh_degree=0))
+
+        gstensor2 = _make_gstensor(make_fields, n, create_rasterizer_format(sh_degree=0))
+
+        with pytest.raises(ValueError, match="different formats"):
+            gstensor1.add(gstensor2)
+
+    def test_gstensor_format_preserved_in_conversion(self, rand_np):
+        """Test that format is preserved when converting GSData <-> GSTensor."""
+        n = 10
+        format_dict = create_rasterizer_format(sh_degree=0)
+
+        gsdata = GSData(
+            means=rand_np["means"][:n],
+            scales=rand_np["scales"][:n],
+            quats=rand_np["quats"][:n],
+            opacities=rand_np["opacities"][:n],
+            sh0=rand_np["sh0"][:n],
+            shN=np.empty((n, 0, 3), dtype=np.float32),
+            _format=format_dict,
+        )
+
+        gstensor = GSTensor.from_gsdata(gsdata, device="cpu")
+        assert gstensor._format == format_dict
+
+        gsdata_back = gstensor.to_gsdata()
+        assert gsdata_back._format == format_dict
+
+
+# =============================================================================
+# Format Helper Functions Usage Tests
+# =============================================================================
+
+
+class TestFormatHelperUsage:
+    """Test using format helper functions with GSTensor creation."""
+
+    @pytest.mark.parametrize(
+        ("helper", "sh_degree", "expected_scales", "expected_opacities", "expected_order"),
+        [
+            (
+                create_ply_format,
+                3,
+                DataFormat.SCALES_PLY,
+                DataFormat.OPACITIES_PLY,
+                DataFormat.SH_ORDER_3,
+            ),
+            (
+                create_rasterizer_format,
+                1,
+                DataFormat.SCALES_LINEAR,
+                DataFormat.OPACITIES_LINEAR,
+                DataFormat.SH_ORDER_1,
+            ),
+        ],
+        ids=["ply", "rasterizer"],
+    )
+    def test_create_gstensor_with_format_helper(
+        self, make_fields, *, helper, sh_degree, expected_scales, expected_opacities, expected_order
+    ):
+        """Test creating GSTensor with a format helper."""
+        n = 10
+        format_dict = helper(sh_degree=sh_degree)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict, sh_bands=(sh_degree + 1) ** 2 - 1)
+
+        assert gstensor._format == format_dict
+        assert gstensor._format["scales"] == expected_scales
+        assert gstensor._format["opacities"] == expected_opacities
+        assert gstensor._format["sh_order"] == expected_order
+
+
+# =============================================================================
+# from_arrays and from_dict Tests
+# =============================================================================
+
+
+class TestGSTensorFromArrays:
+    """Test GSTensor.from_arrays() convenience method."""
+
+    def test_from_arrays_auto_format(self, rand_torch):
+        """Test from_arrays with auto format detection."""
+        n = 100
+        means = rand_torch["means"][:n]
+        scales = rand_torch["scales"][:n] * 5.0  # Linear scales
+        quats = rand_torch["quats"][:n]
+        opacities = rand_torch["opacities"][:n]  # Linear opacities
+        sh0 = rand_torch["sh0"][:n]
+
+        gstensor = GSTensor.from_arrays(
+            means, scales, quats, opacities, sh0, format="auto", device="cpu"
+        )
+
+        # Should auto-detect linear format
+        assert gstensor._format["scales"] == DataFormat.SCALES_LINEAR
+        assert gstensor._format["opacities"] == DataFormat.OPACITIES_LINEAR
+        assert len(gstensor) == n
+        assert gstensor.device.type == "cpu"
+
+    def test_from_arrays_ply_format(self, rand_torch):
+        """Test from_arrays with explicit PLY format."""
+        n = 100
+        means = rand_torch["means"][:n]
+        scales = rand_torch["log_scales"][:n]
+        quats = rand_torch["quats"][:n]
+        opacities = rand_torch["logit_opacities"][:n]
+        sh0 = rand_torch["sh0"][:n]
+
+        gstensor = GSTensor.from_arrays(
+            means, scales, quats, opacities, sh0, format="ply", device="cpu"
+        )
+
+        assert gstensor._format["scales"] == DataFormat.SCALES_PLY
+        assert gstensor._format["opacities"] == DataFormat.OPACITIES_PLY
+        assert gstensor._format["sh_order"] == DataFormat.SH_ORDER_0
+
+    def test_from_arrays_linear_format(self, rand_torch):
+        """Test from_arrays with explicit linear format."""
+        n = 100
+        means = rand_torch["means"][:n]
+        scales = rand_torch["scales"][:n]
+        quats = rand_torch["quats"][:n]
+        opacities = rand_torch["opacities"][:n]
+        sh0 = rand_torch["sh0"][:n]
+
+        gstensor = GSTensor.from_arrays(
+            means, scales, quats, opacities, sh0, format="linear", device="cpu"
+        )
+
+        assert gstensor._format["scales"] == DataFormat.SCALES_LINEAR
+        assert gstensor._format["opacities"] == DataFormat.OPACITIES_LINEAR
+
+    @pytest.mark.parametrize("preset", ["ply", "linear", "rasterizer"])
+    def test_from_arrays_explicit_format_skips_detection(self, make_fields, monkeypatch, preset):
+        """Test that explicit presets never scan the tensors for format detection."""
+
+        def fail(*args):
+            raise AssertionError("format detection ran for an explicit preset")
+
+        monkeypatch.setattr("gsply.torch.gstensor._detect_format_from_tensors", fail)
+        fields = _torch_fields(make_fields, 10)
+
+        gstensor = GSTensor.from_arrays(**fields, format=preset, device="cpu")
+
+        assert gstensor._format["sh_order"] == DataFormat.SH_ORDER_0
+
+    def test_from_arrays_device_inference(self, rand_torch):
+        """Test from_arrays infers device from tensors."""
+        n = 10
+        means = rand_torch["means"][:n]
+        scales = rand_torch["scales"][:n]
+        quats = rand_torch["quats"][:n]
+        opacities = rand_torch["opacities"][:n]
+        sh0 = rand_torch["sh0"][:n]
+
+        gstensor = GSTensor.from_arrays(
+            means, scales, quats, opacities, sh0, format="ply", device=None
+        )
+
+        assert gstensor.device == means.device
+        # Matching device and dtype: the tensors are stored as passed
+        assert gstensor.means is means
+        assert gstensor.sh0 is sh0
+
+    def test_from_arrays_dtype_conversion(self, rand_torch):
+        """Test from_arrays converts dtype correctly."""
+        n = 10
+        means = rand_torch["means"][:n].double()
+        scales = rand_torch["scales"][:n].double()
+        quats = rand_torch["quats"][:n].double()
+        opacities = rand_torch["opacities"][:n].double()
+        sh0 = rand_torch["sh0"][:n].double()
+
+        gstensor = GSTensor.from_arrays(
+            means, scales, quats, opacities, sh0, format="ply", device="cpu", dtype=torch.float32
+        )
+
+        assert gstensor.dtype == torch.float32
+        assert gstensor.means.dtype == torch.float32
+
+    def test_from_arrays_with_shN(self, rand_torch):
+        """Test from_arrays with higher-order SH coefficients."""
+        n = 100
+        means = rand_torch["means"][:n]
+        scales = rand_torch["scales"][:n]
+        quats = rand_torch["quats"][:n]
+        opacities = rand_torch["opacities"][:n]
+        sh0 = rand_torch["sh0"][:n]
+        shN = rand_torch["shN"][:n, :3]  # SH degree 1: 3 bands
+
+        gstensor = GSTensor.from_arrays(
+            means, scales, quats, opacities, sh0, shN=shN, format="ply", device="cpu"
+        )
+
+        assert gstensor._format["sh_order"] == DataFormat.SH_ORDER_1
+        assert gstensor.shN.shape == (n, 3, 3)
+
+    def test_from_arrays_invalid_format(self, rand_torch):
+        """Test from_arrays with invalid format preset."""
+        n = 10
+        means = rand_torch["means"][:n]
+        scales = rand_torch["scales"][:n]
+        quats = rand_torch["quats"][:n]
+        opacities = rand_torch["opacities"][:n]
+        sh0 = rand_torch["sh0"][:n]
+
+        with pytest.raises(ValueError, match="Invalid format preset"):
+            GSTensor.from_arrays(
+                means, scales, quats, opacities, sh0, format="invalid", device="cpu"
+            )
+
+    def test_from_arrays_invalid_format_fails_before_touching_data(self):
+        """Test an invalid preset is rejected before any array is read or converted."""
+        untouchable = object()  # Any array operation on this would raise TypeError
+
+        with pytest.raises(ValueError, match="Invalid format preset"):
+            GSTensor.from_arrays(*[untouchable] * 5, format="invalid", device="cpu")
+
+    def test_from_arrays_mixed_precision(self, make_fields):
+        """Test precision="mixed" stores all fields but means as float16."""
+        n = 10
+        fields = _torch_fields(make_fields, n, sh_bands=3)
+
+        gstensor = GSTensor.from_arrays(**fields, format="linear", device="cpu", precision="mixed")
+
+        assert gstensor.means.dtype == torch.float32
+        for key in ("scales", "quats", "opacities", "sh0", "shN"):
+            result = getattr(gstensor, key)
+            assert result.dtype == torch.float16
+            torch.testing.assert_close(result.float(), fields[key], rtol=1e-3, atol=1e-3)
+
+    def test_from_arrays_consolidate(self, make_fields):
+        """Test from_arrays(consolidate=True) packs the fields into one base tensor."""
+        n = 10
+        fields = _torch_fields(make_fields, n, sh_bands=3)
+
+        gstensor = GSTensor.from_arrays(**fields, format="linear", device="cpu", consolidate=True)
+
+        assert gstensor._base is not None
+        assert gstensor._base.shape == (n, 14 + 9)
+        assert gstensor._format == create_rasterizer_format(sh_degree=1)
+        for key, value in fields.items():
+            torch.testing.assert_close(getattr(gstensor, key), value)
+
+
+class TestGSTensorFromDict:
+    """Test GSTensor.from_dict() convenience method."""
+
+    def test_from_dict_auto_format(self, rand_torch):
+        """Test from_dict with auto format detection."""
+        n = 100
+        data_dict = {
+            "means": rand_torch["means"][:n],
+            "scales": rand_torch["scales"][:n] * 5.0,
+            "quats": rand_torch["quats"][:n],
+            "opacities": rand_torch["opacities"][:n],
+            "sh0": rand_torch["sh0"][:n],
+        }
+
+        gstensor = GSTensor.from_dict(data_dict, format="auto", device="cpu")
+
+        assert gstensor._format["scales"] == DataFormat.SCALES_LINEAR
+        assert gstensor._format["opacities"] == DataFormat.OPACITIES_LINEAR
+        assert len(gstensor) == n
+
+    def test_from_dict_numpy_arrays_zero_copy(self, rand_np):
+        """Test from_dict wraps CPU NumPy arrays without copying them."""
+        n = 10
+        keys = ("means", "scales", "quats", "opacities", "sh0")
+        data_dict = {key: rand_np[key][:n].copy() for key in keys}
+
+        gstensor = GSTensor.from_dict(data_dict, format="linear", device="cpu")
+
+        for key in keys:
+            assert np.shares_memory(getattr(gstensor, key).numpy(), data_dict[key])
+
+    def test_from_dict_ply_format(self, rand_torch):
+        """Test from_dict with explicit PLY format."""
+        n = 100
+        data_dict = {
+            "means": rand_torch["means"][:n],
+            "scales": rand_torch["log_scales"][:n],
+            "quats": rand_torch["quats"][:n],
+            "opacities": rand_torch["logit_opacities"][:n],
+            "sh0": rand_torch["sh0"][:n],
+        }
+
+        gstensor = GSTensor.from_dict(data_dict, format="ply", device="cpu")
+
+        assert gstensor._format["scales"] == DataFormat.SCALES_PLY
+        assert gstensor._format["opacities"] == DataFormat.OPACITIES_PLY
+
+    def test_from_dict_with_shN(self, rand_torch):
+        """Test from_dict with shN included."""
+        n = 100
+        data_dict = {
+            "means": rand_torch["means"][:n],
+            "scales": rand_torch["scales"][:n],
+            "quats": rand_torch["quats"][:n],
+            "opacities": rand_torch["opacities"][:n],
+            "sh0": rand_torch["sh0"][:n],
+            "shN": rand_torch["shN"][:n, :8],  # SH degree 2: 8 bands
+        }
+
+        gstensor = GSTensor.from_dict(data_dict, format="linear", device="cpu")
+
+        assert gstensor._format["sh_order"] == DataFormat.SH_ORDER_2
+        assert gstensor.shN.shape == (n, 8, 3)
+
+    def test_from_dict_device_handling(self, rand_torch):
+        """Test from_dict handles device correctly."""
+        n = 10
+        data_dict = {
+            "means": rand_torch["means"][:n],
+            "scales": rand_torch["scales"][:n],
+            "quats": rand_torch["quats"][:n],
+            "opacities": rand_torch["opacities"][:n],
+            "sh0": rand_torch["sh0"][:n],
+        }
+
+        gstensor = GSTensor.from_dict(data_dict, format="ply", device="cpu")
+
+        assert gstensor.device.type == "cpu"
+        assert gstensor.means.device.type == "cpu"
+
+
+# =============================================================================
+# Edge Cases Tests
+# =============================================================================
+
+
+class TestGSTensorFromArraysEdgeCases:
+    """Test edge cases for GSTensor.from_arrays()."""
+
+    def test_from_arrays_empty_data(self):
+        """Test from_arrays with empty tensors."""
+        n = 0
+        means = torch.empty(n, 3)
+        scales = torch.empty(n, 3)
+        quats = torch.empty(n, 4)
+        opacities = torch.empty(n)
+        sh0 = torch.empty(n, 3)
+
+        gstensor = GSTensor.from_arrays(
+            means, scales, quats, opacities, sh0, format="ply", device="cpu"
+        )
+
+        assert len(gstensor) == 0
+        assert gstensor._format["scales"] == DataFormat.SCALES_PLY
+
+    def test_from_arrays_single_gaussian(self, rand_torch):
+        """Test from_arrays with single Gaussian."""
+        means = rand_torch["means"][:1]
+        scales = rand_torch["scales"][:1]
+        quats = rand_torch["quats"][:1]
+        opacities = rand_torch["opacities"][:1]
+        sh0 = rand_torch["sh0"][:1]
+
+        gstensor = GSTensor.from_arrays(
+            means, scales, quats, opacities, sh0, format="linear", device="cpu"
+        )
+
+        assert len(gstensor) == 1
+        assert gstensor._format["scales"] == DataFormat.SCALES_LINEAR
+
+    def test_from_arrays_device_mismatch(self, rand_torch):
+        """Test from_arrays with tensors on different devices (should move to target)."""
+        n = 10
+        means = rand_torch["means"][:n]
+        scales = rand_torch["scales"][:n]
+        quats = rand_torch["quats"][:n]
+        opacities = rand_torch["opacities"][:n]
+        sh0 = rand_torch["sh0"][:n]
+
+        # All tensors on CPU, but request CUDA (if available)
+        # Should move all to target device
+        gstensor = GSTensor.from_arrays(
+            means, scales, quats, opacities, sh0, format="ply", device="cpu"
+        )
+
+        assert gstensor.device.type == "cpu"
+        assert gstensor.means.device.type == "cpu"
+
+    def test_from_arrays_dtype_mismatch(self, rand_torch):
+        """Test from_arrays with mixed dtypes (should convert to target)."""
+        n = 10
+        means = rand_torch["means"][:n].double()
+        scales = rand_torch["scales"][:n]
+        quats = rand_torch["quats"][:n]
+        opacities = rand_torch["opacities"][:n].half()
+        sh0 = rand_torch["sh0"][:n]
+
+        # Request float32, should convert all
+        gstensor = GSTensor.from_arrays(
+            means, scales, quats, opacities, sh0, format="ply", device="cpu", dtype=torch.float32
+        )
+
+        assert gstensor.dtype == torch.float32
+        assert gstensor.means.dtype == torch.float32
+        assert gstensor.opacities.dtype == torch.float32
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA not available")
+    @pytest.mark.parametrize("src_dtype", [torch.float16, torch.float64])
+    def test_from_arrays_cross_device_dtype(self, rand_torch, src_dtype):
+        """Test from_arrays casting while moving CPU tensors to CUDA (widening and narrowing)."""
+        n = 10
+        fields = {
+            key: rand_torch[key][:n].to(src_dtype)
+            for key in ("means", "scales", "quats", "opacities", "sh0")
+        }
+
+        gstensor = GSTensor.from_arrays(**fields, format="ply", device="cuda", dtype=torch.float32)
+
+        for key, value in fields.items():
+            result = getattr(gstensor, key)
+            assert result.device.type == "cuda"
+            assert result.dtype == torch.float32
+            torch.testing.assert_close(result.cpu(), value.float())
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA not available")
+    def test_from_arrays_cpu_to_cuda_single_transfer(self, make_fields):
+        """Test CPU arrays moved to CUDA in one staged transfer keep their values and shapes."""
+        n = 10
+        fields = make_fields(n, sh_bands=3)
+
+        gstensor = GSTensor.from_arrays(**fields, format="ply", device="cuda")
+
+        assert gstensor.shN.shape == (n, 3, 3)
+        for key, value in fields.items():
+            result = getattr(gstensor, key)
+            assert result.device.type == "cuda"
+            np.testing.assert_array_equal(result.cpu().numpy(), value)
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA not available")
+    def test_from_arrays_pinned_inputs_to_cuda(self, make_fields):
+        """Test caller-pinned CPU tensors are moved to CUDA without a staging copy."""
+        n = 10
+        fields = {
+            key: value.contiguous().pin_memory()
+            for key, value in _torch_fields(make_fields, n).items()
+        }
+        expected = {key: value.clone() for key, value in fields.items()}
+
+        gstensor = GSTensor.from_arrays(**fields, format="ply", device="cuda")
+        # Refilling the pinned buffers must not reach the device tensors
+        for value in fields.values():
+            value.fill_(-1.0)
+
+        for key, value in expected.items():
+            result = getattr(gstensor, key)
+            assert result.device.type == "cuda"
+            torch.testing.assert_close(result.cpu(), value)
+
+    def test_from_arrays_wrong_shapes_raises(self, rand_torch):
+        """Test from_arrays with mismatched tensor shapes."""
+        n = 10
+        means = rand_torch["means"][:n]
+        scales = rand_torch["scales"][: n + 1]  # Wrong size
+        quats = rand_torch["quats"][:n]
+        opacities = rand_torch["opacities"][:n]
+        sh0 = rand_torch["sh0"][:n]
+
+        # Shape mismatch will cause issues when accessing data or during operations
+        # The error might not be immediate, but data will be invalid
+        gstensor = GSTensor.from_arrays(
+            means, scales, quats, opacities, sh0, format="ply", device="cpu"
+        )
+        # Verify tensor is created but has inconsistent shapes
+        assert len(gstensor) == n  # Uses means.shape[0]
+        # Accessing scales might fail or give wrong results
+        assert gstensor.scales.shape[0] == n + 1  # Scales has wrong size
+
+    def test_from_arrays_shN_shape_mismatch(self, rand_torch):
+        """Test from_arrays with shN shape mismatch."""
+        n = 10
+        means = rand_torch["means"][:n]
+        scales = rand_torch["scales"][:n]
+        quats = rand_torch["quats"][:n]
+        opacities = rand_torch["opacities"][:n]
+        sh0 = rand_torch["sh0"][:n]
+        shN = rand_torch["shN"][: n + 1, :3]  # Wrong first dimension
+
+        # Shape mismatch will cause issues but might not raise immediately
+        gstensor = GSTensor.from_arrays(
+            means, scales, quats, opacities, sh0, shN=shN, format="ply", device="cpu"
+        )
+        # Verify tensor is created but has inconsistent shapes
+        assert len(gstensor) == n  # Uses means.shape[0]
+        assert gstensor.shN.shape[0] == n + 1  # shN has wrong size
+
+    def test_from_arrays_with_none_shN(self, rand_torch):
+        """Test from_arrays explicitly passing None for shN."""
+        n = 10
+        means = rand_torch["means"][:n]
+        scales = rand_torch["scales"][:n]
+        quats = rand_torch["quats"][:n]
+        opacities = rand_torch["opacities"][:n]
+        sh0 = rand_torch["sh0"][:n]
+
+        gstensor = GSTensor.from_arrays(
+            means, scales, quats, opacities, sh0, shN=None, format="ply", device="cpu"
+        )
+
+        assert gstensor.shN is None
+        assert gstensor._format["sh_order"] == DataFormat.SH_ORDER_0
+
+
+class TestGSTensorFromDictEdgeCases:
+    """Test edge cases for GSTensor.from_dict()."""
+
+    def test_from_dict_missing_keys(self, rand_torch):
+        """Test from_dict with missing required keys."""
+        data_dict = {
+            "means": rand_torch["means"][:10],
+            # Missing scales, quats, opacities, sh0
+        }
+
+        with pytest.raises(KeyError):
+            GSTensor.from_dict(data_dict, format="ply", device="cpu")
+
+    def test_from_dict_extra_keys(self, rand_torch):
+        """Test from_dict with extra keys (should be ignored)."""
+        n = 10
+        data_dict = {
+            "means": rand_torch["means"][:n],
+            "scales": rand_torch["scales"][:n],
+            "quats": rand_torch["quats"][:n],
+            "opacities": rand_torch["opacities"][:n],
+            "sh0": rand_torch["sh0"][:n],
+            "extra_key": "should be ignored",
+            "another_extra": 123,
+        }
+
+        gstensor = GSTensor.from_dict(data_dict, format="ply", device="cpu")
+        assert len(gstensor) == n
+
+    def test_from_dict_empty_dict(self):
+        """Test from_dict with empty dictionary."""
+        with pytest.raises(KeyError):
+            GSTensor.from_dict({}, format="ply", device="cpu")
+
+    def test_from_dict_shN_as_none(self, rand_torch):
+        """Test from_dict with shN explicitly set to None."""
+        n = 10
+        data_dict = {
+            "means": rand_torch["means"][:n],
+            "scales": rand_torch["scales"][:n],
+            "quats": rand_torch["quats"][:n],
+            "opacities": rand_torch["opacities"][:n],
+            "sh0": rand_torch["sh0"][:n],
+            "shN": None,
+        }
+
+        gstensor = GSTensor.from_dict(data_dict, format="linear", device="cpu")
+        assert gstensor.shN is None
+        assert gstensor._format["sh_order"] == DataFormat.SH_ORDER_0
+
+    def test_from_dict_device_handling_mixed(self, rand_torch):
+        """Test from_dict handles device conversion correctly."""
+        n = 10
+        # Create tensors on CPU
+        data_dict = {
+            "means": rand_torch["means"][:n],
+            "scales": rand_torch["scales"][:n],
+            "quats": rand_torch["quats"][:n],
+            "opacities": rand_torch["opacities"][:n],
+            "sh0": rand_torch["sh0"][:n],
+        }
+
+        # Request CPU (should work even if tensors are already on CPU)
+        gstensor = GSTensor.from_dict(data_dict, format="ply", device="cpu")
+        assert gstensor.device.type == "cpu"
+        assert gstensor.means.device.type == "cpu"
+
+
+# =============================================================================
+# Format Metadata Isolation Tests
+# =============================================================================
+
+
+class TestFormatIsolation:
+    """Ensure format metadata is not shared across copies or clones."""
+
+    def test_gstensor_clone_keeps_source_format(self):
+        """In-place ops on a GSTensor clone should not mutate the original format dict."""
+        format_dict = create_rasterizer_format(sh_degree=0)
+        means = torch.zeros((2, 3), dtype=torch.float32)
+        scales = torch.full((2, 3), 0.5, dtype=torch.float32)
+        quats = torch.tensor([[0.0, 0.0, 0.0, 1.0]], dtype=torch.float32)
+        quats = quats.repeat(2, 1)
+        opacities = torch.full((2,), 0.5, dtype=torch.float32)
+        sh0 = torch.zeros((2, 3), dtype=torch.float32)
+        shN = torch.empty((2, 0, 3), dtype=torch.float32)
+
+        base = GSTensor(
+            means=means,
+            scales=scales,
+            quats=quats,
+            opacities=opacities,
+            sh0=sh0,
+            shN=shN,
+            _format=format_dict,
+            masks=None,
+            mask_names=None,
+            _base=None,
+        )
+        clone = base.clone()
+        clone.normalize(inplace=True)
+
+        assert base._format is not clone._format
+        assert base._format["scales"] == DataFormat.SCALES_LINEAR
+        assert base._format["opacities"] == DataFormat.OPACITIES_LINEAR
+        assert clone._format["scales"] == DataFormat.SCALES_PLY
+        assert clone._format["opacities"] == DataFormat.OPACITIES_PLY
+
+    def test_gstensor_normalize_non_inplace_uses_separate_format(self):
+        """Non-inplace normalize should return a clone with independent format dict."""
+        format_dict = create_rasterizer_format(sh_degree=0)
+        means = torch.zeros((1, 3), dtype=torch.float32)
+        scales = torch.full((1, 3), 0.5, dtype=torch.float32)
+        quats = torch.tensor([[0.0, 0.0, 0.0, 1.0]], dtype=torch.float32)
+        opacities = torch.tensor([0.5], dtype=torch.float32)
+        sh0 = torch.zeros((1, 3), dtype=torch.float32)
+        shN = torch.empty((1, 0, 3), dtype=torch.float32)
+
+        base = GSTensor(
+            means=means,
+            scales=scales,
+            quats=quats,
+            opacities=opacities,
+            sh0=sh0,
+            shN=shN,
+            _format=format_dict,
+            masks=None,
+            mask_names=None,
+            _base=None,
+        )
+        normalized = base.normalize(inplace=False)
+
+        assert normalized is not base
+        assert base._format is not normalized._format
+        assert base._format["scales"] == DataFormat.SCALES_LINEAR
+        assert base._format["opacities"] == DataFormat.OPACITIES_LINEAR
+        assert normalized._format["scales"] == DataFormat.SCALES_PLY
+        assert normalized._format["opacities"] == DataFormat.OPACITIES_PLY
+
+    def test_gstensor_apply_masks_non_inplace_preserves_source_format(self):
+        """Masking without inplace should keep source format dict untouched."""
+        format_dict = create_rasterizer_format(sh_degree=0)
+        means = torch.zeros((3, 3), dtype=torch.float32)
+        scales = torch.full((3, 3), 0.5, dtype=torch.float32)
+        quats = torch.tensor([[0.0, 0.0, 0.0, 1.0]], dtype=torch.float32).repeat(3, 1)
+        opacities = torch.tensor([0.1, 0.9, 0.2], dtype=torch.float32)
+        sh0 = torch.zeros((3, 3), dtype=torch.float32)
+        shN = torch.empty((3, 0, 3), dtype=torch.float32)
+
+        base = GSTensor(
+            means=means,
+            scales=scales,
+            quats=quats,
+            opacities=opacities,
+            sh0=sh0,
+            shN=shN,
+            masks=torch.tensor([True, False, True]),
+            _format=format_dict,
+            mask_names=None,
+            _base=None,
+        )
+
+        masked = base.apply_masks(inplace=False)
+
+        assert masked is not base
+        assert base._format is not masked._format
+        assert base._format["scales"] == DataFormat.SCALES_LINEAR
+        assert base._format["opacities"] == DataFormat.OPACITIES_LINEAR
+        assert masked._format["scales"] == DataFormat.SCALES_LINEAR
+        assert masked._format["opacities"] == DataFormat.OPACITIES_LINEAR
+
+
+# =============================================================================
+# Format Query Property Tests (v0.2.8)
+# =============================================================================
+
+
+class TestGSTensorFormatQueryProperties:
+    """Test format query properties for GSTensor."""
+
+    def test_is_scales_ply(self, make_fields):
+        """Test is_scales_ply property."""
+        n = 10
+        format_dict = create_ply_format(sh_degree=0)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict)
+
+        assert gstensor.is_scales_ply is True
+        assert gstensor.is_scales_linear is False
+
+    def test_is_scales_linear(self, make_fields):
+        """Test is_scales_linear property."""
+        n = 10
+        format_dict = create_rasterizer_format(sh_degree=0)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict)
+
+        assert gstensor.is_scales_linear is True
+        assert gstensor.is_scales_ply is False
+
+    def test_is_opacities_ply(self, make_fields):
+        """Test is_opacities_ply property."""
+        n = 10
+        format_dict = create_ply_format(sh_degree=0)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict)
+
+        assert gstensor.is_opacities_ply is True
+        assert gstensor.is_opacities_linear is False
+
+    def test_is_opacities_linear(self, make_fields):
+        """Test is_opacities_linear property."""
+        n = 10
+        format_dict = create_rasterizer_format(sh_degree=0)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict)
+
+        assert gstensor.is_opacities_linear is True
+        assert gstensor.is_opacities_ply is False
+
+    def test_is_sh0_sh(self, make_fields):
+        """Test is_sh0_sh property."""
+        n = 10
+        format_dict = create_ply_format(sh_degree=0)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict)
+
+        assert gstensor.is_sh0_sh is True
+        assert gstensor.is_sh0_rgb is False
+
+    def test_is_sh0_rgb(self, rand_torch, make_fields):
+        """Test is_sh0_rgb property."""
+        n = 10
+        format_dict = create_ply_format(sh_degree=0, sh0_format=DataFormat.SH0_RGB)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict, sh0=rand_torch["scales"][:n])
+
+        assert gstensor.is_sh0_rgb is True
+        assert gstensor.is_sh0_sh is False
+
+    def test_is_sh_order_0(self, make_fields):
+        """Test is_sh_order_0 property."""
+        n = 10
+        format_dict = create_ply_format(sh_degree=0)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict)
+
+        assert gstensor.is_sh_order_0 is True
+        assert gstensor.is_sh_order_1 is False
+        assert gstensor.is_sh_order_2 is False
+        assert gstensor.is_sh_order_3 is False
+
+    def test_is_sh_order_1(self, make_fields):
+        """Test is_sh_order_1 property."""
+        n = 10
+        format_dict = create_ply_format(sh_degree=1)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict, sh_bands=3)
+
+        assert gstensor.is_sh_order_0 is False
+        assert gstensor.is_sh_order_1 is True
+        assert gstensor.is_sh_order_2 is False
+        assert gstensor.is_sh_order_3 is False
+
+    def test_is_sh_order_2(self, make_fields):
+        """Test is_sh_order_2 property."""
+        n = 10
+        format_dict = create_ply_format(sh_degree=2)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict, sh_bands=8)
+
+        assert gstensor.is_sh_order_0 is False
+        assert gstensor.is_sh_order_1 is False
+        assert gstensor.is_sh_order_2 is True
+        assert gstensor.is_sh_order_3 is False
+
+    def test_is_sh_order_3(self, make_fields):
+        """Test is_sh_order_3 property."""
+        n = 10
+        format_dict = create_ply_format(sh_degree=3)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict, sh_bands=15)
+
+        assert gstensor.is_sh_order_0 is False
+        assert gstensor.is_sh_order_1 is False
+        assert gstensor.is_sh_order_2 is False
+        assert gstensor.is_sh_order_3 is True
+
+    def test_properties_update_after_normalize(self, rand_torch, make_fields):
+        """Test that properties update correctly after normalize()."""
+        n = 10
+        format_dict = create_rasterizer_format(sh_degree=0)
+
+        gstensor = _make_gstensor(
+            make_fields, n, format_dict, scales=rand_torch["scales"][:n] * 5.0
+        )
+
+        # Before normalize
+        assert gstensor.is_scales_linear is True
+        assert gstensor.is_opacities_linear is True
+
+        # After normalize
+        gstensor.normalize(inplace=True)
+        assert gstensor.is_scales_ply is True
+        assert gstensor.is_opacities_ply is True
+        assert gstensor.is_scales_linear is False
+        assert gstensor.is_opacities_linear is False
+
+    def test_properties_update_after_denormalize(self, make_fields):
+        """Test that properties update correctly after denormalize()."""
+        n = 10
+        format_dict = create_ply_format(sh_degree=0)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict)
+
+        # Before denormalize
+        assert gstensor.is_scales_ply is True
+        assert gstensor.is_opacities_ply is True
+
+        # After denormalize
+        gstensor.denormalize(inplace=True)
+        assert gstensor.is_scales_linear is True
+        assert gstensor.is_opacities_linear is True
+        assert gstensor.is_scales_ply is False
+        assert gstensor.is_opacities_ply is False
+
+    def test_properties_update_after_to_rgb(self, make_fields):
+        """Test that properties update correctly after to_rgb()."""
+        n = 10
+        format_dict = create_ply_format(sh_degree=0)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict)
+
+        # Before to_rgb
+        assert gstensor.is_sh0_sh is True
+        assert gstensor.is_sh0_rgb is False
+
+        # After to_rgb
+        gstensor.to_rgb(inplace=True)
+        assert gstensor.is_sh0_rgb is True
+        assert gstensor.is_sh0_sh is False
+
+    def test_properties_update_after_to_sh(self, rand_torch, make_fields):
+        """Test that properties update correctly after to_sh()."""
+        n = 10
+        format_dict = create_ply_format(sh_degree=0, sh0_format=DataFormat.SH0_RGB)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict, sh0=rand_torch["scales"][:n].clone())
+
+        # Before to_sh
+        assert gstensor.is_sh0_rgb is True
+        assert gstensor.is_sh0_sh is False
+
+        # After to_sh
+        gstensor.to_sh(inplace=True)
+        assert gstensor.is_sh0_sh is True
+        assert gstensor.is_sh0_rgb is False
+
+    def test_properties_preserved_through_device_transfer(self, make_fields):
+        """Test that properties are preserved through device transfer."""
+        n = 10
+        format_dict = create_rasterizer_format(sh_degree=1)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict, sh_bands=3)
+
+        # Transfer to CPU (stays on CPU)
+        gstensor_cpu = gstensor.cpu()
+
+        assert gstensor_cpu.is_scales_linear is True
+        assert gstensor_cpu.is_opacities_linear is True
+        assert gstensor_cpu.is_sh0_sh is True
+        assert gstensor_cpu.is_sh_order_1 is True
+
+
+class TestFormatQueryPropertiesEdgeCases:
+    """Test edge cases for format query properties."""
+
+    def test_gstensor_properties_with_auto_detected_format(self, rand_torch):
+        """Test properties work correctly with auto-detected format."""
+        n = 100
+        # Create data that looks like linear format
+        scales = rand_torch["scales"][:n] * 5.0
+        opacities = rand_torch["opacities"][:n]
+
+        gstensor = GSTensor(
+            means=rand_torch["means"][:n],
+            scales=scales,
+            quats=rand_torch["quats"][:n],
+            opacities=opacities,
+            sh0=rand_torch["sh0"][:n],
+            shN=None,
+        )
+
+        # Should auto-detect linear format
+        assert gstensor.is_scales_linear is True
+        assert gstensor.is_opacities_linear is True
+
+    def test_gstensor_properties_preserved_through_clone(self, make_fields):
+        """Test that properties are preserved through clone()."""
+        n = 10
+        format_dict = create_rasterizer_format(sh_degree=3)
+
+        gstensor = _make_gstensor(make_fields, n, format_dict, sh_bands=15)
+
+        cloned = gstensor.clone()
+
+        assert cloned.is_scales_linear is True
+        assert cloned.is_opacities_linear is True
+        assert cloned.is_sh0_sh is True
+        assert cloned.is_sh_order_3 is True
+
+    def test_gstensor_properties_preserved_through_slice(self, rand_torch, make_fields):
+        """Test that properties are preserved through slicing."""
+        n = 100
+        format_dict = create_ply_format(sh_degree=2, sh0_format=DataFormat.SH0_RGB)
+
+        gstensor = _make_gstensor(
+            make_fields, n, format_dict, sh_bands=8, sh0=rand_torch["scales"][:n]
+        )
+
+        sliced = gstensor[10:50]
+
+        assert sliced.is_scales_ply is True
+        assert sliced.is_opacities_ply is True
+        assert sliced.is_sh0_rgb is True
+        assert sliced.is_sh_order_2 is True
@@ -7,6 +7,7 @@ import numpy as np
 from gsply.formats import (
     CHUNK_SIZE,
     EXPECTED_PROPERTIES_BY_SH_DEGREE,
+    PLY_VERTEX_DTYPE_BY_SH_DEGREE,
     PROPERTY_COUNTS_BY_SH_DEGREE,
     SH_C0,
     detect_format,
@@ -29,6 +30,13 @@ class TestConstants:
         for sh_degree, prop_count in PROPERTY_COUNTS_BY_SH_DEGREE.items():
             assert len(EXPECTED_PROPERTIES_BY_SH_DEGREE[sh_degree]) == prop_count
 
+    def test_ply_vertex_dtypes(self):
+        """Test that packed vertex dtypes follow the expected property order."""
+        for sh_degree, prop_count in PROPERTY_COUNTS_BY_SH_DEGREE.items():
+            dtype = PLY_VERTEX_DTYPE_BY_SH_DEGREE[sh_degree]
+            assert list(dtype.names) == EXPECTED_PROPERTIES_BY_SH_DEGREE[sh_degree]
+            assert dtype.itemsize == 4 * prop_count
+
     def test_chunk_size(self):
         """Test chunk size constant."""
         assert CHUNK_SIZE == 256
@@ -1,5 +1,7 @@
 """Unit tests for GSTensor (PyTorch GPU-accelerated dataclass)."""
 
+import weakref
+
 import pytest
 
 # Check if PyTorch is available
@@ -71,6 +73,15 @@ def test_gstensor_creation_sh1(sample_data_sh1):
     assert gstensor.has_high_order_sh()
 
 
+def test_gstensor_weakref_supported(sample_data_sh0):
+    """Test that slotted GSTensor instances can still be weakly referenced."""
+    gstensor = GSTensor(**sample_data_sh0)
+
+    ref = weakref.ref(gstensor)
+    assert ref() is gstensor
+    assert not hasattr(gstensor, "__dict__")
+
+
 def test_gstensor_device_dtype_properties(sample_data_sh0):
     """Test device and dtype properties."""
     gstensor = GSTensor(**sample_data_sh0)
@@ -267,6 +278,7 @@ def test_gstensor_consolidate_sh1(sample_data_sh1):
         14 + 3 * 3,
     )  # SH1 layout: 23 props (K=3 bands)
     assert torch.allclose(gstensor_consolidated.means, gstensor.means)
+    assert torch.equal(gstensor_consolidated.shN, gstensor.shN)
 
 
 def test_gstensor_consolidate_idempotent(sample_data_sh0):
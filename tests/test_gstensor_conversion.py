@@ -82,6 +82,8 @@ def test_from_gsdata_with_base(gsdata_sh0_with_base):
     # Should have _base from conversion
     assert gstensor._base is not None
     assert gstensor._base.shape == (1000, 14)
+    # Same device and dtype: the base array is wrapped, not copied
+    assert np.shares_memory(gstensor._base.numpy(), gsdata_sh0_with_base._base)
 
 
 def test_from_gsdata_without_base(gsdata_sh0):
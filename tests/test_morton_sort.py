@@ -0,0 +1,128 @@
+"""Tests for GSData Morton (Z-order) spatial sorting."""
+
+import numpy as np
+import pytest
+
+import gsply
+from gsply import GSData
+
+
+@pytest.fixture
+def data():
+    """Create GSData with random positions, SH1 and a mask layer."""
+    rng = np.random.default_rng(0)
+    n = 5000
+    data = GSData(
+        means=rng.standard_normal((n, 3)).astype(np.float32),
+        scales=rng.random((n, 3), dtype=np.float32),
+        quats=rng.standard_normal((n, 4)).astype(np.float32),
+        opacities=rng.random(n, dtype=np.float32),
+        sh0=rng.random((n, 3), dtype=np.float32),
+        shN=rng.random((n, 3, 3), dtype=np.float32),
+    )
+    data.add_mask_layer("front", data.means[:, 2] > 0)
+    return data
+
+
+def _morton_codes(means):
+    """Reference Morton codes built bit by bit in Python."""
+    lo = means.min(axis=0).astype(np.float64)
+    scale = 1024 / (means.max(axis=0).astype(np.float64) - lo)
+    cells = np.clip((means - lo) * scale, 0, 1023).astype(np.int64)
+    codes = np.zeros(len(means), dtype=np.int64)
+    for bit in range(10):
+        for axis in range(3):
+            codes |= ((cells[:, axis] >> bit) & 1) << (3 * bit + 2 - axis)
+    return codes
+
+
+def test_morton_order_sorts_codes(data):
+    """morton_order is a permutation that sorts the Morton codes."""
+    order = data.morton_order()
+    assert np.array_equal(np.sort(order), np.arange(len(data)))
+    assert np.all(np.diff(_morton_codes(data.means)[order]) >= 0)
+
+
+@pytest.mark.parametrize("inplace", [True, False])
+def test_morton_sort_permutes_all_fields(data, inplace):
+    """morton_sort applies the same permutation to every field and mask."""
+    original = data.copy()
+    order = data.morton_order()
+
+    result = data.morton_sort(inplace=inplace)
+
+    assert (result is data) == inplace
+    for name in ("means", "scales", "quats", "opacities", "sh0", "shN", "masks"):
+        np.testing.assert_array_equal(getattr(result, name), getattr(original, name)[order])
+
+
+def test_morton_sort_inplace_from_base(data, tmp_path):
+    """In-place sort of plyread data reorders the shared _base record."""
+    path = tmp_path / "scene.ply"
+    gsply.plywrite(path, data)
+    loaded = gsply.plyread(path)
+    assert loaded._base is not None
+    order = loaded.morton_order()
+
+    loaded.morton_sort()
+
+    assert loaded.means.base is loaded._base or np.shares_memory(loaded.means, loaded._base)
+    np.testing.assert_array_equal(loaded.means, data.means[order])
+    np.testing.assert_array_equal(loaded.shN, data.shN[order])
+
+
+def test_morton_sort_empty():
+    """Sorting empty data is a no-op."""
+    empty = GSData(
+        means=np.zeros((0, 3), dtype=np.float32),
+        scales=np.zeros((0, 3), dtype=np.float32),
+        quats=np.zeros((0, 4), dtype=np.float32),
+        opacities=np.zeros(0, dtype=np.float32),
+        sh0=np.zeros((0, 3), dtype=np.float32),
+        shN=None,
+    )
+    assert len(empty.morton_sort()) == 0
+
+
+@pytest.mark.parametrize("consolidate", [False, True])
+def test_from_arrays_morton_order(data, consolidate):
+    """from_arrays(order="morton") returns sorted data and leaves the inputs untouched."""
+    fields = {
+        name: getattr(data, name).copy()
+        for name in ("means", "scales", "quats", "opacities", "sh0", "shN")
+    }
+    originals = {name: array.copy() for name, array in fields.items()}
+    order = data.morton_order()
+
+    result = GSData.from_arrays(**fields, format="linear", consolidate=consolidate, order="morton")
+
+    assert (result._base is not None) == consolidate
+    for name, array in originals.items():
+        np.testing.assert_array_equal(fields[name], array)
+        np.testing.assert_array_equal(getattr(result, name), array[order])
+
+
+@pytest.mark.parametrize("order", [None, "morton"])
+def test_morton_sort_mixed_precision(data, order):
+    """In-place sort handles the float16 fields of precision="mixed" data."""
+    fields = {
+        name: getattr(data, name).copy()
+        for name in ("means", "scales", "quats", "opacities", "sh0", "shN")
+    }
+    mixed = GSData.from_arrays(**fields, format="linear", precision="mixed", order=order)
+    expected = mixed.copy()
+    permutation = mixed.morton_order()
+
+    mixed.morton_sort()
+
+    assert mixed.scales.dtype == np.float16
+    for name in fields:
+        np.testing.assert_array_equal(getattr(mixed, name), getattr(expected, name)[permutation])
+
+
+def test_from_arrays_invalid_order(data):
+    """from_arrays rejects unknown orderings."""
+    with pytest.raises(ValueError, match="Invalid order"):
+        GSData.from_arrays(
+            data.means, data.scales, data.quats, data.opacities, data.sh0, order="hilbert"
+        )
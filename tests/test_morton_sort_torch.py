@@ -0,0 +1,80 @@
+"""Tests for GSTensor Morton (Z-order) spatial sorting."""
+
+import numpy as np
+import pytest
+
+from gsply import GSData
+
+# Check if PyTorch is available
+pytest.importorskip("torch")
+import torch  # noqa: E402
+
+from gsply.torch import GSTensor  # noqa: E402
+
+FIELDS = ("means", "scales", "quats", "opacities", "sh0", "shN")
+
+
+@pytest.fixture
+def data():
+    """Create GSData with random positions, SH1 and a mask layer."""
+    rng = np.random.default_rng(0)
+    n = 5000
+    data = GSData(
+        means=rng.standard_normal((n, 3)).astype(np.float32),
+        scales=rng.random((n, 3), dtype=np.float32),
+        quats=rng.standard_normal((n, 4)).astype(np.float32),
+        opacities=rng.random(n, dtype=np.float32),
+        sh0=rng.random((n, 3), dtype=np.float32),
+        shN=rng.random((n, 3, 3), dtype=np.float32),
+    )
+    data.add_mask_layer("front", data.means[:, 2] > 0)
+    return data
+
+
+def test_morton_order_matches_gsdata(data):
+    """GSTensor.morton_order yields the same permutation as the Numba path."""
+    gstensor = GSTensor.from_gsdata(data, device="cpu")
+    np.testing.assert_array_equal(gstensor.morton_order().numpy(), data.morton_order())
+
+
+@pytest.mark.parametrize("inplace", [True, False])
+def test_morton_sort_permutes_all_fields(data, inplace):
+    """morton_sort applies the same permutation to every field and mask."""
+    gstensor = GSTensor.from_gsdata(data, device="cpu")
+    assert gstensor._base is not None
+    original = gstensor.clone()
+    order = torch.from_numpy(data.morton_order())
+
+    result = gstensor.morton_sort(inplace=inplace)
+
+    assert (result is gstensor) == inplace
+    assert result._base is not None
+    for name in (*FIELDS, "masks"):
+        torch.testing.assert_close(getattr(result, name), getattr(original, name)[order])
+    if not inplace:
+        torch.testing.assert_close(gstensor.means, original.means)
+
+
+@pytest.mark.parametrize("consolidate", [False, True])
+def test_from_arrays_morton_order(data, consolidate):
+    """from_arrays(order="morton") returns sorted data and leaves the inputs untouched."""
+    tensors = {name: torch.from_numpy(getattr(data, name).copy()) for name in FIELDS}
+    originals = {name: tensor.clone() for name, tensor in tensors.items()}
+    order = torch.from_numpy(data.morton_order())
+
+    result = GSTensor.from_arrays(
+        **tensors, format="linear", device="cpu", consolidate=consolidate, order="morton"
+    )
+
+    assert (result._base is not None) == consolidate
+    for name, tensor in originals.items():
+        torch.testing.assert_close(tensors[name], tensor)
+        torch.testing.assert_close(getattr(result, name), tensor[order])
+
+
+def test_from_arrays_invalid_order(data):
+    """from_arrays rejects unknown orderings."""
+    with pytest.raises(ValueError, match="Invalid order"):
+        GSTensor.from_arrays(
+            data.means, data.scales, data.quats, data.opacities, data.sh0, order="hilbert"
+        )
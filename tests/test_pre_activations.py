@@ -83,6 +83,29 @@ class TestApplyPreActivations:
         assert np.all(result.opacities >= 0.0)
         assert np.all(result.opacities <= 1.0)
 
+    def test_activation_float64_non_contiguous(self):
+        """Test float64, Fortran-ordered inputs are converted to float32 C-contiguous."""
+        n = 50
+        rng = np.random.default_rng(0)
+        log_scales = np.asfortranarray(rng.standard_normal((n, 3)) * 0.5 - 2.0)
+        data = GSData(
+            means=rng.standard_normal((n, 3)).astype(np.float32),
+            scales=log_scales,
+            quats=np.asfortranarray(rng.standard_normal((n, 4))),
+            opacities=rng.standard_normal(n).astype(np.float32),
+            sh0=rng.standard_normal((n, 3)).astype(np.float32),
+            shN=None,
+        )
+
+        apply_pre_activations(data, inplace=True)
+
+        for arr in (data.scales, data.quats):
+            assert arr.dtype == np.float32
+            assert arr.flags["C_CONTIGUOUS"]
+        expected_scales = np.clip(np.exp(log_scales.astype(np.float32)), 1e-4, 100.0)
+        np.testing.assert_allclose(data.scales, expected_scales, rtol=1e-5)
+        np.testing.assert_allclose(np.linalg.norm(data.quats, axis=1), 1.0, rtol=1e-5)
+
     def test_activation_custom_bounds(self):
         """Test activation with custom scale bounds."""
         n = 50
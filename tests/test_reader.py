@@ -181,6 +181,51 @@ class TestPlyread:
         result = plyread(test_ply_file)
         assert result.means.shape[0] > 0
 
+    def test_plyread_mmap_matches_read(self, tmp_path, sample_gaussian_data):
+        """Test that mmap=True returns the same data, backed by the file mapping."""
+        import mmap
+
+        from gsply import GSData, plywrite
+
+        path = tmp_path / "mapped.ply"
+        plywrite(path, GSData(**sample_gaussian_data))
+
+        expected = plyread(path)
+        result = plyread(path, mmap=True)
+
+        owner = result._base
+        while isinstance(owner, np.ndarray):
+            owner = owner.base
+        assert isinstance(owner.obj if isinstance(owner, memoryview) else owner, mmap.mmap)
+        for name in ("means", "scales", "quats", "opacities", "sh0", "shN"):
+            np.testing.assert_array_equal(getattr(result, name), getattr(expected, name))
+
+    def test_plyread_mmap_writes_stay_private(self, tmp_path, sample_gaussian_data):
+        """Test that in-place edits of mapped data never reach the file."""
+        from gsply import GSData, plywrite
+
+        path = tmp_path / "mapped.ply"
+        plywrite(path, GSData(**sample_gaussian_data))
+        original = path.read_bytes()
+
+        result = plyread(path, mmap=True)
+        result.means[:] = 0.0
+        result.normalize()
+
+        assert path.read_bytes() == original
+        np.testing.assert_array_equal(plyread(path).means, sample_gaussian_data["means"])
+
+    def test_plyread_mmap_truncated_file(self, tmp_path, sample_gaussian_data):
+        """Test that a truncated payload is rejected with mmap=True."""
+        from gsply import GSData, plywrite
+
+        path = tmp_path / "truncated.ply"
+        plywrite(path, GSData(**sample_gaussian_data))
+        path.write_bytes(path.read_bytes()[:-4])
+
+        with pytest.raises(ValueError, match="Unsupported PLY format or invalid file"):
+            plyread(path, mmap=True)
+
 
 class TestDataIntegrity:
     """Test data integrity checks."""
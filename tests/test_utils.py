@@ -1,7 +1,30 @@
 import numpy as np
 import pytest
 
-from gsply.utils import logit, sigmoid
+from gsply.utils import (
+    _PARALLEL_MIN_SIZE,
+    _SMALL_ARRAY_SIZE,
+    _use_row_kernel,
+    logit,
+    logit_chunked,
+    rgb2sh,
+    sh2rgb,
+    sh2rgb_u8,
+    sigmoid,
+    sigmoid_chunked,
+    sigmoid_fast,
+)
+
+
+def _sigmoid_ref(x):
+    """NumPy float64 reference for sigmoid."""
+    return 1.0 / (1.0 + np.exp(-x.astype(np.float64)))
+
+
+def _logit_ref(p, eps=1e-6):
+    """NumPy float64 reference for logit (same clamp as logit)."""
+    p = np.clip(p.astype(np.float64), eps, 1.0 - eps)
+    return np.log(p / (1.0 - p))
 
 
 def test_cpu_logit_sigmoid():
@@ -36,6 +59,136 @@ def test_cpu_logit_sigmoid():
     assert np.isclose(s[1], 1.0)
 
 
+@pytest.mark.parametrize(
+    "func", [logit, sigmoid, sigmoid_fast, sh2rgb, rgb2sh, sh2rgb_u8], ids=lambda f: f.__name__
+)
+def test_zero_dim_array_input(func):
+    """0-d arrays take the array path and come back as 0-d arrays."""
+    x = np.array(0.25)
+    result = func(x)
+    assert isinstance(result, np.ndarray)
+    assert result.shape == ()
+    np.testing.assert_allclose(result, func(np.array([0.25]))[0])
+
+
+@pytest.mark.parametrize("n", [100, 10_000])
+def test_logit_sigmoid_out(n):
+    """out= is filled and returned for both the small-array and kernel paths."""
+    x = np.random.default_rng(0).standard_normal(n, dtype=np.float32)
+    expected = sigmoid(x)
+
+    out = np.empty_like(x)
+    assert sigmoid(x, out=out) is out
+    assert np.array_equal(out, expected)
+    assert np.array_equal(logit(out, out=out), logit(expected))
+
+    with pytest.raises(ValueError):
+        sigmoid(x, out=np.empty(n + 1, dtype=np.float32))
+
+
+@pytest.mark.parametrize(
+    "n",
+    [_SMALL_ARRAY_SIZE - 1, _SMALL_ARRAY_SIZE, _PARALLEL_MIN_SIZE - 1, _PARALLEL_MIN_SIZE],
+    ids=["ufunc", "serial-low", "serial-high", "parallel"],
+)
+@pytest.mark.parametrize(
+    ("func", "ref", "low", "high"),
+    [(sigmoid, _sigmoid_ref, -8.0, 8.0), (logit, _logit_ref, 0.0, 1.0)],
+    ids=["sigmoid", "logit"],
+)
+def test_logit_sigmoid_size_thresholds(func, ref, low, high, n):
+    """Each size band (ufunc, serial kernel, parallel kernel) matches the NumPy reference."""
+    x = np.random.default_rng(0).uniform(low, high, n).astype(np.float32)
+    expected = ref(x)
+
+    np.testing.assert_allclose(func(x), expected, rtol=1e-5, atol=1e-6)
+
+    out = np.empty_like(x)
+    assert func(x, out=out) is out
+    np.testing.assert_allclose(out, expected, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize(
+    ("func", "ref", "low", "high"),
+    [(sigmoid, _sigmoid_ref, -8.0, 8.0), (logit, _logit_ref, 0.0, 1.0)],
+    ids=["sigmoid", "logit"],
+)
+def test_logit_sigmoid_strided_rows(func, ref, low, high, dtype):
+    """Column slices of a wider array (strided rows) take the row kernel and match NumPy."""
+    records = np.random.default_rng(0).uniform(low, high, (5000, 14)).astype(dtype)
+    x = records[:, 7:10]
+    assert _use_row_kernel(x)
+    expected = ref(x)
+
+    np.testing.assert_allclose(func(x), expected, rtol=1e-5, atol=1e-6)
+
+    out = np.empty(x.shape, dtype=dtype)
+    assert func(x, out=out) is out
+    np.testing.assert_allclose(out, expected, rtol=1e-5, atol=1e-6)
+
+
+def test_sigmoid_fast_matches_sigmoid():
+    """sigmoid_fast stays within its documented error and keeps the input dtype."""
+    x = np.linspace(-50.0, 50.0, 100_001)
+    assert np.abs(sigmoid_fast(x) - sigmoid(x)).max() < 5e-5
+
+    x32 = x.astype(np.float32).reshape(-1, 1)
+    s = sigmoid_fast(x32)
+    assert s.dtype == np.float32
+    assert s.shape == x32.shape
+    assert ((s >= 0.0) & (s <= 1.0)).all()
+
+    assert np.isclose(sigmoid_fast(0.0), 0.5)
+
+
+def test_sh2rgb_u8_matches_quantized_sh2rgb():
+    """sh2rgb_u8 equals clamping and rounding the float sh2rgb output."""
+    sh = np.random.default_rng(0).standard_normal((1000, 3), dtype=np.float32) * 3
+    expected = np.round(np.clip(sh2rgb(sh), 0.0, 1.0) * 255.0).astype(np.uint8)
+
+    rgb = sh2rgb_u8(sh)
+    assert rgb.dtype == np.uint8
+    assert np.abs(rgb.astype(np.int16) - expected).max() <= 1
+
+    out = np.empty(sh.shape, dtype=np.uint8)
+    assert sh2rgb_u8(sh, out=out) is out
+    with pytest.raises(ValueError):
+        sh2rgb_u8(sh, out=np.empty(sh.shape, dtype=np.float32))
+
+
+def test_sh2rgb_clip_and_fallback_paths():
+    """Fused and ufunc sh2rgb paths agree; clip clamps to [0, 1]; rgb2sh inverts."""
+    sh = np.random.default_rng(0).standard_normal((1000, 3), dtype=np.float32) * 3
+    rgb = sh2rgb(sh)
+    np.testing.assert_allclose(sh2rgb(np.asfortranarray(sh)), rgb, rtol=1e-6, atol=1e-6)
+    np.testing.assert_allclose(rgb2sh(rgb), sh, rtol=1e-5, atol=1e-5)
+
+    clipped = sh2rgb(sh, clip=True)
+    assert np.array_equal(clipped, np.clip(rgb, 0.0, 1.0))
+    np.testing.assert_allclose(sh2rgb(np.asfortranarray(sh), clip=True), clipped, atol=1e-6)
+    assert sh2rgb(10.0, clip=True) == 1.0
+
+
+def test_chunked_matches_whole_array():
+    """Tiles from the *_chunked generators cover out and match the one-shot result."""
+    x = np.random.default_rng(0).standard_normal((10_000, 3), dtype=np.float32)
+
+    out = np.empty_like(x)
+    tiles = list(sigmoid_chunked(x, chunk_size=4096, out=out))
+    assert [t.size for t in tiles] == [4096] * 7 + [30_000 - 7 * 4096]
+    assert np.array_equal(out, sigmoid(x))
+
+    p = sigmoid(x)
+    out = np.empty_like(p)
+    for _ in logit_chunked(p, chunk_size=4096, out=out):
+        pass
+    assert np.array_equal(out, logit(p))
+
+    with pytest.raises(ValueError):
+        sigmoid_chunked(x, out=np.empty(x.shape, dtype=np.float64))
+
+
 def test_gpu_logit_sigmoid():
     """Test GPU-based logit and sigmoid functions (requires PyTorch)."""
     torch = pytest.importorskip("torch")
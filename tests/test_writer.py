@@ -260,6 +260,32 @@ class TestRoundTrip:
         np.testing.assert_allclose(result.sh0, sh0_orig, rtol=1e-6, atol=1e-6)
         np.testing.assert_allclose(result.shN, shN_orig, rtol=1e-6, atol=1e-6)
 
+    def test_ply_records_match_file_body(self, tmp_path):
+        """Test to_ply_records() views _base with PLY names and matches the written bytes."""
+        output_file = tmp_path / "records.ply"
+        rng = np.random.default_rng(0)
+        num_gaussians = 20
+        data = GSData(
+            means=rng.standard_normal((num_gaussians, 3), dtype=np.float32),
+            scales=rng.standard_normal((num_gaussians, 3), dtype=np.float32),
+            quats=rng.standard_normal((num_gaussians, 4), dtype=np.float32),
+            opacities=rng.standard_normal(num_gaussians, dtype=np.float32),
+            sh0=rng.standard_normal((num_gaussians, 3), dtype=np.float32),
+            shN=rng.standard_normal((num_gaussians, 3, 3), dtype=np.float32),
+        )
+
+        records = data.to_ply_records()  # Consolidates (data has no _base)
+        plywrite(output_file, data)
+        result = plyread(output_file)
+        read_records = result.to_ply_records()
+
+        assert np.shares_memory(read_records, result._base)
+        assert output_file.read_bytes().endswith(records.tobytes())
+        np.testing.assert_array_equal(read_records, records)
+        np.testing.assert_array_equal(records["y"], data.means[:, 1])
+        np.testing.assert_array_equal(records["f_rest_4"], data.shN[:, 1, 1])  # Channel-major
+        np.testing.assert_array_equal(records["rot_3"], data.quats[:, 3])
+
     def test_roundtrip_sh0(self, tmp_path):
         """Test round-trip for SH degree 0."""
         output_file = tmp_path / "roundtrip_sh0.ply"